@@ -42,10 +42,13 @@ RET=0
 SIMPLE_HEALTH_CLIENT=../clients/simple_grpc_v2_health_metadata.py
 SIMPLE_INFER_CLIENT=../clients/simple_grpc_v2_infer_client.py
 SIMPLE_ASYNC_INFER_CLIENT=../clients/simple_grpc_v2_async_infer_client.py
+SIMPLE_AIO_INFER_CLIENT=../clients/simple_grpc_v2_aio_infer_client.py
 SIMPLE_STRING_INFER_CLIENT=../clients/simple_grpc_v2_string_infer_client.py
 SIMPLE_STREAM_INFER_CLIENT=../clients/simple_grpc_v2_sequence_stream_infer_client.py
+SIMPLE_STREAM_POOL_CLIENT=../clients/simple_grpc_v2_sequence_stream_pool_client.py
 SIMPLE_SEQUENCE_INFER_CLIENT=../clients/simple_grpc_v2_sequence_sync_infer_client.py
 SIMPLE_CLASS_CLIENT=../clients/simple_grpc_v2_class_client.py
+SIMPLE_COALESCED_INFER_CLIENT=../clients/simple_grpc_v2_coalesced_infer_client.py
 SIMPLE_SHM_CLIENT=../clients/simple_grpc_v2_shm_client.py
 SIMPLE_CUDASHM_CLIENT=../clients/simple_grpc_v2_cudashm_client.py
 SIMPLE_MODEL_CONTROL=../clients/simple_grpc_v2_model_control.py
@@ -93,9 +96,12 @@ IMAGE=../images/vulture.jpeg
 for i in \
         $SIMPLE_INFER_CLIENT \
         $SIMPLE_ASYNC_INFER_CLIENT \
+        $SIMPLE_AIO_INFER_CLIENT \
         $SIMPLE_STRING_INFER_CLIENT \
         $SIMPLE_CLASS_CLIENT \
+        $SIMPLE_COALESCED_INFER_CLIENT \
         $SIMPLE_STREAM_INFER_CLIENT \
+        $SIMPLE_STREAM_POOL_CLIENT \
         $SIMPLE_SEQUENCE_INFER_CLIENT \
         $SIMPLE_SHM_CLIENT \
         $SIMPLE_CUDASHM_CLIENT \
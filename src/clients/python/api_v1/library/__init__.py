@@ -300,22 +300,22 @@ def serialize_string_tensor(input_tensor):
     # a 1-dimensional array containing the 4-byte string length followed by the
     # actual string characters. All strings are concatenated together in "C"
     # order.
-    if (input_tensor.dtype == np.object) or (input_tensor.dtype.type == np.bytes_):
-        flattened = bytes()
-        for obj in np.nditer(input_tensor, flags=["refs_ok"], order='C'):
+    if ((input_tensor.dtype == np.object) or (input_tensor.dtype.type == np.bytes_) or
+            (input_tensor.dtype.type == np.str_)):
+        # The chunks are joined once, growing a bytes object per string
+        # would take quadratic time.
+        chunks = []
+        for obj in input_tensor.reshape(-1):
             # If directly passing bytes to STRING type,
             # don't convert it to str as Python will encode the
             # bytes which may distort the meaning
-            if obj.dtype.type == np.bytes_:
-                if type(obj.item()) == bytes:
-                    s = obj.item()
-                else:
-                    s = bytes(obj)
+            if isinstance(obj, bytes):
+                s = obj
             else:
                 s = str(obj).encode('utf-8')
-            flattened += struct.pack("<I", len(s))
-            flattened += s
-        return np.asarray(flattened)
+            chunks.append(struct.pack("<I", len(s)))
+            chunks.append(s)
+        return np.frombuffer(b''.join(chunks), dtype=np.uint8)
     else:
         _raise_error("cannot serialize string tensor: invalid datatype")
     return None
@@ -1278,7 +1278,8 @@ class InferContext:
                                 # followed by the actual string characters.
                                 # All strings are concatenated together in "C"
                                 # order.
-                                if (input_value.dtype == np.object) or (input_value.dtype.type == np.bytes_):
+                                if ((input_value.dtype == np.object) or (input_value.dtype.type == np.bytes_) or
+                                        (input_value.dtype.type == np.str_)):
                                     input_value = serialize_string_tensor(input_value)
 
                                 if not input_value.flags['C_CONTIGUOUS']:
@@ -59,6 +59,10 @@ _cshm_shared_memory_region_destroy = _cshm.SharedMemoryRegionDestroy
 _cshm_shared_memory_region_destroy.restype = c_int
 _cshm_shared_memory_region_destroy.argtypes = [c_void_p]
 
+# The byte size of each region created by this process, keyed by the
+# value of its handle, used to bounds check the writes to the region.
+_region_byte_sizes = {}
+
 def _raise_if_error(errno):
     """
     Raise SharedMemoryException if 'err' is non-success.
@@ -99,39 +103,61 @@ def create_shared_memory_region(trtis_shm_name, shm_key, byte_size):
     shm_handle = c_void_p()
     _raise_if_error(
         c_int(_cshm_shared_memory_region_create(trtis_shm_name, shm_key, byte_size, byref(shm_handle))))
+    _region_byte_sizes[shm_handle.value] = byte_size
 
     return shm_handle
 
 def set_shared_memory_region(shm_handle, input_values):
     """Copy the contents of the numpy array into a shared memory region.
+    Contiguous arrays are copied into the region directly, other arrays
+    are made contiguous first.
 
     Parameters
     ----------
     shm_handle : c_void_p
         The handle for the shared memory region.
-    input_values : np.array
-        The list of numpy arrays to be copied into the shared memory region.
+    input_values : list
+        The list of numpy arrays to be copied into the shared memory
+        region. An element may also be an (array, offset) tuple to copy
+        the array at the specified offset, in bytes, in the region. An
+        array without offset is copied right after the previous one.
 
     Raises
     ------
     SharedMemoryException
-        If unable to mmap or set values in the shared memory region.
+        If unable to mmap or set values in the shared memory region, or
+        if an array does not fit in the region at its offset.
     """
 
     if not isinstance(input_values, (list,tuple)):
         _raise_error("input_values must be specified as a list/tuple of numpy arrays")
-    for input_value in input_values:
-        if not isinstance(input_value, np.ndarray):
-            _raise_error("each element of input_values must be a numpy array")
+    if shm_handle.value not in _region_byte_sizes:
+        _raise_error("invalid shared memory handle")
+    region_byte_size = _region_byte_sizes[shm_handle.value]
 
+    # Check every write before copying anything so that an invalid
+    # element does not leave the region partially updated.
+    writes = []
     offset_current = 0
     for input_value in input_values:
-        input_value = np.ascontiguousarray(input_value).flatten()
+        if isinstance(input_value, tuple):
+            input_value, offset_current = input_value
+        if not isinstance(input_value, np.ndarray):
+            _raise_error("each element of input_values must be a numpy array or an (array, offset) tuple")
+        byte_size = input_value.size * input_value.itemsize
+        if (offset_current < 0) or (offset_current + byte_size > region_byte_size):
+            _raise_error("unable to write " + str(byte_size) + " bytes at offset " +
+                         str(offset_current) + " of shared memory region of " +
+                         str(region_byte_size) + " bytes")
+        writes.append((input_value, offset_current))
+        offset_current += byte_size
+
+    for input_value, offset_current in writes:
+        input_value = np.ascontiguousarray(input_value)
         byte_size = input_value.size * input_value.itemsize
         _raise_if_error(
             c_int(_cshm_shared_memory_region_set(shm_handle, c_uint64(offset_current), \
                 c_uint64(byte_size), input_value.ctypes.data_as(c_void_p))))
-        offset_current += byte_size
     return
 
 def destroy_shared_memory_region(shm_handle):
@@ -150,6 +176,7 @@ def destroy_shared_memory_region(shm_handle):
 
     _raise_if_error(
         c_int(_cshm_shared_memory_region_destroy(shm_handle)))
+    _region_byte_sizes.pop(shm_handle.value, None)
     return
 
 class SharedMemoryException(Exception):
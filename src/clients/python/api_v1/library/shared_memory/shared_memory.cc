@@ -59,7 +59,8 @@ SharedMemoryRegionMap(
     int shm_fd, size_t offset, size_t byte_size, void** shm_addr)
 {
   // map shared memory to process address space
-  *shm_addr = mmap(NULL, byte_size, PROT_WRITE, MAP_SHARED, shm_fd, offset);
+  *shm_addr =
+      mmap(NULL, byte_size, PROT_READ | PROT_WRITE, MAP_SHARED, shm_fd, offset);
   if (*shm_addr == MAP_FAILED) {
     return -1;
   }
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import argparse
+import numpy as np
+import sys
+import threading
+
+import tritongrpcclient.core as grpcclient
+
+
+def get_success_count(triton_client, model_name):
+    statistics = triton_client.get_inference_statistics(model_name=model_name)
+    return sum([
+        version_statistics.success.count
+        for version_statistics in statistics.inference.values()
+    ])
+
+
+def run_coalesced_requests(triton_client, label, verbose):
+    model_name = 'simple'
+    request_count = 4
+
+    # Hold each request long enough for the requests sent from the other
+    # threads to join it, so that all of them go out as one batch.
+    coalescer = grpcclient.RequestCoalescer(triton_client,
+                                            max_batch_size=request_count,
+                                            max_delay_ms=1000.0)
+
+    success_count = get_success_count(triton_client, model_name)
+
+    # Every thread sends a single sample with its own data so that a
+    # wrong split of the batched outputs is detected.
+    input0_data = [
+        np.arange(start=16 * i, stop=16 * (i + 1),
+                  dtype=np.int32).reshape(1, 16) for i in range(request_count)
+    ]
+    input1_data = [
+        np.full(shape=(1, 16), fill_value=i + 1, dtype=np.int32)
+        for i in range(request_count)
+    ]
+    results = [None] * request_count
+    errors = [None] * request_count
+
+    def send_request(idx):
+        try:
+            inputs = []
+            inputs.append(grpcclient.InferInput('INPUT0', [1, 16], "INT32"))
+            inputs.append(grpcclient.InferInput('INPUT1', [1, 16], "INT32"))
+            inputs[0].set_data_from_numpy(input0_data[idx])
+            inputs[1].set_data_from_numpy(input1_data[idx])
+            outputs = []
+            outputs.append(grpcclient.InferOutput('OUTPUT0'))
+            outputs.append(grpcclient.InferOutput('OUTPUT1'))
+            results[idx] = coalescer.infer(model_name=model_name,
+                                           inputs=inputs,
+                                           outputs=outputs)
+        except Exception as e:
+            errors[idx] = e
+
+    threads = [
+        threading.Thread(target=send_request, args=(idx,))
+        for idx in range(request_count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for idx in range(request_count):
+        if errors[idx] is not None:
+            print(label + " coalesced infer error: " + str(errors[idx]))
+            sys.exit(1)
+        output0_data = results[idx].as_numpy('OUTPUT0')
+        output1_data = results[idx].as_numpy('OUTPUT1')
+        if output0_data.shape != (1, 16) or output1_data.shape != (1, 16):
+            print(label + " coalesced infer error: incorrect output shape")
+            sys.exit(1)
+        if not np.array_equal(input0_data[idx] + input1_data[idx],
+                              output0_data):
+            print(label + " coalesced infer error: incorrect sum")
+            sys.exit(1)
+        if not np.array_equal(input0_data[idx] - input1_data[idx],
+                              output1_data):
+            print(label + " coalesced infer error: incorrect difference")
+            sys.exit(1)
+
+    # The requests must have reached the server in fewer inferences than
+    # were sent.
+    request_delta = get_success_count(triton_client, model_name) - success_count
+    if verbose:
+        print("{}: {} requests sent as {} inferences".format(
+            label, request_count, request_delta))
+    if request_delta >= request_count:
+        print(label + " coalesced infer error: requests were not coalesced")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-v',
+                        '--verbose',
+                        action="store_true",
+                        required=False,
+                        default=False,
+                        help='Enable verbose output')
+    parser.add_argument('-u',
+                        '--url',
+                        type=str,
+                        required=False,
+                        default='localhost:8001',
+                        help='Inference server URL. Default is localhost:8001.')
+
+    FLAGS = parser.parse_args()
+    try:
+        triton_client = grpcclient.InferenceServerClient(FLAGS.url)
+        wire_triton_client = grpcclient.InferenceServerClient(
+            FLAGS.url, wire_serialization=True)
+    except Exception as e:
+        print("channel creation failed: " + str(e))
+        sys.exit()
+
+    run_coalesced_requests(triton_client, "protobuf", FLAGS.verbose)
+    # The outputs of the batched response are received as views of the
+    # response buffer with the wire serialization.
+    run_coalesced_requests(wire_triton_client, "wire", FLAGS.verbose)
+
+    print('PASS: coalesced infer')
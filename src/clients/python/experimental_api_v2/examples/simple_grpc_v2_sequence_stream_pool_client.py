@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import argparse
+import numpy as np
+import sys
+import threading
+
+import tritongrpcclient.core as grpcclient
+from tritongrpcclient.utils import InferenceServerException
+
+FLAGS = None
+
+
+def send_sequence(pool, barrier, values, sequence_id, model_name, results,
+                  errors):
+    # Wait for the other threads so that the first requests of all the
+    # sequences race to open the streams of the pool.
+    barrier.wait()
+    try:
+        futures = []
+        for count, value in enumerate(values):
+            inputs = [grpcclient.InferInput('INPUT')]
+            inputs[0].set_data_from_numpy(
+                np.full(shape=[1, 1], fill_value=value, dtype=np.int32))
+            outputs = [grpcclient.InferOutput('OUTPUT')]
+            futures.append(
+                pool.infer(model_name=model_name,
+                           inputs=inputs,
+                           sequence_id=sequence_id,
+                           outputs=outputs,
+                           request_id='{}_{}'.format(sequence_id, count),
+                           sequence_start=(count == 0),
+                           sequence_end=(count == len(values) - 1)))
+        results[sequence_id] = [
+            future.result(timeout=FLAGS.timeout).as_numpy('OUTPUT')[0][0]
+            for future in futures
+        ]
+    except Exception as error:
+        errors.append(error)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-v',
+                        '--verbose',
+                        action="store_true",
+                        required=False,
+                        default=False,
+                        help='Enable verbose output')
+    parser.add_argument(
+        '-u',
+        '--url',
+        type=str,
+        required=False,
+        default='localhost:8001',
+        help='Inference server URL and it gRPC port. Default is localhost:8001.'
+    )
+    parser.add_argument('-t',
+                        '--thread-count',
+                        type=int,
+                        required=False,
+                        default=8,
+                        help='Number of concurrent sequences. Default is 8.')
+    parser.add_argument('--timeout',
+                        type=float,
+                        required=False,
+                        default=30.0,
+                        help='Seconds to wait for each response. Default is '
+                        '30.')
+
+    FLAGS = parser.parse_args()
+
+    try:
+        triton_client = grpcclient.InferenceServerClient(FLAGS.url)
+    except Exception as e:
+        print("context creation failed: " + str(e))
+        sys.exit(1)
+
+    # We use the custom "sequence" model which takes 1 input value. The
+    # output is the accumulated value of the inputs. See src/custom/sequence.
+    model_name = "simple_sequence"
+    values = [11, 7, 5, 3, 2, 0, 1]
+
+    results = {}
+    errors = []
+    barrier = threading.Barrier(FLAGS.thread_count)
+
+    # Use fewer streams than sequences so that several threads share a
+    # stream and open it concurrently.
+    with grpcclient.SequenceStreamPool(triton_client,
+                                       stream_count=2) as pool:
+        threads = []
+        for index in range(FLAGS.thread_count):
+            sequence_id = 2000 + index
+            threads.append(
+                threading.Thread(target=send_sequence,
+                                 args=(pool, barrier, [index] + values,
+                                       sequence_id, model_name, results,
+                                       errors)))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if FLAGS.verbose:
+            print(pool.get_statistics())
+
+    if errors:
+        for error in errors:
+            print(error)
+        sys.exit(1)
+
+    if len(results) != FLAGS.thread_count:
+        print("expected {} sequences, got {}".format(FLAGS.thread_count,
+                                                     len(results)))
+        sys.exit(1)
+
+    for index in range(FLAGS.thread_count):
+        expected = np.cumsum([index] + values)
+        received = results[2000 + index]
+        if FLAGS.verbose:
+            print("sequence {}: {}".format(2000 + index, received))
+        if list(expected) != list(received):
+            print("sequence {}: expected {}, got {}".format(
+                2000 + index, list(expected), received))
+            sys.exit(1)
+
+    print('PASS: sequence stream pool')
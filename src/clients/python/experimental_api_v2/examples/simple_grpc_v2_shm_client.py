@@ -124,24 +124,22 @@ if __name__ == '__main__':
 
     outputs = []
     outputs.append(grpcclient.InferOutput('OUTPUT0'))
-    # outputs[-1].set_parameter("shared_memory_region", "output0_data")
-    # outputs[-1].set_parameter("shared_memory_byte_size", output_byte_size)
+    outputs[-1].set_parameter("shared_memory_region", "output0_data")
+    outputs[-1].set_parameter("shared_memory_byte_size", output_byte_size)
 
     outputs.append(grpcclient.InferOutput('OUTPUT1'))
-    # outputs[-1].set_parameter("shared_memory_region", "output1_data")
-    # outputs[-1].set_parameter("shared_memory_byte_size", output_byte_size)
+    outputs[-1].set_parameter("shared_memory_region", "output1_data")
+    outputs[-1].set_parameter("shared_memory_byte_size", output_byte_size)
 
     results = triton_client.infer(model_name=model_name,
                                   inputs=inputs,
                                   outputs=outputs)
 
-    # TODO : Currently, this example doesn't use shared memory for output.
-    # This is done to effectively validate the results.
-    # tritongrpcclient.shared_memory module will be enhanced to read
-    # data from a specified shared memory handle, data_type and shape;
-    # and later return the numpy array.
-    output0_data = results.as_numpy('OUTPUT0')
-    output1_data = results.as_numpy('OUTPUT1')
+    # Read the results as views over the output shared memory regions
+    output0_data = shm.get_contents_as_numpy(shm_op0_handle, np.int32,
+                                             [1, 16])
+    output1_data = shm.get_contents_as_numpy(shm_op1_handle, np.int32,
+                                             [1, 16])
 
     for i in range(16):
         print(str(input0_data[i]) + " + " + str(input1_data[i]) + " = " +
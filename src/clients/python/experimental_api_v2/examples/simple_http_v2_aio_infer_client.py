@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+
+import argparse
+import asyncio
+import numpy as np
+import sys
+
+import tritonhttpclient.aio as aiohttpclient
+from tritonhttpclient.utils import InferenceServerException
+
+
+async def run_infer(triton_client, model_name, input0_data, input1_data):
+    inputs = []
+    outputs = []
+    inputs.append(aiohttpclient.InferInput('INPUT0'))
+    inputs.append(aiohttpclient.InferInput('INPUT1'))
+
+    # Initialize the data
+    inputs[0].set_data_from_numpy(input0_data, binary_data=True)
+    inputs[1].set_data_from_numpy(input1_data, binary_data=True)
+
+    outputs.append(aiohttpclient.InferOutput('OUTPUT0', binary_data=True))
+    outputs.append(aiohttpclient.InferOutput('OUTPUT1', binary_data=True))
+
+    return await triton_client.infer(model_name=model_name,
+                                     inputs=inputs,
+                                     outputs=outputs)
+
+
+async def main(FLAGS):
+    async with aiohttpclient.InferenceServerClient(
+            FLAGS.url, verbose=FLAGS.verbose) as triton_client:
+        if not await triton_client.is_model_ready('simple'):
+            print("model 'simple' is not ready")
+            sys.exit(1)
+
+        # Create the data for the two input tensors. Initialize the first
+        # to unique integers and the second to all ones.
+        input0_data = np.arange(start=0, stop=16, dtype=np.int32)
+        input0_data = np.expand_dims(input0_data, axis=0)
+        input1_data = np.ones(shape=(1, 16), dtype=np.int32)
+
+        # Issue several requests concurrently on the same event loop
+        request_count = 8
+        results = await asyncio.gather(*[
+            run_infer(triton_client, 'simple', input0_data, input1_data)
+            for _ in range(request_count)
+        ])
+
+        for result in results:
+            output0_data = result.as_numpy('OUTPUT0')
+            output1_data = result.as_numpy('OUTPUT1')
+            if not np.array_equal(output0_data, input0_data + input1_data):
+                print("aio infer error: incorrect sum")
+                sys.exit(1)
+            if not np.array_equal(output1_data, input0_data - input1_data):
+                print("aio infer error: incorrect difference")
+                sys.exit(1)
+
+        # Infer with incorrect model name
+        try:
+            await run_infer(triton_client, 'wrong model name', input0_data,
+                            input1_data)
+            print("expected error for wrong model name")
+            sys.exit(1)
+        except InferenceServerException as e:
+            print(e)
+
+    print('PASS: aio infer')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-v',
+                        '--verbose',
+                        action="store_true",
+                        required=False,
+                        default=False,
+                        help='Enable verbose output')
+    parser.add_argument('-u',
+                        '--url',
+                        type=str,
+                        required=False,
+                        default='localhost:8000',
+                        help='Inference server URL. Default is localhost:8000.')
+
+    FLAGS = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(main(FLAGS))
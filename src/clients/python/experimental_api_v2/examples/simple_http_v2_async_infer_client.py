@@ -127,3 +127,23 @@ if __name__ == '__main__':
             if (input0_data[0][i] - input1_data[0][i]) != output1_data[0][i]:
                 print("async infer error: incorrect difference")
                 sys.exit(1)
+
+    # Issue several requests and collect their results using the
+    # returned InferAsyncRequest handles instead of a callback
+    async_requests = []
+    for i in range(4):
+        async_requests.append(
+            triton_client.async_infer(model_name=model_name,
+                                      inputs=inputs,
+                                      outputs=outputs))
+
+    for async_request in httpclient.as_completed(async_requests):
+        result = async_request.get_result()
+        output0_data = result.as_numpy('OUTPUT0')
+        output1_data = result.as_numpy('OUTPUT1')
+        if not np.array_equal(output0_data, input0_data + input1_data):
+            print("async infer error: incorrect sum")
+            sys.exit(1)
+        if not np.array_equal(output1_data, input0_data - input1_data):
+            print("async infer error: incorrect difference")
+            sys.exit(1)
@@ -55,13 +55,14 @@ function main() {
   cp grpcclient.py \
     "${WHLDIR}/tritongrpcclient/core.py"
 
+  cp grpcclient_aio.py \
+    "${WHLDIR}/tritongrpcclient/aio.py"
+
   cp utils.py \
     "${WHLDIR}/tritongrpcclient/."
 
   if [ "$(expr substr $(uname -s) 1 5)" == "Linux" ]; then
     mkdir -p ${WHLDIR}/tritongrpcclient/shared_memory
-    cp libcshmv2.so \
-      "${WHLDIR}/tritongrpcclient/shared_memory/."
     cp shared_memory/__init__.py \
       "${WHLDIR}/tritongrpcclient/shared_memory/."
 
@@ -53,8 +53,8 @@ try:
 except ImportError:
     bdist_wheel = None
 
+platform_package_data = []
 if not os.name == 'nt':
-    platform_package_data = [ 'libcshmv2.so' ]
     if bool(os.environ.get('CUDA_VERSION', 0)):
         platform_package_data += ['libccudashmv2.so']
 
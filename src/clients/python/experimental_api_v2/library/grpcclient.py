@@ -25,17 +25,28 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import base64
+import bisect
+from concurrent import futures
+import functools
+import hashlib
+import logging
 import numpy as np
 import grpc
 import rapidjson as json
 import threading
+import time
 import queue
+import struct
 from google.protobuf.json_format import MessageToJson
 
 from tritongrpcclient import grpc_service_v2_pb2
 from tritongrpcclient import grpc_service_v2_pb2_grpc
 from tritongrpcclient.utils import *
+from tritongrpcclient.utils import _ModelInfoCache
+from tritongrpcclient.utils import _RetryStatistics, _call_with_retries
+from tritongrpcclient.utils import _get_byte_tensor_elements, _pack_length_prefixed
 
+_logger = logging.getLogger(__name__)
 
 def get_error_grpc(rpc_error):
     return InferenceServerException(
@@ -63,8 +74,9 @@ def _get_inference_request(model_name,
         request.id = request_id
     for infer_input in inputs:
         request.inputs.extend([infer_input._get_tensor()])
-    for infer_output in outputs:
-        request.outputs.extend([infer_output._get_tensor()])
+    if outputs is not None:
+        for infer_output in outputs:
+            request.outputs.extend([infer_output._get_tensor()])
     if sequence_id:
         param = request.parameters['sequence_id']
         param.int64_param = sequence_id
@@ -78,6 +90,80 @@ def _get_inference_request(model_name,
     return request
 
 
+def _get_channel_options(keepalive_options, max_send_message_length,
+                         max_receive_message_length, stream_window_size,
+                         write_buffer_size, channel_args):
+    """Returns the list of gRPC channel arguments for the specified
+    client options.
+    """
+    options = [
+        ('grpc.max_send_message_length', max_send_message_length
+         if max_send_message_length is not None else -1),
+        ('grpc.max_receive_message_length', max_receive_message_length
+         if max_receive_message_length is not None else -1)
+    ]
+    if keepalive_options is not None:
+        options.extend(keepalive_options._get_channel_options())
+    if stream_window_size is not None:
+        options.append(('grpc.http2.lookahead_bytes', stream_window_size))
+        # A fixed window is only honored if it isn't resized by BDP probing
+        options.append(('grpc.http2.bdp_probe', 0))
+    if write_buffer_size is not None:
+        options.append(('grpc.http2.write_buffer_size', write_buffer_size))
+    if channel_args is not None:
+        options.extend(channel_args)
+
+    return options
+
+
+class KeepAliveOptions:
+    """An object of KeepAliveOptions class holds the HTTP/2 keepalive
+    settings of the gRPC channels of an InferenceServerClient. See
+    https://grpc.github.io/grpc/core/group__grpc__arg__keys.html for
+    the meaning of each setting.
+
+    Parameters
+    ----------
+    keepalive_time_ms : int
+        The period, in milliseconds, after which a keepalive ping is
+        sent on the transport. Default value is 2**31 - 1 which means
+        pings are effectively disabled.
+    keepalive_timeout_ms : int
+        The time, in milliseconds, the sender of the keepalive ping
+        waits for an acknowledgement before closing the connection.
+        Default value is 20000.
+    keepalive_permit_without_calls : bool
+        If True keepalive pings are sent even if there are no calls in
+        flight. Default value is False.
+    http2_max_pings_without_data : int
+        The maximum number of pings that can be sent when there is no
+        data or header frame to be sent. Default value is 2, 0 means
+        no limit.
+    """
+
+    def __init__(self,
+                 keepalive_time_ms=2**31 - 1,
+                 keepalive_timeout_ms=20000,
+                 keepalive_permit_without_calls=False,
+                 http2_max_pings_without_data=2):
+        self.keepalive_time_ms = keepalive_time_ms
+        self.keepalive_timeout_ms = keepalive_timeout_ms
+        self.keepalive_permit_without_calls = keepalive_permit_without_calls
+        self.http2_max_pings_without_data = http2_max_pings_without_data
+
+    def _get_channel_options(self):
+        """Returns the keepalive settings as gRPC channel arguments.
+        """
+        return [
+            ('grpc.keepalive_time_ms', self.keepalive_time_ms),
+            ('grpc.keepalive_timeout_ms', self.keepalive_timeout_ms),
+            ('grpc.keepalive_permit_without_calls',
+             int(self.keepalive_permit_without_calls)),
+            ('grpc.http2.max_pings_without_data',
+             self.http2_max_pings_without_data)
+        ]
+
+
 class InferenceServerClient:
     """An InferenceServerClient object is used to perform any kind of
     communication with the InferenceServer using gRPC protocol.
@@ -89,21 +175,108 @@ class InferenceServerClient:
 
     verbose : bool
         If True generate verbose output. Default value is False.
-    
+    model_cache_ttl : float
+        The time, in seconds, the model metadata and configuration
+        returned by the server are cached by the client. The cache is
+        invalidated when a model is loaded or unloaded through this
+        client. Default value is None which means no caching.
+    keepalive_options : KeepAliveOptions
+        The keepalive settings of the channels. Default value is None
+        which means the gRPC defaults are used.
+    max_send_message_length : int
+        The maximum size, in bytes, of a message sent to the server.
+        Default value is None which means no limit.
+    max_receive_message_length : int
+        The maximum size, in bytes, of a message received from the
+        server. Default value is None which means no limit, unlike the
+        4 MB gRPC default.
+    stream_window_size : int
+        The fixed HTTP/2 flow control window, in bytes, of each call.
+        Default value is None which means the window is sized
+        dynamically by gRPC.
+    write_buffer_size : int
+        The size, in bytes, of the write buffer of the transport.
+        Default value is None which means the gRPC default is used.
+    channel_args : list
+        Additional gRPC channel arguments given as a list of
+        (key, value) tuples. Default value is None.
+    channel_count : int
+        The number of channels, each with its own HTTP/2 connection,
+        opened to the server. The RPCs of the client are dispatched
+        across the channels according to 'channel_policy'. Default
+        value is 1.
+    channel_policy : str
+        The policy used to select the channel of each RPC when
+        'channel_count' is greater than 1, either 'round_robin' or
+        'least_loaded' which picks the channel with the fewest calls
+        in flight. Default value is 'round_robin'.
+    wire_serialization : bool
+        If True infer() and async_infer() serialize the request
+        directly to the gRPC wire format, writing the data of the
+        inputs set with 'zero_copy' straight from their numpy arrays,
+        and expose the raw contents of the outputs as views of the
+        received message instead of copies. Default value is False.
+    retry_policy : RetryPolicy
+        The policy used by infer() to retry requests that fail because
+        the server could not be reached. Default value is None which
+        means requests are not retried.
+    hedge_delay : float
+        The time, in seconds, infer() waits for the response before
+        sending the same request again on another channel and returning
+        whichever response arrives first. The other call is cancelled.
+        Hedging requires 'channel_count' to be greater than 1. Default
+        value is None which means requests are not hedged.
+
     Raises
     ------
     Exception
         If unable to create a client.
+    InferenceServerException
+        If 'hedge_delay' is specified with a single channel.
 
     """
 
-    def __init__(self, url, verbose=False):
-        # FixMe: Are any of the channel options worth exposing?
-        # https://grpc.io/grpc/core/group__grpc__arg__keys.html
-        self._channel = grpc.insecure_channel(url, options=None)
-        self._client_stub = grpc_service_v2_pb2_grpc.GRPCInferenceServiceStub(
-            self._channel)
+    def __init__(self,
+                 url,
+                 verbose=False,
+                 model_cache_ttl=None,
+                 keepalive_options=None,
+                 max_send_message_length=None,
+                 max_receive_message_length=None,
+                 stream_window_size=None,
+                 write_buffer_size=None,
+                 channel_args=None,
+                 channel_count=1,
+                 channel_policy='round_robin',
+                 wire_serialization=False,
+                 retry_policy=None,
+                 hedge_delay=None):
+        channel_options = _get_channel_options(
+            keepalive_options=keepalive_options,
+            max_send_message_length=max_send_message_length,
+            max_receive_message_length=max_receive_message_length,
+            stream_window_size=stream_window_size,
+            write_buffer_size=write_buffer_size,
+            channel_args=channel_args)
+        self._channel_pool = _ChannelPool(url, channel_options, channel_count,
+                                          channel_policy)
+        if (hedge_delay is not None) and (channel_count < 2):
+            raise_error("hedge_delay requires channel_count to be at least 2")
+        if channel_count > 1:
+            self._client_stub = _PooledStub(self._channel_pool)
+        else:
+            self._client_stub = self._channel_pool.get_stub(0)
+        if not wire_serialization:
+            self._wire_infer = None
+        elif channel_count > 1:
+            self._wire_infer = getattr(self._client_stub, _WIRE_INFER_RPC)
+        else:
+            self._wire_infer = self._channel_pool.get_rpc(0, _WIRE_INFER_RPC)
         self._verbose = verbose
+        self._model_cache = _ModelInfoCache(model_cache_ttl)
+        self._retry_policy = retry_policy
+        self._hedge_delay = hedge_delay
+        self._retry_stats = _RetryStatistics()
 
     def __enter__(self):
         return self
@@ -119,7 +292,32 @@ class InferenceServerClient:
         will result in an Error.
 
         """
-        self._channel.close()
+        self._channel_pool.close()
+
+    def get_channel_load(self):
+        """Get the number of RPCs in flight on each channel of the
+        client. Streams count as in flight until they are closed.
+
+        Returns
+        -------
+        list
+            The number of RPCs in flight for each channel.
+
+        """
+        return self._channel_pool.get_in_flight()
+
+    def get_retry_statistics(self):
+        """Get the number of retries, hedges and missed deadlines of
+        the requests sent by infer().
+
+        Returns
+        -------
+        dict
+            The dict holding 'retry_count', 'hedges_fired', the number
+            of hedged requests sent, 'hedges_won', the number of hedged
+            requests that answered first, and 'deadline_exceeded_count'.
+        """
+        return self._retry_stats.get()
 
     def is_server_live(self, headers=None):
         """Contact the inference server and get liveness.
@@ -297,21 +495,26 @@ class InferenceServerClient:
             If unable to get model metadata.
 
         """
-        if headers is not None:
-            metadata = headers.items()
-        else:
-            metadata = ()
-        try:
-            request = grpc_service_v2_pb2.ModelMetadataRequest(
-                name=model_name, version=model_version)
-            response = self._client_stub.ModelMetadata(request=request,
-                                                       metadata=metadata)
-            if as_json:
-                return json.loads(MessageToJson(response))
+        response = self._model_cache.get('metadata', model_name,
+                                         model_version)
+        if response is None:
+            if headers is not None:
+                metadata = headers.items()
             else:
-                return response
-        except grpc.RpcError as rpc_error:
-            raise_error_grpc(rpc_error)
+                metadata = ()
+            try:
+                request = grpc_service_v2_pb2.ModelMetadataRequest(
+                    name=model_name, version=model_version)
+                response = self._client_stub.ModelMetadata(request=request,
+                                                           metadata=metadata)
+            except grpc.RpcError as rpc_error:
+                raise_error_grpc(rpc_error)
+            self._model_cache.put('metadata', model_name, model_version,
+                                  response)
+        if as_json:
+            return json.loads(MessageToJson(response))
+        else:
+            return response
 
     def get_model_config(self,
                          model_name,
@@ -347,21 +550,108 @@ class InferenceServerClient:
             If unable to get model configuration.
 
         """
-        if headers is not None:
-            metadata = headers.items()
-        else:
-            metadata = ()
-        try:
-            request = grpc_service_v2_pb2.ModelConfigRequest(
-                name=model_name, version=model_version)
-            response = self._client_stub.ModelConfig(request=request,
-                                                     metadata=metadata)
-            if as_json:
-                return json.loads(MessageToJson(response))
+        response = self._model_cache.get('config', model_name, model_version)
+        if response is None:
+            if headers is not None:
+                metadata = headers.items()
             else:
-                return response
-        except grpc.RpcError as rpc_error:
-            raise_error_grpc(rpc_error)
+                metadata = ()
+            try:
+                request = grpc_service_v2_pb2.ModelConfigRequest(
+                    name=model_name, version=model_version)
+                response = self._client_stub.ModelConfig(request=request,
+                                                         metadata=metadata)
+            except grpc.RpcError as rpc_error:
+                raise_error_grpc(rpc_error)
+            self._model_cache.put('config', model_name, model_version,
+                                  response)
+        if as_json:
+            return json.loads(MessageToJson(response))
+        else:
+            return response
+
+    def invalidate_model_cache(self, model_name=None):
+        """Drop the cached metadata and configuration of the specified
+        model.
+
+        Parameters
+        ----------
+        model_name : str
+            The name of the model whose cached information, for all
+            versions, is to be dropped. The default value is None which
+            means the information of all the models is dropped.
+
+        """
+        self._model_cache.invalidate(model_name)
+
+    def get_infer_inputs(self, model_name, model_version="", headers=None):
+        """Create InferInput objects for all the inputs of the specified
+        model, with the name, shape and datatype reported in the model
+        metadata. Dimensions of variable size are reported as -1 and
+        are set along with the data by InferInput.set_data_from_numpy.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model
+        model_version: str
+            The version of the model. The default value is an empty
+            string which means then the server will choose a version
+            based on the model and internal policy.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request if the metadata is
+            not cached.
+
+        Returns
+        -------
+        list
+            The InferInput objects in the order of the model metadata.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get model metadata.
+
+        """
+        model_metadata = self.get_model_metadata(model_name, model_version,
+                                                 headers)
+        return [
+            InferInput(tensor.name, list(tensor.shape), tensor.datatype)
+            for tensor in model_metadata.inputs
+        ]
+
+    def get_infer_outputs(self, model_name, model_version="", headers=None):
+        """Create InferOutput objects for all the outputs of the specified
+        model as reported in the model metadata.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model
+        model_version: str
+            The version of the model. The default value is an empty
+            string which means then the server will choose a version
+            based on the model and internal policy.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request if the metadata is
+            not cached.
+
+        Returns
+        -------
+        list
+            The InferOutput objects in the order of the model metadata.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get model metadata.
+
+        """
+        model_metadata = self.get_model_metadata(model_name, model_version,
+                                                 headers)
+        return [InferOutput(tensor.name) for tensor in model_metadata.outputs]
 
     def get_model_repository_index(self, headers=None, as_json=False):
         """Get the index of model repository contents
@@ -426,6 +716,7 @@ class InferenceServerClient:
                                                   metadata=metadata)
         except grpc.RpcError as rpc_error:
             raise_error_grpc(rpc_error)
+        self._model_cache.invalidate(model_name)
 
     def unload_model(self, model_name, headers=None):
         """Request the inference server to unload specified model.
@@ -455,6 +746,7 @@ class InferenceServerClient:
                                                     metadata=metadata)
         except grpc.RpcError as rpc_error:
             raise_error_grpc(rpc_error)
+        self._model_cache.invalidate(model_name)
 
     def get_inference_statistics(self,
                                  model_name,
@@ -760,7 +1052,8 @@ class InferenceServerClient:
               sequence_id=0,
               sequence_start=False,
               sequence_end=False,
-              headers=None):
+              headers=None,
+              client_timeout=None):
         """Run synchronous inference using the supplied 'inputs' requesting
         the outputs specified by 'outputs'.
 
@@ -798,6 +1091,10 @@ class InferenceServerClient:
         headers: dict
             Optional dictionary specifying additional HTTP headers to include
             in the request.
+        client_timeout: float
+            The maximum time, in seconds, to wait for the result, including
+            the retries and hedged requests. Default value is None which
+            means wait forever.
 
         Returns
         -------
@@ -808,7 +1105,8 @@ class InferenceServerClient:
         Raises
         ------
         InferenceServerException
-            If server fails to perform inference.
+            If server fails to perform inference or if the result is not
+            received within 'client_timeout'.
         """
 
         if headers is not None:
@@ -816,22 +1114,16 @@ class InferenceServerClient:
         else:
             metadata = ()
 
-        request = _get_inference_request(model_name=model_name,
-                                         inputs=inputs,
-                                         model_version=model_version,
-                                         request_id=request_id,
-                                         outputs=outputs,
-                                         sequence_id=sequence_id,
-                                         sequence_start=sequence_start,
-                                         sequence_end=sequence_end)
+        request = self._get_infer_request(model_name=model_name,
+                                          inputs=inputs,
+                                          model_version=model_version,
+                                          request_id=request_id,
+                                          outputs=outputs,
+                                          sequence_id=sequence_id,
+                                          sequence_start=sequence_start,
+                                          sequence_end=sequence_end)
 
-        try:
-            response = self._client_stub.ModelInfer(request=request,
-                                                    metadata=metadata)
-            result = InferResult(response)
-            return result
-        except grpc.RpcError as rpc_error:
-            raise_error_grpc(rpc_error)
+        return self._infer_request(request, metadata, client_timeout)
 
     def async_infer(self,
                     model_name,
@@ -843,7 +1135,8 @@ class InferenceServerClient:
                     sequence_id=0,
                     sequence_start=False,
                     sequence_end=False,
-                    headers=None):
+                    headers=None,
+                    client_timeout=None):
         """Run asynchronous inference using the supplied 'inputs' requesting
         the outputs specified by 'outputs'.
 
@@ -888,6 +1181,11 @@ class InferenceServerClient:
         headers: dict
             Optional dictionary specifying additional HTTP
             headers to include in the request.
+        client_timeout: float
+            The maximum time, in seconds, the request may take. The
+            callback receives a DEADLINE_EXCEEDED error once it elapses.
+            Requests issued by async_infer() are neither retried nor
+            hedged. Default value is None which means no limit.
     
         Raises
         ------
@@ -895,57 +1193,41 @@ class InferenceServerClient:
             If server fails to issue inference.
         """
 
-        def wrapped_callback(call_future):
-            error = result = None
-            try:
-                result = InferResult(call_future.result())
-            except grpc.RpcError as rpc_error:
-                error = get_error_grpc(rpc_error)
-            callback(result=result, error=error)
-
         if headers is not None:
             metadata = headers.items()
         else:
             metadata = ()
 
-        request = _get_inference_request(model_name=model_name,
-                                         inputs=inputs,
-                                         model_version=model_version,
-                                         request_id=request_id,
-                                         outputs=outputs,
-                                         sequence_id=sequence_id,
-                                         sequence_start=sequence_start,
-                                         sequence_end=sequence_end)
-
-        try:
-            self._call_future = self._client_stub.ModelInfer.future(
-                request=request, metadata=metadata)
-            self._call_future.add_done_callback(wrapped_callback)
-        except grpc.RpcError as rpc_error:
-            raise_error_grpc(rpc_error)
-
-    def async_stream_infer(self,
-                           model_name,
-                           inputs,
-                           stream,
-                           model_version="",
-                           outputs=None,
-                           request_id=None,
-                           sequence_id=0,
-                           sequence_start=False,
-                           sequence_end=False):
-        """Runs an asynchronous inference over gRPC bi-directional streaming
-        API.
+        request = self._get_infer_request(model_name=model_name,
+                                          inputs=inputs,
+                                          model_version=model_version,
+                                          request_id=request_id,
+                                          outputs=outputs,
+                                          sequence_id=sequence_id,
+                                          sequence_start=sequence_start,
+                                          sequence_end=sequence_end)
+
+        self._async_infer_request(request, callback, metadata,
+                                  client_timeout)
+
+    def prepare_infer_request(self,
+                              model_name,
+                              inputs,
+                              model_version="",
+                              outputs=None):
+        """Build the inference request for the specified model, inputs
+        and outputs once so that it can be sent many times with
+        infer_prepared() or async_infer_prepared(), only swapping the
+        input data between calls.
 
         Parameters
         ----------
         model_name: str
             The name of the model to run inference.
         inputs : list
-            A list of InferInput objects, each describing data for a input
-            tensor required by the model.
-        stream : InferStream
-            The stream to use for sending/receiving inference requests/response.
+            A list of InferInput objects, each describing an input tensor
+            required by the model. Their data, if set, and parameters are
+            copied into the prepared request.
         model_version: str
             The version of the model to run inference. The default value
             is an empty string which means then the server will choose
@@ -954,6 +1236,35 @@ class InferenceServerClient:
             A list of InferOutput objects, each describing how the output
             data must be returned. If not specified all outputs produced
             by the model will be returned using default settings.
+
+        Returns
+        -------
+        PreparedInferRequest
+            The prepared request.
+
+        """
+        return PreparedInferRequest(
+            model_name=model_name,
+            inputs=inputs,
+            model_version=model_version,
+            outputs=outputs,
+            wire_serialization=(self._wire_infer is not None))
+
+    def infer_prepared(self,
+                       prepared_request,
+                       request_id=None,
+                       sequence_id=0,
+                       sequence_start=False,
+                       sequence_end=False,
+                       headers=None,
+                       client_timeout=None):
+        """Run synchronous inference using the prepared request.
+
+        Parameters
+        ----------
+        prepared_request : PreparedInferRequest
+            The request returned by prepare_infer_request(), holding the
+            input data to use.
         request_id: str
             Optional identifier for the request. If specified will be returned
             in the response. Default value is 'None' which means no request_id
@@ -963,62 +1274,394 @@ class InferenceServerClient:
             object. Default value is 0 which means that the request does not
             belong to a sequence.
         sequence_start: bool
-            Indicates whether the request being added marks the start of the 
+            Indicates whether the request being added marks the start of the
             sequence. Default value is False. This argument is ignored if
             'sequence_id' is 0.
         sequence_end: bool
-            Indicates whether the request being added marks the end of the 
+            Indicates whether the request being added marks the end of the
             sequence. Default value is False. This argument is ignored if
             'sequence_id' is 0.
-    
+        headers: dict
+            Optional dictionary specifying additional HTTP headers to include
+            in the request.
+        client_timeout: float
+            The maximum time, in seconds, to wait for the result, including
+            the retries and hedged requests. Default value is None which
+            means wait forever.
+
+        Returns
+        -------
+        InferResult
+            The object holding the result of the inference, including the
+            statistics.
+
         Raises
         ------
         InferenceServerException
-            If server fails to issue inference.
+            If server fails to perform inference or if the request was
+            prepared by a client with a different 'wire_serialization'.
         """
+        if headers is not None:
+            metadata = headers.items()
+        else:
+            metadata = ()
 
-        if not stream._is_initialized():
-            # Inititate the response stream handler if required.
-            if stream._headers is not None:
-                metadata = stream._headers.items()
-            else:
-                metadata = ()
-
-            try:
-                stream._init_handler(
-                    self._client_stub.ModelStreamInfer(_RequestIterator(stream),
-                                                       metadata=metadata))
-            except grpc.RpcError as rpc_error:
-                raise_error_grpc(rpc_error)
+        request = self._get_prepared_request(prepared_request, request_id,
+                                             sequence_id, sequence_start,
+                                             sequence_end)
+        return self._infer_request(request, metadata, client_timeout)
+
+    def async_infer_prepared(self,
+                             prepared_request,
+                             callback,
+                             request_id=None,
+                             sequence_id=0,
+                             sequence_start=False,
+                             sequence_end=False,
+                             headers=None,
+                             client_timeout=None):
+        """Run asynchronous inference using the prepared request. The
+        request is serialized before the call returns so the prepared
+        request, and the arrays of its inputs, can be updated for the
+        next call right away.
 
-        request = _get_inference_request(model_name=model_name,
-                                         inputs=inputs,
-                                         model_version=model_version,
-                                         request_id=request_id,
-                                         outputs=outputs,
-                                         sequence_id=sequence_id,
-                                         sequence_start=sequence_start,
-                                         sequence_end=sequence_end)
-        # Enqueues the request to the stream
-        stream._enqueue_request(request)
+        Parameters
+        ----------
+        prepared_request : PreparedInferRequest
+            The request returned by prepare_infer_request(), holding the
+            input data to use.
+        callback : function
+            Python function that is invoked once the request is completed.
+            The function must reserve the last two arguments (result, error)
+            to hold InferResult and InferenceServerException objects
+            respectively which will be provided to the function when executing
+            the callback. The ownership of these objects will be given to the
+            user. The 'error' would be None for a successful inference.
+        request_id: str
+            Optional identifier for the request. If specified will be returned
+            in the response. Default value is 'None' which means no request_id
+            will be used.
+        sequence_id : int
+            The unique identifier for the sequence being represented by the
+            object. Default value is 0 which means that the request does not
+            belong to a sequence.
+        sequence_start: bool
+            Indicates whether the request being added marks the start of the
+            sequence. Default value is False. This argument is ignored if
+            'sequence_id' is 0.
+        sequence_end: bool
+            Indicates whether the request being added marks the end of the
+            sequence. Default value is False. This argument is ignored if
+            'sequence_id' is 0.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+        client_timeout: float
+            The maximum time, in seconds, the request may take. The
+            callback receives a DEADLINE_EXCEEDED error once it elapses.
+            Default value is None which means no limit.
 
+        Raises
+        ------
+        InferenceServerException
+            If server fails to issue inference or if the request was
+            prepared by a client with a different 'wire_serialization'.
+        """
+        if headers is not None:
+            metadata = headers.items()
+        else:
+            metadata = ()
 
-class InferInput:
-    """An object of InferInput class is used to describe
-    input tensor for an inference request.
+        request = self._get_prepared_request(prepared_request, request_id,
+                                             sequence_id, sequence_start,
+                                             sequence_end)
+        self._async_infer_request(request, callback, metadata,
+                                  client_timeout)
 
-    Parameters
-    ----------
-    name : str
-        The name of input whose data will be described by this object
-    shape : list
-        The shape of the associated input. Default value is None.
-    datatype : str
-        The datatype of the associated input. Default is None.
+    def _get_prepared_request(self, prepared_request, request_id,
+                              sequence_id, sequence_start, sequence_end):
+        """Returns the request to send for the prepared request, checking
+        that it was prepared for the serialization used by the client.
+        """
+        if prepared_request._wire_serialization != (self._wire_infer
+                                                    is not None):
+            raise_error("the prepared request was built for a client with "
+                        "a different 'wire_serialization'")
+        return prepared_request._get_request(request_id=request_id,
+                                             sequence_id=sequence_id,
+                                             sequence_start=sequence_start,
+                                             sequence_end=sequence_end)
+
+    def _get_infer_request(self, model_name, inputs, model_version,
+                           request_id, outputs, sequence_id, sequence_start,
+                           sequence_end):
+        """Builds the request to send for infer() and async_infer(),
+        either a ModelInferRequest message or a _WireInferRequest if
+        wire serialization is enabled.
+        """
+        request = _get_inference_request(
+            model_name=model_name,
+            inputs=(inputs if self._wire_infer is None else []),
+            model_version=model_version,
+            request_id=request_id,
+            outputs=outputs,
+            sequence_id=sequence_id,
+            sequence_start=sequence_start,
+            sequence_end=sequence_end)
+        if self._wire_infer is None:
+            return request
+        return _WireInferRequest(request, inputs)
+
+    def _infer_request(self, request, metadata, client_timeout=None):
+        """Sends the ModelInferRequest message and returns the result,
+        retrying and hedging the request as configured on the client.
+        """
+        return _call_with_retries(
+            lambda timeout: self._infer_attempt(request, metadata, timeout),
+            self._retry_policy, client_timeout, self._retry_stats)
 
-    """
+    def _infer_attempt(self, request, metadata, timeout):
+        """Sends the ModelInferRequest message once, or twice if it is
+        hedged, and returns the result.
+        """
+        if self._hedge_delay is not None:
+            return self._hedged_infer(request, metadata, timeout)
+        try:
+            if isinstance(request, _WireInferRequest):
+                # The response deserializer of the wire RPC already
+                # returns the InferResult.
+                return self._wire_infer(request=request,
+                                        metadata=metadata,
+                                        timeout=timeout)
+            response = self._client_stub.ModelInfer(request=request,
+                                                    metadata=metadata,
+                                                    timeout=timeout)
+            result = InferResult(response)
+            return result
+        except grpc.RpcError as rpc_error:
+            raise_error_grpc(rpc_error)
+
+    def _hedged_infer(self, request, metadata, timeout):
+        """Sends the ModelInferRequest message and, if no response is
+        received within the hedge delay, sends it again on another
+        channel. Returns the first successful result and cancels the
+        other call.
+        """
+        if isinstance(request, _WireInferRequest):
+            rpc_name = _WIRE_INFER_RPC
+            get_result = lambda response: response
+        else:
+            rpc_name = 'ModelInfer'
+            get_result = InferResult
+
+        deadline = None
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+        # Holds the position in 'calls' of each completed call.
+        completed = queue.Queue()
+        calls = []
+
+        def start_call(call_timeout, exclude=None):
+            index = self._channel_pool.acquire(exclude)
+            try:
+                call_future = self._channel_pool.get_rpc(
+                    index, rpc_name).future(request=request,
+                                            metadata=metadata,
+                                            timeout=call_timeout)
+            except BaseException:
+                self._channel_pool.release(index)
+                raise
+            position = len(calls)
+            calls.append((index, call_future))
+
+            def on_done(_):
+                self._channel_pool.release(index)
+                completed.put(position)
+
+            call_future.add_done_callback(on_done)
+
+        try:
+            start_call(timeout)
+            try:
+                position = completed.get(timeout=self._hedge_delay)
+            except queue.Empty:
+                hedge_timeout = None
+                if deadline is not None:
+                    hedge_timeout = deadline - time.monotonic()
+                if (hedge_timeout is None) or (hedge_timeout > 0):
+                    self._retry_stats.increment('hedges_fired')
+                    start_call(hedge_timeout, exclude=calls[0][0])
+                position = completed.get()
+
+            error = None
+            pending = len(calls)
+            while True:
+                pending -= 1
+                try:
+                    result = get_result(calls[position][1].result())
+                    if position > 0:
+                        self._retry_stats.increment('hedges_won')
+                    return result
+                except grpc.RpcError as rpc_error:
+                    # Report the error of the first call, the hedged
+                    # call only makes a difference when it succeeds.
+                    if (error is None) or (position == 0):
+                        error = get_error_grpc(rpc_error)
+                if pending == 0:
+                    raise error
+                position = completed.get()
+        finally:
+            for _, call_future in calls:
+                call_future.cancel()
+
+    def _async_infer_request(self,
+                             request,
+                             callback,
+                             metadata,
+                             client_timeout=None):
+        """Sends the ModelInferRequest message and invokes the callback
+        with the result once the request is completed.
+        """
+
+        if isinstance(request, _WireInferRequest):
+            rpc = self._wire_infer
+            get_result = lambda response: response
+        else:
+            rpc = self._client_stub.ModelInfer
+            get_result = InferResult
+
+        def wrapped_callback(call_future):
+            error = result = None
+            try:
+                result = get_result(call_future.result())
+            except grpc.RpcError as rpc_error:
+                error = get_error_grpc(rpc_error)
+            callback(result=result, error=error)
+
+        try:
+            self._call_future = rpc.future(request=request,
+                                           metadata=metadata,
+                                           timeout=client_timeout)
+            self._call_future.add_done_callback(wrapped_callback)
+        except grpc.RpcError as rpc_error:
+            raise_error_grpc(rpc_error)
+
+    def async_stream_infer(self,
+                           model_name,
+                           inputs,
+                           stream,
+                           model_version="",
+                           outputs=None,
+                           request_id=None,
+                           sequence_id=0,
+                           sequence_start=False,
+                           sequence_end=False,
+                           block=True):
+        """Runs an asynchronous inference over gRPC bi-directional streaming
+        API.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model to run inference.
+        inputs : list
+            A list of InferInput objects, each describing data for a input
+            tensor required by the model.
+        stream : InferStream
+            The stream to use for sending/receiving inference requests/response.
+        model_version: str
+            The version of the model to run inference. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        outputs : list
+            A list of InferOutput objects, each describing how the output
+            data must be returned. If not specified all outputs produced
+            by the model will be returned using default settings.
+        request_id: str
+            Optional identifier for the request. If specified will be returned
+            in the response. Default value is 'None' which means no request_id
+            will be used.
+        sequence_id : int
+            The unique identifier for the sequence being represented by the
+            object. Default value is 0 which means that the request does not
+            belong to a sequence.
+        sequence_start: bool
+            Indicates whether the request being added marks the start of the 
+            sequence. Default value is False. This argument is ignored if
+            'sequence_id' is 0.
+        sequence_end: bool
+            Indicates whether the request being added marks the end of the 
+            sequence. Default value is False. This argument is ignored if
+            'sequence_id' is 0.
+        block : bool
+            If True wait for a response when the stream already has
+            'max_outstanding_requests' requests outstanding, otherwise
+            raise. Default value is True.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            The future resolved with the InferResult of this request, or
+            failed with its InferenceServerException. The response is
+            matched to the request by request id, the stream generates
+            one for requests without 'request_id'.
+
+        Raises
+        ------
+        InferenceServerException
+            If server fails to issue inference or if 'block' is False
+            and the limit of outstanding requests is reached.
+        """
+
+        if not stream._is_initialized():
+            # Inititate the response stream handler if required. The
+            # stream may be shared, so only the first caller opens it.
+            with stream._init_lock:
+                if not stream._is_initialized():
+                    if stream._headers is not None:
+                        metadata = stream._headers.items()
+                    else:
+                        metadata = ()
+
+                    try:
+                        stream._init_handler(
+                            self._client_stub.ModelStreamInfer(
+                                _RequestIterator(stream), metadata=metadata))
+                    except grpc.RpcError as rpc_error:
+                        raise_error_grpc(rpc_error)
+
+        request = _get_inference_request(model_name=model_name,
+                                         inputs=inputs,
+                                         model_version=model_version,
+                                         request_id=request_id,
+                                         outputs=outputs,
+                                         sequence_id=sequence_id,
+                                         sequence_start=sequence_start,
+                                         sequence_end=sequence_end)
+        # Enqueues the request to the stream
+        future = stream._register_request(request, block)
+        stream._enqueue_request(request)
+
+        return future
+
+
+class InferInput:
+    """An object of InferInput class is used to describe
+    input tensor for an inference request.
+
+    Parameters
+    ----------
+    name : str
+        The name of input whose data will be described by this object
+    shape : list
+        The shape of the associated input. Default value is None.
+    datatype : str
+        The datatype of the associated input. Default is None.
+
+    """
 
     def __init__(self, name, shape=None, datatype=None):
+        self._raw_data = None
         self._input = grpc_service_v2_pb2.ModelInferRequest().InferInputTensor()
         self._input.name = name
         if shape:
@@ -1057,7 +1700,7 @@ class InferInput:
         """
         return self._input.shape
 
-    def set_data_from_numpy(self, input_tensor):
+    def set_data_from_numpy(self, input_tensor, zero_copy=False):
         """Set the tensor data (datatype, shape, contents) from the
         specified numpy array for input associated with this object.
 
@@ -1065,6 +1708,13 @@ class InferInput:
         ----------
         input_tensor : numpy array
             The tensor data in numpy array format
+        zero_copy : bool
+            If True the data is not copied into the request message but
+            referenced from the array, so that a client created with
+            'wire_serialization' writes it directly to the wire. The
+            array must not be modified until the request is sent. The
+            data is copied into the message only if the input is sent
+            by any other means. Default value is False.
         """
         if not isinstance(input_tensor, (np.ndarray,)):
             raise_error("input_tensor must be a numpy array")
@@ -1072,10 +1722,18 @@ class InferInput:
         self._input.ClearField('shape')
         self._input.shape.extend(input_tensor.shape)
         if self._input.datatype == "BYTES":
-            self._input.contents.raw_contents = serialize_byte_tensor(
-                input_tensor).tobytes()
+            raw_data = serialize_byte_tensor(input_tensor).tobytes()
+        elif zero_copy:
+            raw_data = memoryview(
+                np.ascontiguousarray(input_tensor).reshape(-1).view(np.uint8))
+        else:
+            raw_data = input_tensor.tobytes()
+        if zero_copy:
+            self._input.ClearField('contents')
+            self._raw_data = raw_data
         else:
-            self._input.contents.raw_contents = input_tensor.tobytes()
+            self._input.contents.raw_contents = raw_data
+            self._raw_data = None
 
     def set_parameter(self, key, value):
         """Adds the specified key-value pair in the requested input parameters
@@ -1115,8 +1773,29 @@ class InferInput:
         protobuf message 
             The underlying InferInputTensor protobuf message.
         """
+        if self._raw_data is not None:
+            self._input.contents.raw_contents = bytes(self._raw_data)
+            self._raw_data = None
         return self._input
 
+    def _get_wire_chunks(self):
+        """Returns the chunks of the gRPC wire encoding of the input as
+        an element of ModelInferRequest.inputs. The data set with
+        'zero_copy' is returned as a view of the numpy array.
+        """
+        tensor = self._input.SerializeToString()
+        if self._raw_data is None:
+            return [_encode_field_header(5, len(tensor)), tensor]
+        raw_contents_header = _encode_field_header(1, len(self._raw_data))
+        contents_length = len(raw_contents_header) + len(self._raw_data)
+        contents_header = _encode_field_header(5, contents_length)
+        return [
+            _encode_field_header(
+                5,
+                len(tensor) + len(contents_header) + contents_length), tensor,
+            contents_header, raw_contents_header, self._raw_data
+        ]
+
 
 class InferOutput:
     """An object of InferOutput class is used to describe a
@@ -1184,6 +1863,166 @@ class InferOutput:
         return self._output
 
 
+class PreparedInferRequest:
+    """An object of PreparedInferRequest class holds an inference
+    request built once by InferenceServerClient.prepare_infer_request()
+    and sent many times. Only the data of the inputs, and the request
+    id and sequence flags given when sending, change between calls,
+    all other fields of the request message are reused as is. The
+    object must not be updated from several threads at once.
+
+    With 'wire_serialization' the data of the inputs is not copied when
+    it is set: the numpy arrays are referenced, and BYTES inputs are
+    serialized into a buffer reused from call to call, and the data is
+    written to the wire from there when the request is sent. Otherwise
+    the data is copied into the request message, as protobuf requires.
+
+    Parameters
+    ----------
+    model_name: str
+        The name of the model to run inference.
+    inputs : list
+        A list of InferInput objects, each describing an input tensor
+        required by the model.
+    model_version: str
+        The version of the model to run inference. The default value
+        is an empty string.
+    outputs : list
+        A list of InferOutput objects, each describing how the output
+        data must be returned. Default value is None which means all
+        the outputs are returned using default settings.
+    wire_serialization : bool
+        Whether the request is sent by a client created with
+        'wire_serialization'. Default value is False.
+    """
+
+    def __init__(self,
+                 model_name,
+                 inputs,
+                 model_version="",
+                 outputs=None,
+                 wire_serialization=False):
+        self._wire_serialization = wire_serialization
+        self._request = _get_inference_request(
+            model_name=model_name,
+            inputs=([] if wire_serialization else inputs),
+            model_version=model_version,
+            request_id=None,
+            outputs=outputs)
+        if wire_serialization:
+            # The inputs are kept out of the message and appended to its
+            # serialization from the data they reference.
+            self._wire_inputs = []
+            for infer_input in inputs:
+                prepared_input = InferInput(infer_input.name())
+                prepared_input._input.CopyFrom(infer_input._get_tensor())
+                self._wire_inputs.append(prepared_input)
+            self._wire_inputs_by_name = {
+                prepared_input.name(): prepared_input
+                for prepared_input in self._wire_inputs
+            }
+            tensors = [
+                prepared_input._input for prepared_input in self._wire_inputs
+            ]
+        else:
+            self._wire_inputs = None
+            tensors = self._request.inputs
+        self._inputs = {tensor.name: tensor for tensor in tensors}
+        self._byte_buffers = {}
+
+    def set_data_from_numpy(self, name, input_tensor):
+        """Set the tensor data (shape, contents) of the specified input
+        of the prepared request from the numpy array, replacing the
+        data of the previous call. With 'wire_serialization' the array
+        is referenced, not copied, and must not be modified until the
+        request is sent.
+
+        Parameters
+        ----------
+        name : str
+            The name of the input.
+        input_tensor : numpy array
+            The tensor data in numpy array format
+
+        Raises
+        ------
+        InferenceServerException
+            If the input is not part of the request or if the datatype
+            of the array doesn't match the datatype of the input.
+        """
+        tensor = self._inputs.get(name)
+        if tensor is None:
+            raise_error("input '" + name +
+                        "' is not part of the prepared request")
+        if not isinstance(input_tensor, (np.ndarray,)):
+            raise_error("input_tensor must be a numpy array")
+        datatype = np_to_triton_dtype(input_tensor.dtype)
+        if not tensor.datatype:
+            tensor.datatype = datatype
+        elif tensor.datatype != datatype:
+            raise_error("input '" + name + "' has datatype " +
+                        tensor.datatype + ", got " + str(datatype))
+        if tuple(tensor.shape) != input_tensor.shape:
+            tensor.ClearField('shape')
+            tensor.shape.extend(input_tensor.shape)
+        if datatype == "BYTES":
+            raw_data = self._serialize_byte_tensor(name, input_tensor)
+        elif self._wire_inputs is not None:
+            raw_data = np.ascontiguousarray(input_tensor).reshape(-1).view(
+                np.uint8)
+        else:
+            tensor.contents.raw_contents = input_tensor.tobytes()
+            return
+        if self._wire_inputs is not None:
+            tensor.ClearField('contents')
+            self._wire_inputs_by_name[name]._raw_data = memoryview(raw_data)
+        else:
+            tensor.contents.raw_contents = raw_data.tobytes()
+
+    def _serialize_byte_tensor(self, name, input_tensor):
+        """Serializes the bytes tensor into the buffer of the input, which
+        is only reallocated when the serialized tensor outgrows it, and
+        returns the view of the buffer holding the serialized tensor.
+        """
+        if input_tensor.size == 0:
+            raise_error("input cannot be empty")
+        lengths, payload = _get_byte_tensor_elements(input_tensor)
+        byte_size = 4 * lengths.size + payload.size
+        buffer = self._byte_buffers.get(name)
+        if (buffer is None) or (buffer.size < byte_size):
+            buffer = np.empty(byte_size, dtype=np.uint8)
+            self._byte_buffers[name] = buffer
+        return _pack_length_prefixed(lengths, payload, out=buffer[:byte_size])
+
+    def _get_request(self, request_id, sequence_id, sequence_start,
+                     sequence_end):
+        """Updates the request id and the sequence flags of the request
+        and returns the ModelInferRequest message to send.
+        """
+        request = self._request
+        if request_id is not None:
+            request.id = request_id
+        else:
+            request.ClearField('id')
+        parameters = request.parameters
+        if sequence_id:
+            parameters['sequence_id'].int64_param = sequence_id
+        elif 'sequence_id' in parameters:
+            del parameters['sequence_id']
+        if sequence_start:
+            parameters['sequence_start'].bool_param = sequence_start
+        elif 'sequence_start' in parameters:
+            del parameters['sequence_start']
+        if sequence_end:
+            parameters['sequence_end'].bool_param = sequence_end
+        elif 'sequence_end' in parameters:
+            del parameters['sequence_end']
+
+        if self._wire_inputs is not None:
+            return _WireInferRequest(request, self._wire_inputs)
+        return request
+
+
 class InferResult:
     """An object of InferResult class holds the response of
     an inference request and provide methods to retrieve
@@ -1193,50 +2032,114 @@ class InferResult:
     ----------
     result : protobuf message
         The ModelInferResponse returned by the server
+    raw_contents : dict
+        Optional raw contents of the outputs, keyed by output name,
+        held outside of the message. Default value is None which means
+        the raw contents are read from the message.
     """
 
-    def __init__(self, result):
+    def __init__(self, result, raw_contents=None):
         self._result = result
+        self._raw_contents = raw_contents
+        self._output_index = None
+        self._output_cache = {}
+        self._response = None
 
-    def as_numpy(self, name):
+    def as_numpy(self, name, copy=False):
         """Get the tensor data for output associated with this object
-        in numpy format
+        in numpy format. Outputs returned as raw contents are read-only
+        views over the response message, decoded on the first call and
+        shared by subsequent calls.
 
         Parameters
         ----------
         name : str
             The name of the output tensor whose result is to be retrieved.
-    
+        copy : bool
+            If True return a writable copy of the data owned by the
+            caller instead of the shared read-only array. Default value
+            is False.
+
         Returns
         -------
         numpy array
             The numpy array containing the response data for the tensor or
             None if the data for specified tensor name is not found.
         """
-        for output in self._result.outputs:
-            if output.name == name:
-                shape = []
-                for value in output.shape:
-                    shape.append(value)
-
-                datatype = output.datatype
-                if len(output.contents.raw_contents) != 0:
-                    if datatype == 'BYTES':
-                        # String results contain a 4-byte string length
-                        # followed by the actual string characters. Hence,
-                        # need to decode the raw bytes to convert into
-                        # array elements.
-                        np_array = deserialize_bytes_tensor(
-                            output.contents.raw_contents)
-                    else:
-                        np_array = np.frombuffer(
-                            output.contents.raw_contents,
-                            dtype=triton_to_np_dtype(datatype))
-                elif len(output.contents.byte_contents) != 0:
-                    np_array = np.array(output.contents.byte_contents)
-                np_array = np.resize(np_array, shape)
-                return np_array
-        return None
+        np_array = self._output_cache.get(name)
+        if np_array is None:
+            output = self._get_output(name)
+            if output is None:
+                return None
+
+            datatype = output.datatype
+            raw_contents = self._get_raw_contents(output)
+            if len(raw_contents) != 0:
+                if datatype == 'BYTES':
+                    # String results contain a 4-byte string length
+                    # followed by the actual string characters. Hence,
+                    # need to decode the raw bytes to convert into
+                    # array elements.
+                    np_array = deserialize_bytes_tensor(raw_contents)
+                else:
+                    np_array = np.frombuffer(
+                        raw_contents, dtype=triton_to_np_dtype(datatype))
+            elif len(output.contents.byte_contents) != 0:
+                np_array = np.array(output.contents.byte_contents)
+            else:
+                # The data of the output is not in the response, e.g. it
+                # was written to a shared memory region.
+                return None
+            np_array = np_array.reshape(tuple(output.shape))
+            np_array.flags.writeable = False
+            self._output_cache[name] = np_array
+
+        if copy:
+            return np_array.copy()
+        return np_array
+
+    def as_bytes_tensor(self, name):
+        """Get the data of the BYTES output associated with this
+        object as a BytesTensor viewing the raw contents of the response,
+        without decoding or copying the elements.
+
+        Parameters
+        ----------
+        name : str
+            The name of the output tensor whose result is to be retrieved.
+
+        Returns
+        -------
+        BytesTensor
+            The tensor holding the elements of the output or None if the
+            raw contents for specified tensor name are not found.
+
+        Raises
+        ------
+        InferenceServerException
+            If the output is not a BYTES tensor.
+        """
+        output = self._get_output(name)
+        if output is None:
+            return None
+        if output.datatype != 'BYTES':
+            raise_error("output '" + name + "' is not a BYTES tensor")
+        raw_contents = self._get_raw_contents(output)
+        if len(raw_contents) == 0:
+            return None
+        return BytesTensor(raw_contents, output.shape)
+
+    def _get_output(self, name):
+        if self._output_index is None:
+            self._output_index = {
+                output.name: output for output in self._result.outputs
+            }
+        return self._output_index.get(name)
+
+    def _get_raw_contents(self, output):
+        if self._raw_contents is not None:
+            return self._raw_contents.get(output.name, b'')
+        return output.contents.raw_contents
 
     def get_statistics(self, as_json=False):
         """Retrieves the InferStatistics for this response as
@@ -1273,10 +2176,27 @@ class InferResult:
         protobuf message or dict
             The underlying ModelInferResponse as a protobuf message or dict.
         """
+        response = self._get_response()
         if as_json:
-            return json.loads(MessageToJson(self._result))
+            return json.loads(MessageToJson(response))
         else:
+            return response
+
+    def _get_response(self):
+        """Returns the ModelInferResponse, with the raw contents held
+        outside of the message copied back into it on the first call.
+        """
+        if self._raw_contents is None:
             return self._result
+        if self._response is None:
+            response = grpc_service_v2_pb2.ModelInferResponse()
+            response.CopyFrom(self._result)
+            for output in response.outputs:
+                raw_contents = self._raw_contents.get(output.name)
+                if raw_contents is not None:
+                    output.contents.raw_contents = bytes(raw_contents)
+            self._response = response
+        return self._response
 
 
 class InferStream:
@@ -1286,20 +2206,67 @@ class InferStream:
     Parameters
     ----------
     callback : function
-        Python function that is invoked upon receiving response from
-        the underlying stream. The function must reserve the last two
-        arguments (result, error) to hold InferResult and
+        Optional Python function that is invoked upon receiving response
+        from the underlying stream. The function must reserve the last
+        two arguments (result, error) to hold InferResult and
         InferenceServerException objects respectively which will be
         provided to the function when executing the callback. The
         ownership of these objects will be given to the user. The
-        'error' would be None for a successful inference.
+        'error' would be None for a successful inference. Default value
+        is None which means the results are only delivered through the
+        futures returned by async_stream_infer().
+    max_outstanding_requests : int
+        The maximum number of requests sent on the stream, or waiting
+        to be sent, whose response has not been received. Further calls
+        to async_stream_infer() wait, or raise, until a response is
+        received. Default value is None which means no limit.
+    callback_workers : int
+        The number of worker threads the callbacks are dispatched to,
+        so that a slow callback doesn't hold up reading the stream.
+        The callbacks of the requests of a sequence are run by the same
+        worker, in order, while other responses are processed in
+        parallel. Default value is None which means the callback is run
+        by the thread reading the stream.
+    callback_loop : asyncio.AbstractEventLoop
+        The event loop to run the callbacks on, in the order the
+        responses are received. Can't be combined with
+        'callback_workers'. Default value is None.
+    error_callback : function
+        Optional Python function that is invoked with the exception
+        raised by 'callback', from the thread that ran the callback. The
+        stream keeps processing the following responses. Default value
+        is None which means the exception is logged. Exceptions raised
+        by callbacks run on 'callback_loop' are handled by the loop.
     """
 
-    def __init__(self, callback):
+    def __init__(self,
+                 callback=None,
+                 max_outstanding_requests=None,
+                 callback_workers=None,
+                 callback_loop=None,
+                 error_callback=None):
+        if callback_workers and (callback_loop is not None):
+            raise_error(
+                "callback_workers and callback_loop can't be both specified")
         self._callback = callback
+        self._error_callback = error_callback
+        self._callback_workers = callback_workers
+        self._callback_loop = callback_loop
+        self._callback_queues = []
+        self._callback_threads = []
+        self._next_callback_queue = 0
+        self._max_outstanding_requests = max_outstanding_requests
         self._request_queue = queue.Queue()
         self._handler = None
         self._headers = None
+        # Held while the gRPC stream is opened by the first request
+        self._init_lock = threading.Lock()
+        # The futures of the outstanding requests, by request id. A
+        # list is kept per id as ids provided by the user may repeat.
+        self._pending_requests = {}
+        self._outstanding_count = 0
+        self._next_request_id = 0
+        self._condition = threading.Condition()
 
     def __enter__(self):
         return self
@@ -1320,6 +2287,14 @@ class InferStream:
             if self._handler.is_alive():
                 self._handler.join()
             self._handler = None
+            # All the responses are dispatched, let the workers run the
+            # remaining callbacks and exit.
+            for callback_queue in self._callback_queues:
+                callback_queue.put(None)
+            for callback_thread in self._callback_threads:
+                callback_thread.join()
+            self._callback_queues = []
+            self._callback_threads = []
 
     def set_headers(self, headers):
         """Sets the specified headers to be used with the stream.
@@ -1335,6 +2310,27 @@ class InferStream:
                 'Can not set headers for already initialized InferStream')
         self._headers = headers
 
+    def get_statistics(self):
+        """Get the number of requests waiting to be sent on the stream
+        and of requests sent but whose response is not yet received.
+
+        Returns
+        -------
+        dict
+            The JSON dict holding the 'queue_depth', 'in_flight' and
+            'outstanding' (their sum) request counts and the
+            'max_outstanding_requests' limit.
+        """
+        with self._condition:
+            outstanding_count = self._outstanding_count
+        queue_depth = min(self._request_queue.qsize(), outstanding_count)
+        return {
+            'queue_depth': queue_depth,
+            'in_flight': outstanding_count - queue_depth,
+            'outstanding': outstanding_count,
+            'max_outstanding_requests': self._max_outstanding_requests
+        }
+
     def _is_initialized(self):
         """Returns whether the handler to this stream object
         is initialized.
@@ -1354,11 +2350,114 @@ class InferStream:
         if self._is_initialized():
             raise_error(
                 'Attempted to initialize already initialized InferStream')
+        if self._callback is not None and self._callback_workers:
+            for _ in range(self._callback_workers):
+                callback_queue = queue.Queue()
+                callback_thread = threading.Thread(
+                    target=_run_callbacks,
+                    args=(self._callback, self._error_callback,
+                          callback_queue))
+                callback_thread.start()
+                self._callback_queues.append(callback_queue)
+                self._callback_threads.append(callback_thread)
         # Create a new thread to handle the gRPC response stream
         self._handler = threading.Thread(target=self._process_response,
                                          args=(response_iterator,))
         self._handler.start()
 
+    def _register_request(self, request, block):
+        """Counts the request as outstanding, waiting for a response if
+        the limit of outstanding requests is reached, and returns the
+        future of the request. Gives the request an id if it has none.
+
+        Parameters
+        ----------
+        request : ModelInferRequest
+            The protobuf message holding the ModelInferRequest
+        block : bool
+            If True wait for room when the limit is reached, otherwise
+            raise.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            The future of the request.
+        """
+        with self._condition:
+            if self._max_outstanding_requests is not None:
+                while (self._outstanding_count >=
+                       self._max_outstanding_requests):
+                    if not block:
+                        raise_error(
+                            "maximum number of outstanding requests reached")
+                    self._condition.wait()
+            if not request.id:
+                request.id = "stream_request_" + str(self._next_request_id)
+                self._next_request_id += 1
+            future = futures.Future()
+            future.set_running_or_notify_cancel()
+            if 'sequence_id' in request.parameters:
+                sequence_id = request.parameters['sequence_id'].int64_param
+            else:
+                sequence_id = 0
+            self._pending_requests.setdefault(request.id, []).append(
+                (future, sequence_id))
+            self._outstanding_count += 1
+        return future
+
+    def _complete_request(self, request_id):
+        """Returns the future and the sequence id of the outstanding
+        request with the specified id, or of the oldest outstanding
+        request if the id is unknown, and stops counting it as
+        outstanding.
+        """
+        with self._condition:
+            if request_id not in self._pending_requests:
+                if not self._pending_requests:
+                    return None, 0
+                request_id = next(iter(self._pending_requests))
+            request_futures = self._pending_requests[request_id]
+            future, sequence_id = request_futures.pop(0)
+            if not request_futures:
+                del self._pending_requests[request_id]
+            self._outstanding_count -= 1
+            self._condition.notify()
+        return future, sequence_id
+
+    def _fail_pending_requests(self, error):
+        """Fails the futures of all the outstanding requests with the
+        specified error.
+        """
+        with self._condition:
+            pending_requests = self._pending_requests
+            self._pending_requests = {}
+            self._outstanding_count = 0
+            self._condition.notify_all()
+        for request_futures in pending_requests.values():
+            for future, _ in request_futures:
+                future.set_exception(error)
+
+    def _dispatch_callback(self, sequence_id, result, error):
+        """Runs the callback for the response, or hands it to the event
+        loop or to the worker assigned to the sequence.
+        """
+        if self._callback is None:
+            return
+        if self._callback_loop is not None:
+            self._callback_loop.call_soon_threadsafe(
+                functools.partial(self._callback, result=result, error=error))
+        elif self._callback_queues:
+            if sequence_id:
+                index = sequence_id % len(self._callback_queues)
+            else:
+                index = self._next_callback_queue
+                self._next_callback_queue = (index + 1) % len(
+                    self._callback_queues)
+            self._callback_queues[index].put((result, error))
+        else:
+            _run_callback(self._callback, self._error_callback, result,
+                          error)
+
     def _enqueue_request(self, request):
         """Enqueues the specified request object to be provided
         in gRPC request stream.
@@ -1404,10 +2503,900 @@ class InferStream:
                     result = InferResult(response.infer_response)
                 else:
                     error = InferenceServerException(msg=response.error_message)
-                self._callback(result=result, error=error)
+                future, sequence_id = self._complete_request(
+                    response.infer_response.id)
+                if future is not None:
+                    if error is None:
+                        future.set_result(result)
+                    else:
+                        future.set_exception(error)
+                self._dispatch_callback(sequence_id, result, error)
         except grpc.RpcError as rpc_error:
             error = get_error_grpc(rpc_error)
-            self._callback(result=None, error=error)
+            self._fail_pending_requests(error)
+            self._dispatch_callback(0, None, error)
+        else:
+            self._fail_pending_requests(
+                InferenceServerException(msg="stream closed before response"))
+
+
+def _run_callbacks(callback, error_callback, callback_queue):
+    """Worker thread function running the callback for the responses
+    handed to the worker by InferStream, until None is received.
+    """
+    while True:
+        item = callback_queue.get()
+        if item is None:
+            return
+        result, error = item
+        _run_callback(callback, error_callback, result, error)
+
+
+def _run_callback(callback, error_callback, result, error):
+    """Runs the callback of an InferStream for a response. The exception
+    it raises is handed to 'error_callback', or logged, so that the
+    calling thread keeps processing the following responses.
+    """
+    try:
+        callback(result=result, error=error)
+    except Exception as callback_error:
+        if error_callback is None:
+            _logger.exception("InferStream callback raised an exception")
+            return
+        try:
+            error_callback(callback_error)
+        except Exception:
+            _logger.exception(
+                "InferStream error_callback raised an exception")
+
+
+class SequenceStreamPool:
+    """Sends the requests of many concurrent sequences over a pool of
+    'stream_count' InferStream objects. Each sequence is pinned to one
+    stream, chosen by consistent hashing of its sequence id, from its
+    first request until its end so that its requests are received by
+    the server in order. A new sequence whose stream has many more
+    requests outstanding than the average is placed on the next less
+    loaded stream of the hash ring instead. Streams are opened on
+    demand and closed once idle for 'idle_timeout' seconds. Idle
+    streams are checked for when requests are issued, no thread is
+    used for it.
+
+    Parameters
+    ----------
+    client : InferenceServerClient
+        The client used to open the streams.
+    stream_count : int
+        The number of streams of the pool.
+    callback : function
+        Optional Python function that is invoked upon receiving each
+        response, see InferStream. Default value is None.
+    max_outstanding_requests : int
+        The maximum number of outstanding requests of each stream, see
+        InferStream. Default value is None which means no limit.
+    idle_timeout : float
+        The time, in seconds, after which a stream with no active
+        sequence and no outstanding request is closed. Default value is
+        None which means streams are only closed by close().
+    rebalance_factor : float
+        A new sequence is moved away from its stream if that stream has
+        more than 'rebalance_factor' times the average number of
+        outstanding requests of the open streams. Default value is 2.0.
+    headers: dict
+        Optional dictionary specifying additional HTTP headers to include
+        while establishing the gRPC streams.
+
+    """
+
+    # The number of points of each stream on the hash ring
+    _VIRTUAL_NODE_COUNT = 64
+
+    def __init__(self,
+                 client,
+                 stream_count,
+                 callback=None,
+                 max_outstanding_requests=None,
+                 idle_timeout=None,
+                 rebalance_factor=2.0,
+                 headers=None):
+        if stream_count < 1:
+            raise_error("stream_count must be at least 1")
+        self._client = client
+        self._callback = callback
+        self._max_outstanding_requests = max_outstanding_requests
+        self._idle_timeout = idle_timeout
+        self._rebalance_factor = rebalance_factor
+        self._headers = headers
+        self._slots = [_StreamSlot() for _ in range(stream_count)]
+        self._ring = sorted(
+            (_get_hash("{}-{}".format(index, node)), index)
+            for index in range(stream_count)
+            for node in range(self._VIRTUAL_NODE_COUNT))
+        self._ring_hashes = [point[0] for point in self._ring]
+        # The index of the stream of each active sequence
+        self._sequence_streams = {}
+        self._rebalanced_sequence_count = 0
+        self._idle_closed_stream_count = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def close(self):
+        """Close all the streams of the pool. This call blocks until the
+        responses of all the outstanding requests are received.
+
+        """
+        with self._lock:
+            streams = [slot.stream for slot in self._slots]
+            for slot in self._slots:
+                slot.stream = None
+            self._sequence_streams.clear()
+        for stream in streams:
+            if stream is not None:
+                stream.close()
+
+    def infer(self,
+              model_name,
+              inputs,
+              sequence_id,
+              model_version="",
+              outputs=None,
+              request_id=None,
+              sequence_start=False,
+              sequence_end=False,
+              block=True):
+        """Runs an asynchronous inference on the stream of the sequence.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model to run inference.
+        inputs : list
+            A list of InferInput objects, each describing data for a input
+            tensor required by the model.
+        sequence_id : int
+            The unique identifier for the sequence the request belongs
+            to. 0 means that the request does not belong to a sequence
+            and is sent on the least loaded stream.
+        model_version: str
+            The version of the model to run inference. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        outputs : list
+            A list of InferOutput objects, each describing how the output
+            data must be returned. If not specified all outputs produced
+            by the model will be returned using default settings.
+        request_id: str
+            Optional identifier for the request. If specified will be returned
+            in the response. Default value is 'None' which means no request_id
+            will be used.
+        sequence_start: bool
+            Indicates whether the request marks the start of the
+            sequence. Default value is False.
+        sequence_end: bool
+            Indicates whether the request marks the end of the sequence.
+            The sequence is unpinned from its stream once the request is
+            issued. Default value is False.
+        block : bool
+            If True wait when the stream of the sequence has reached
+            'max_outstanding_requests', otherwise raise. Default value
+            is True.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            The future resolved with the InferResult of the request.
+
+        Raises
+        ------
+        InferenceServerException
+            If server fails to issue inference.
+        """
+        slot, stream = self._acquire_stream(sequence_id, sequence_end)
+        try:
+            return self._client.async_stream_infer(
+                model_name=model_name,
+                inputs=inputs,
+                stream=stream,
+                model_version=model_version,
+                outputs=outputs,
+                request_id=request_id,
+                sequence_id=sequence_id,
+                sequence_start=sequence_start,
+                sequence_end=sequence_end,
+                block=block)
+        finally:
+            with self._lock:
+                slot.user_count -= 1
+                slot.last_used = time.monotonic()
+
+    def get_statistics(self):
+        """Get the state of the streams of the pool.
+
+        Returns
+        -------
+        dict
+            The JSON dict holding the number of active sequences, of new
+            sequences moved away from their hashed stream and of streams
+            closed for being idle, and for each stream whether it is
+            open, its number of active sequences and its statistics as
+            reported by InferStream.get_statistics().
+        """
+        with self._lock:
+            streams = []
+            for slot in self._slots:
+                stream_statistics = {
+                    'open': slot.stream is not None,
+                    'active_sequences': slot.sequence_count
+                }
+                if slot.stream is not None:
+                    stream_statistics.update(slot.stream.get_statistics())
+                streams.append(stream_statistics)
+            return {
+                'active_sequences': len(self._sequence_streams),
+                'rebalanced_sequences': self._rebalanced_sequence_count,
+                'idle_closed_streams': self._idle_closed_stream_count,
+                'streams': streams
+            }
+
+    def _acquire_stream(self, sequence_id, sequence_end):
+        """Returns the slot and the stream to send the request of the
+        sequence on, opening the stream if needed, and counts the caller
+        as a user of the slot so that it isn't closed meanwhile.
+        """
+        idle_streams = []
+        with self._lock:
+            index = self._sequence_streams.get(sequence_id)
+            if index is None:
+                index = self._select_stream(sequence_id)
+                if sequence_id and not sequence_end:
+                    self._sequence_streams[sequence_id] = index
+                    self._slots[index].sequence_count += 1
+            elif sequence_end:
+                del self._sequence_streams[sequence_id]
+                self._slots[index].sequence_count -= 1
+            slot = self._slots[index]
+            if slot.stream is None:
+                slot.stream = InferStream(
+                    callback=self._callback,
+                    max_outstanding_requests=self._max_outstanding_requests)
+                if self._headers is not None:
+                    slot.stream.set_headers(self._headers)
+            slot.user_count += 1
+            slot.last_used = time.monotonic()
+            if self._idle_timeout is not None:
+                idle_streams = self._detach_idle_streams(slot.last_used)
+        for stream in idle_streams:
+            stream.close()
+        return slot, slot.stream
+
+    def _select_stream(self, sequence_id):
+        """Returns the index of the stream for a new sequence.
+        """
+        loads = [
+            slot.stream.get_statistics()['outstanding']
+            if slot.stream is not None else 0 for slot in self._slots
+        ]
+        if not sequence_id:
+            return loads.index(min(loads))
+
+        position = bisect.bisect(self._ring_hashes, _get_hash(sequence_id))
+        index = self._ring[position % len(self._ring)][1]
+        average_load = sum(loads) / len(loads)
+        if loads[index] <= max(average_load * self._rebalance_factor, 1):
+            return index
+
+        # Walk the ring from the hashed position to the first stream
+        # that is not overloaded, so that the choice stays stable.
+        for offset in range(1, len(self._ring)):
+            candidate = self._ring[(position + offset) % len(self._ring)][1]
+            if loads[candidate] <= average_load:
+                self._rebalanced_sequence_count += 1
+                return candidate
+        return index
+
+    def _detach_idle_streams(self, now):
+        """Removes from the pool the streams idle for longer than
+        'idle_timeout' and returns them to be closed outside the lock.
+        """
+        idle_streams = []
+        for slot in self._slots:
+            if (slot.stream is None or slot.user_count or
+                    slot.sequence_count or
+                    now - slot.last_used < self._idle_timeout):
+                continue
+            if slot.stream.get_statistics()['outstanding']:
+                continue
+            idle_streams.append(slot.stream)
+            slot.stream = None
+            self._idle_closed_stream_count += 1
+        return idle_streams
+
+
+class _StreamSlot:
+    """A stream of a SequenceStreamPool, along with the number of
+    active sequences pinned to it and of callers using it.
+    """
+
+    def __init__(self):
+        self.stream = None
+        self.sequence_count = 0
+        self.user_count = 0
+        self.last_used = 0.0
+
+
+def _get_hash(key):
+    """Returns the 64-bit position of the key on a hash ring.
+    """
+    return int.from_bytes(
+        hashlib.md5(str(key).encode('utf-8')).digest()[:8], 'little')
+
+
+class RequestCoalescer:
+    """Coalesces single-sample inference requests issued concurrently
+    from several threads into batched requests. Requests for the same
+    model and version that ask for the same outputs are held for up to
+    'max_delay_ms' or until 'max_batch_size' samples are collected.
+    Their inputs are then concatenated along the batch (first)
+    dimension, sent as a single request and the outputs are split back
+    to each caller.
+
+    The model must support batching, i.e. every input and output must
+    have the batch dimension first. Requests that can not be coalesced
+    (inputs or outputs with parameters, for example shared memory or
+    classification) are sent to the server as they are.
+
+    The coalescer relies on the requests being issued from several
+    threads and is only provided for the gRPC client.
+
+    Parameters
+    ----------
+    client : InferenceServerClient
+        The client used to send the batched requests.
+    max_batch_size : int
+        The maximum number of samples combined into one request. This
+        should not exceed the max_batch_size of the model.
+    max_delay_ms : float
+        The maximum time, in milliseconds, a request is held waiting for
+        other requests to batch with. Default value is 1.0.
+    headers: dict
+        Optional dictionary specifying additional HTTP headers to include
+        in the batched requests.
+
+    """
+
+    def __init__(self, client, max_batch_size, max_delay_ms=1.0,
+                 headers=None):
+        if max_batch_size < 1:
+            raise_error("max_batch_size must be at least 1")
+        self._client = client
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay_ms / 1000.0
+        self._headers = headers
+        self._lock = threading.Lock()
+        self._pending = {}
+
+    def infer(self, model_name, inputs, model_version="", outputs=None):
+        """Run synchronous inference using the supplied 'inputs' requesting
+        the outputs specified by 'outputs'. The call returns once the
+        batched request holding these inputs completes.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model to run inference.
+        inputs : list
+            A list of InferInput objects, each describing data for a input
+            tensor required by the model. The first dimension of every
+            input is the batch dimension.
+        model_version: str
+            The version of the model to run inference. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        outputs : list
+            A list of InferOutput objects, each describing how the output
+            data must be returned. If not specified all outputs produced
+            by the model will be returned using default settings.
+
+        Returns
+        -------
+        InferResult
+            The object holding the result of the inference for these
+            inputs.
+
+        Raises
+        ------
+        InferenceServerException
+            If the inputs do not have the same batch size or if server
+            fails to perform inference.
+        """
+        key = self._get_key(model_name, model_version, inputs, outputs)
+        if key is None:
+            return self._client.infer(model_name=model_name,
+                                      inputs=inputs,
+                                      model_version=model_version,
+                                      outputs=outputs,
+                                      headers=self._headers)
+
+        entry = _CoalescedEntry(inputs)
+        for infer_input in inputs:
+            tensor = infer_input._get_tensor()
+            if tensor.shape[0] != entry.batch_size:
+                raise_error("input '" + tensor.name + "' has batch size " +
+                            str(tensor.shape[0]) + ", expected " +
+                            str(entry.batch_size))
+        with self._lock:
+            batch = self._pending.get(key)
+            if (batch is not None) and (batch.batch_size + entry.batch_size >
+                                        self._max_batch_size):
+                # Flush the pending batch and start a new one.
+                del self._pending[key]
+                batch.full.set()
+                batch = None
+            leader = (batch is None)
+            if leader:
+                batch = _CoalescedBatch(model_name, model_version, outputs)
+                self._pending[key] = batch
+            batch.entries.append(entry)
+            batch.batch_size += entry.batch_size
+            if batch.batch_size >= self._max_batch_size:
+                del self._pending[key]
+                batch.full.set()
+
+        if leader:
+            # The first request of the batch waits for the others and
+            # then sends the batch on behalf of all of them.
+            batch.full.wait(self._max_delay)
+            with self._lock:
+                if self._pending.get(key) is batch:
+                    del self._pending[key]
+            self._run_batch(batch)
+        else:
+            entry.done.wait()
+
+        if entry.error is not None:
+            raise entry.error
+        return entry.result
+
+    def _get_key(self, model_name, model_version, inputs, outputs):
+        """Returns the key identifying requests that can be batched
+        together or None if the request can not be coalesced.
+        """
+        input_key = []
+        for infer_input in inputs:
+            tensor = infer_input._get_tensor()
+            if (len(tensor.parameters) != 0) or (len(tensor.shape) == 0):
+                return None
+            input_key.append(
+                (tensor.name, tensor.datatype, tuple(tensor.shape[1:])))
+        output_key = []
+        if outputs:
+            for infer_output in outputs:
+                tensor = infer_output._get_tensor()
+                if len(tensor.parameters) != 0:
+                    return None
+                output_key.append(tensor.name)
+        return (model_name, model_version, tuple(input_key),
+                tuple(output_key))
+
+    def _run_batch(self, batch):
+        """Sends the batched request and distributes the results to
+        the entries of the batch.
+        """
+        try:
+            if len(batch.entries) == 1:
+                entry = batch.entries[0]
+                entry.result = self._client.infer(
+                    model_name=batch.model_name,
+                    inputs=entry.inputs,
+                    model_version=batch.model_version,
+                    outputs=batch.outputs,
+                    headers=self._headers)
+            else:
+                batched_inputs = []
+                for idx, first_input in enumerate(batch.entries[0].inputs):
+                    tensor = first_input._get_tensor()
+                    batched_input = InferInput(tensor.name,
+                                               [batch.batch_size] +
+                                               list(tensor.shape[1:]),
+                                               tensor.datatype)
+                    batched_input._get_tensor().contents.raw_contents = b''.join(
+                        [
+                            entry.inputs[idx]._get_tensor().contents.
+                            raw_contents for entry in batch.entries
+                        ])
+                    batched_inputs.append(batched_input)
+                result = self._client.infer(model_name=batch.model_name,
+                                            inputs=batched_inputs,
+                                            model_version=batch.model_version,
+                                            outputs=batch.outputs,
+                                            headers=self._headers)
+                results = _split_batched_response(
+                    result, [entry.batch_size for entry in batch.entries])
+                for entry, split_result in zip(batch.entries, results):
+                    entry.result = split_result
+        except InferenceServerException as error:
+            for entry in batch.entries:
+                entry.error = error
+        except Exception as error:
+            # Any other failure, e.g. a malformed batched response, must
+            # still be reported to every waiting caller.
+            wrapped_error = InferenceServerException(msg=str(error))
+            for entry in batch.entries:
+                entry.error = wrapped_error
+        finally:
+            for entry in batch.entries:
+                entry.done.set()
+
+
+class _CoalescedEntry:
+    """A request held by RequestCoalescer.
+    """
+
+    def __init__(self, inputs):
+        self.inputs = inputs
+        self.batch_size = inputs[0]._get_tensor().shape[0] if inputs else 0
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _CoalescedBatch:
+    """The requests RequestCoalescer combines into one request.
+    """
+
+    def __init__(self, model_name, model_version, outputs):
+        self.model_name = model_name
+        self.model_version = model_version
+        self.outputs = outputs
+        self.entries = []
+        self.batch_size = 0
+        self.full = threading.Event()
+
+
+def _split_batched_response(result, batch_sizes):
+    """Splits the outputs of a batched inference result along the
+    batch dimension. The raw contents of the split results are views
+    of the raw contents of the batched result.
+
+    Parameters
+    ----------
+    result : InferResult
+        The result of the batched request.
+    batch_sizes : list
+        The batch size of each of the coalesced requests, in the order
+        their inputs were concatenated.
+
+    Returns
+    -------
+    list
+        An InferResult for each of the coalesced requests.
+    """
+    response = result._result
+    total_batch_size = sum(batch_sizes)
+    responses = []
+    split_raw_contents = []
+    for _ in batch_sizes:
+        split_response = grpc_service_v2_pb2.ModelInferResponse()
+        split_response.model_version = response.model_version
+        split_response.id = response.id
+        for key, value in response.parameters.items():
+            split_response.parameters[key].CopyFrom(value)
+        responses.append(split_response)
+        split_raw_contents.append({})
+
+    for output in response.outputs:
+        if (len(output.shape) == 0) or (output.shape[0] != total_batch_size):
+            raise_error("output '" + output.name +
+                        "' does not have the batch dimension")
+        raw_contents = memoryview(result._get_raw_contents(output))
+        element_count = int(np.prod(output.shape[1:]))
+        if output.datatype == 'BYTES':
+            # Find the byte offset of the first element of every sample
+            # by walking the length prefix of each element.
+            offsets = [0]
+            offset = 0
+            for batch_size in batch_sizes:
+                for _ in range(batch_size * element_count):
+                    offset += 4 + struct.unpack_from("<I", raw_contents,
+                                                     offset)[0]
+                offsets.append(offset)
+        else:
+            sample_byte_size = len(raw_contents) // total_batch_size
+            offsets = [0]
+            for batch_size in batch_sizes:
+                offsets.append(offsets[-1] + batch_size * sample_byte_size)
+
+        for idx, batch_size in enumerate(batch_sizes):
+            split_output = responses[idx].outputs.add()
+            split_output.name = output.name
+            split_output.datatype = output.datatype
+            split_output.shape.extend([batch_size] + list(output.shape[1:]))
+            split_raw_contents[idx][output.name] = raw_contents[
+                offsets[idx]:offsets[idx + 1]]
+
+    return [
+        InferResult(split_response, raw_contents)
+        for split_response, raw_contents in zip(responses, split_raw_contents)
+    ]
+
+
+# The name under which the ModelInfer RPC using the wire serialization
+# is dispatched by _ChannelPool.
+_WIRE_INFER_RPC = 'ModelInferWire'
+
+
+def _encode_varint(value):
+    """Returns the protobuf base 128 varint encoding of the value.
+    """
+    encoded = bytearray()
+    while value > 0x7f:
+        encoded.append((value & 0x7f) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _encode_field_header(field_number, length):
+    """Returns the key and length of a length-delimited protobuf field.
+    """
+    return _encode_varint((field_number << 3) | 2) + _encode_varint(length)
+
+
+def _read_varint(buffer, offset):
+    """Decodes the varint at the offset of the buffer. Returns the value
+    and the offset following it.
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = buffer[offset]
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+def _iter_fields(buffer, start, end):
+    """Iterates over the protobuf fields encoded in buffer[start:end].
+    Yields for each field its number, its wire type and the offsets of
+    the start of the field, of the start of its value and of its end.
+    """
+    offset = start
+    while offset < end:
+        field_start = offset
+        key, offset = _read_varint(buffer, offset)
+        wire_type = key & 0x7
+        if wire_type == 0:
+            _, field_end = _read_varint(buffer, offset)
+        elif wire_type == 1:
+            field_end = offset + 8
+        elif wire_type == 2:
+            length, offset = _read_varint(buffer, offset)
+            field_end = offset + length
+        elif wire_type == 5:
+            field_end = offset + 4
+        else:
+            raise_error("unsupported protobuf wire type " + str(wire_type))
+        yield key >> 3, wire_type, field_start, offset, field_end
+        offset = field_end
+
+
+class _WireInferRequest:
+    """An inference request serialized by _serialize_wire_request(). It
+    holds the ModelInferRequest message without its inputs and the
+    InferInput objects of the inputs.
+    """
+
+    def __init__(self, request, inputs):
+        self.request = request
+        self.inputs = inputs
+
+
+def _serialize_wire_request(wire_request):
+    """Serializes the _WireInferRequest into the wire format of a
+    ModelInferRequest. The message without its inputs is serialized by
+    protobuf and each input is appended as an element of the repeated
+    'inputs' field, with the data set using 'zero_copy' taken directly
+    from the numpy arrays, so the tensor data is copied only once.
+    """
+    chunks = [wire_request.request.SerializeToString()]
+    for infer_input in wire_request.inputs:
+        chunks.extend(infer_input._get_wire_chunks())
+    return b''.join(chunks)
+
+
+def _deserialize_wire_response(response_bytes):
+    """Deserializes the wire format of a ModelInferResponse into an
+    InferResult. The raw contents of the outputs are kept as views of
+    the received buffer, the rest of the message is parsed by protobuf.
+    """
+    buffer = memoryview(response_bytes)
+    message_chunks = []
+    output_raw_contents = []
+    for field_number, wire_type, field_start, value_start, field_end in \
+            _iter_fields(buffer, 0, len(buffer)):
+        # Strip the raw contents of the 'outputs' (4) out of the message
+        if field_number != 4 or wire_type != 2:
+            message_chunks.append(buffer[field_start:field_end])
+            continue
+        raw_contents = None
+        output_chunks = []
+        for output_field in _iter_fields(buffer, value_start, field_end):
+            # 'contents' (4) of InferOutputTensor
+            if output_field[0] != 4 or output_field[1] != 2:
+                output_chunks.append(buffer[output_field[2]:output_field[4]])
+                continue
+            contents_chunks = []
+            for contents_field in _iter_fields(buffer, output_field[3],
+                                               output_field[4]):
+                # 'raw_contents' (1) of InferTensorContents
+                if contents_field[0] == 1 and contents_field[1] == 2:
+                    raw_contents = buffer[contents_field[3]:contents_field[4]]
+                else:
+                    contents_chunks.append(
+                        buffer[contents_field[2]:contents_field[4]])
+            contents = b''.join(contents_chunks)
+            output_chunks.extend([_encode_field_header(4, len(contents)),
+                                  contents])
+        output = b''.join(output_chunks)
+        message_chunks.extend([_encode_field_header(4, len(output)), output])
+        output_raw_contents.append(raw_contents)
+
+    response = grpc_service_v2_pb2.ModelInferResponse.FromString(
+        b''.join(message_chunks))
+    raw_contents = {}
+    for output, contents in zip(response.outputs, output_raw_contents):
+        if contents is not None:
+            raw_contents[output.name] = contents
+    return InferResult(response, raw_contents)
+
+
+class _ChannelPool:
+    """Holds the gRPC channels of a client and selects the channel to
+    use for each RPC.
+    """
+
+    def __init__(self, url, options, channel_count, policy):
+        if channel_count < 1:
+            raise_error("channel_count must be at least 1")
+        if policy not in ('round_robin', 'least_loaded'):
+            raise_error("unsupported channel policy '" + str(policy) + "'")
+        self._policy = policy
+        self._channels = [
+            grpc.insecure_channel(url, options=options)
+            for _ in range(channel_count)
+        ]
+        self._stubs = [
+            grpc_service_v2_pb2_grpc.GRPCInferenceServiceStub(channel)
+            for channel in self._channels
+        ]
+        self._wire_infers = [
+            channel.unary_unary(
+                '/nvidia.inferenceserver.GRPCInferenceService/ModelInfer',
+                request_serializer=_serialize_wire_request,
+                response_deserializer=_deserialize_wire_response)
+            for channel in self._channels
+        ]
+        self._in_flight = [0] * channel_count
+        self._next_index = 0
+        self._lock = threading.Lock()
+
+    def close(self):
+        for channel in self._channels:
+            channel.close()
+
+    def get_stub(self, index):
+        return self._stubs[index]
+
+    def get_rpc(self, index, rpc_name):
+        if rpc_name == _WIRE_INFER_RPC:
+            return self._wire_infers[index]
+        return getattr(self._stubs[index], rpc_name)
+
+    def get_in_flight(self):
+        with self._lock:
+            return list(self._in_flight)
+
+    def acquire(self, exclude=None):
+        """Selects the channel for an RPC and counts the RPC as in
+        flight on it.
+
+        Parameters
+        ----------
+        exclude : int
+            The index of a channel not to select unless it is the only
+            one. Default value is None.
+
+        Returns
+        -------
+        int
+            The index of the selected channel.
+        """
+        with self._lock:
+            channel_count = len(self._channels)
+            start = self._next_index
+            self._next_index = (start + 1) % channel_count
+            index = start
+            if self._policy == 'least_loaded':
+                # Start the scan at the round-robin position so that
+                # ties are spread across the channels.
+                for offset in range(1, channel_count):
+                    candidate = (start + offset) % channel_count
+                    if self._in_flight[candidate] < self._in_flight[index]:
+                        index = candidate
+            if (index == exclude) and (channel_count > 1):
+                index = (index + 1) % channel_count
+            self._in_flight[index] += 1
+            return index
+
+    def release(self, index):
+        with self._lock:
+            self._in_flight[index] -= 1
+
+
+class _PooledStub:
+    """A stand-in for GRPCInferenceServiceStub that dispatches each RPC
+    to a channel of the _ChannelPool.
+    """
+
+    def __init__(self, channel_pool):
+        self._channel_pool = channel_pool
+
+    def __getattr__(self, rpc_name):
+        rpc = _PooledMultiCallable(self._channel_pool, rpc_name)
+        setattr(self, rpc_name, rpc)
+        return rpc
+
+
+class _PooledMultiCallable:
+    """Invokes the RPC on the channel selected by the _ChannelPool and
+    keeps the count of the RPCs in flight on the channel.
+    """
+
+    def __init__(self, channel_pool, rpc_name):
+        self._channel_pool = channel_pool
+        self._rpc_name = rpc_name
+
+    def _get_rpc(self, index):
+        return self._channel_pool.get_rpc(index, self._rpc_name)
+
+    def __call__(self, *args, **kwargs):
+        index = self._channel_pool.acquire()
+        if self._rpc_name == 'ModelStreamInfer':
+            try:
+                responses = self._get_rpc(index)(*args, **kwargs)
+            except BaseException:
+                self._channel_pool.release(index)
+                raise
+            return self._iterate_stream(responses, index)
+        try:
+            return self._get_rpc(index)(*args, **kwargs)
+        finally:
+            self._channel_pool.release(index)
+
+    def future(self, *args, **kwargs):
+        index = self._channel_pool.acquire()
+        try:
+            call_future = self._get_rpc(index).future(*args, **kwargs)
+        except BaseException:
+            self._channel_pool.release(index)
+            raise
+        call_future.add_done_callback(
+            lambda _: self._channel_pool.release(index))
+        return call_future
+
+    def _iterate_stream(self, responses, index):
+        try:
+            for response in responses:
+                yield response
+        finally:
+            self._channel_pool.release(index)
 
 
 class _RequestIterator:
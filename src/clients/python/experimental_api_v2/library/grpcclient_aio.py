@@ -0,0 +1,983 @@
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import base64
+import grpc
+import grpc.aio
+import rapidjson as json
+from google.protobuf.json_format import MessageToJson
+
+from tritongrpcclient import grpc_service_v2_pb2
+from tritongrpcclient import grpc_service_v2_pb2_grpc
+from tritongrpcclient.core import InferInput, InferOutput, InferResult
+from tritongrpcclient.core import PreparedInferRequest
+from tritongrpcclient.core import KeepAliveOptions
+from tritongrpcclient.core import _get_channel_options, _get_inference_request
+from tritongrpcclient.core import get_error_grpc
+from tritongrpcclient.utils import *
+from tritongrpcclient.utils import _ModelInfoCache
+
+
+def _get_metadata(headers):
+    """Returns the gRPC call metadata holding the specified headers.
+    """
+    if headers is not None:
+        return tuple(headers.items())
+    else:
+        return ()
+
+
+def _get_response(response, as_json):
+    """Returns the response message, converted to a JSON dict if
+    requested.
+    """
+    if as_json:
+        return json.loads(MessageToJson(response))
+    else:
+        return response
+
+
+class InferenceServerClient:
+    """An InferenceServerClient object is used to perform any kind of
+    communication with the InferenceServer using gRPC protocol from
+    within an asyncio event loop. All the methods communicating with
+    the server are coroutines, built on grpc.aio so that no thread is
+    used to wait for responses. Requires grpcio 1.32 or later.
+
+    Parameters
+    ----------
+    url : str
+        The inference server URL, e.g. 'localhost:8001'.
+    verbose : bool
+        If True generate verbose output. Default value is False.
+    model_cache_ttl : float
+        The time, in seconds, the model metadata and configuration
+        returned by the server are cached by the client. The cache is
+        invalidated when a model is loaded or unloaded through this
+        client. Default value is None which means no caching.
+    keepalive_options : KeepAliveOptions
+        The keepalive settings of the channel. Default value is None
+        which means the gRPC defaults are used.
+    max_send_message_length : int
+        The maximum size, in bytes, of a message sent to the server.
+        Default value is None which means no limit.
+    max_receive_message_length : int
+        The maximum size, in bytes, of a message received from the
+        server. Default value is None which means no limit.
+    stream_window_size : int
+        The fixed HTTP/2 flow control window, in bytes, of each call.
+        Default value is None which means the window is sized
+        dynamically by gRPC.
+    write_buffer_size : int
+        The size, in bytes, of the write buffer of the transport.
+        Default value is None which means the gRPC default is used.
+    channel_args : list
+        Additional gRPC channel arguments given as a list of
+        (key, value) tuples. Default value is None.
+
+    Raises
+    ------
+    Exception
+        If unable to create a client.
+
+    """
+
+    def __init__(self,
+                 url,
+                 verbose=False,
+                 model_cache_ttl=None,
+                 keepalive_options=None,
+                 max_send_message_length=None,
+                 max_receive_message_length=None,
+                 stream_window_size=None,
+                 write_buffer_size=None,
+                 channel_args=None):
+        channel_options = _get_channel_options(
+            keepalive_options=keepalive_options,
+            max_send_message_length=max_send_message_length,
+            max_receive_message_length=max_receive_message_length,
+            stream_window_size=stream_window_size,
+            write_buffer_size=write_buffer_size,
+            channel_args=channel_args)
+        self._channel = grpc.aio.insecure_channel(url,
+                                                  options=channel_options)
+        self._client_stub = grpc_service_v2_pb2_grpc.GRPCInferenceServiceStub(
+            self._channel)
+        self._verbose = verbose
+        self._model_cache = _ModelInfoCache(model_cache_ttl)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the client. Any future calls to server
+        will result in an Error.
+
+        """
+        await self._channel.close()
+
+    async def _call(self, rpc, request, headers):
+        """Issues the unary RPC with the specified request and returns
+        the response message.
+
+        Raises
+        ------
+        InferenceServerException
+            If the RPC fails.
+        """
+        try:
+            return await rpc(request=request, metadata=_get_metadata(headers))
+        except grpc.RpcError as rpc_error:
+            raise get_error_grpc(rpc_error) from None
+
+    async def is_server_live(self, headers=None):
+        """Contact the inference server and get liveness.
+
+        Parameters
+        ----------
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+
+        Returns
+        -------
+        bool
+            True if server is live, False if server is not live.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get liveness.
+
+        """
+        request = grpc_service_v2_pb2.ServerLiveRequest()
+        response = await self._call(self._client_stub.ServerLive, request,
+                                    headers)
+        return response.live
+
+    async def is_server_ready(self, headers=None):
+        """Contact the inference server and get readiness.
+
+        Parameters
+        ----------
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+
+        Returns
+        -------
+        bool
+            True if server is ready, False if server is not ready.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get readiness.
+
+        """
+        request = grpc_service_v2_pb2.ServerReadyRequest()
+        response = await self._call(self._client_stub.ServerReady, request,
+                                    headers)
+        return response.ready
+
+    async def is_model_ready(self, model_name, model_version="",
+                             headers=None):
+        """Contact the inference server and get the readiness of specified model.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model to check for readiness.
+        model_version: str
+            The version of the model to check for readiness. The default value
+            is an empty string which means then the server will choose a version
+            based on the model and internal policy.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+
+        Returns
+        -------
+        bool
+            True if the model is ready, False if not ready.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get model readiness.
+
+        """
+        request = grpc_service_v2_pb2.ModelReadyRequest(name=model_name,
+                                                        version=model_version)
+        response = await self._call(self._client_stub.ModelReady, request,
+                                    headers)
+        return response.ready
+
+    async def get_server_metadata(self, headers=None, as_json=False):
+        """Contact the inference server and get its metadata.
+
+        Parameters
+        ----------
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+        as_json : bool
+            If True then returns server metadata as a json dict,
+            otherwise as a protobuf message. Default value is False.
+
+        Returns
+        -------
+        dict or protobuf message
+            The JSON dict or ServerMetadataResponse message
+            holding the metadata.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get server metadata.
+
+        """
+        request = grpc_service_v2_pb2.ServerMetadataRequest()
+        response = await self._call(self._client_stub.ServerMetadata, request,
+                                    headers)
+        return _get_response(response, as_json)
+
+    async def get_model_metadata(self,
+                                 model_name,
+                                 model_version="",
+                                 headers=None,
+                                 as_json=False):
+        """Contact the inference server and get the metadata for specified model.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model
+        model_version: str
+            The version of the model to get metadata. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+        as_json : bool
+            If True then returns model metadata as a json dict, otherwise
+            as a protobuf message. Default value is False.
+
+        Returns
+        -------
+        dict or protobuf message
+            The JSON dict or ModelMetadataResponse message holding
+            the metadata.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get model metadata.
+
+        """
+        response = self._model_cache.get('metadata', model_name,
+                                         model_version)
+        if response is None:
+            request = grpc_service_v2_pb2.ModelMetadataRequest(
+                name=model_name, version=model_version)
+            response = await self._call(self._client_stub.ModelMetadata,
+                                        request, headers)
+            self._model_cache.put('metadata', model_name, model_version,
+                                  response)
+        return _get_response(response, as_json)
+
+    async def get_model_config(self,
+                               model_name,
+                               model_version="",
+                               headers=None,
+                               as_json=False):
+        """Contact the inference server and get the configuration for specified model.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model
+        model_version: str
+            The version of the model to get configuration. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+        as_json : bool
+            If True then returns configuration as a json dict, otherwise
+            as a protobuf message. Default value is False.
+
+        Returns
+        -------
+        dict or protobuf message
+            The JSON dict or ModelConfigResponse message holding
+            the metadata.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get model configuration.
+
+        """
+        response = self._model_cache.get('config', model_name, model_version)
+        if response is None:
+            request = grpc_service_v2_pb2.ModelConfigRequest(
+                name=model_name, version=model_version)
+            response = await self._call(self._client_stub.ModelConfig,
+                                        request, headers)
+            self._model_cache.put('config', model_name, model_version,
+                                  response)
+        return _get_response(response, as_json)
+
+    def invalidate_model_cache(self, model_name=None):
+        """Drop the cached metadata and configuration of the specified
+        model.
+
+        Parameters
+        ----------
+        model_name : str
+            The name of the model whose cached information, for all
+            versions, is to be dropped. The default value is None which
+            means the information of all the models is dropped.
+
+        """
+        self._model_cache.invalidate(model_name)
+
+    async def get_infer_inputs(self,
+                               model_name,
+                               model_version="",
+                               headers=None):
+        """Create InferInput objects for all the inputs of the specified
+        model, with the name, shape and datatype reported in the model
+        metadata.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model
+        model_version: str
+            The version of the model. The default value is an empty
+            string which means then the server will choose a version
+            based on the model and internal policy.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request if the metadata is
+            not cached.
+
+        Returns
+        -------
+        list
+            The InferInput objects in the order of the model metadata.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get model metadata.
+
+        """
+        model_metadata = await self.get_model_metadata(model_name,
+                                                       model_version, headers)
+        return [
+            InferInput(tensor.name, list(tensor.shape), tensor.datatype)
+            for tensor in model_metadata.inputs
+        ]
+
+    async def get_infer_outputs(self,
+                                model_name,
+                                model_version="",
+                                headers=None):
+        """Create InferOutput objects for all the outputs of the specified
+        model as reported in the model metadata.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model
+        model_version: str
+            The version of the model. The default value is an empty
+            string which means then the server will choose a version
+            based on the model and internal policy.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request if the metadata is
+            not cached.
+
+        Returns
+        -------
+        list
+            The InferOutput objects in the order of the model metadata.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get model metadata.
+
+        """
+        model_metadata = await self.get_model_metadata(model_name,
+                                                       model_version, headers)
+        return [InferOutput(tensor.name) for tensor in model_metadata.outputs]
+
+    async def get_model_repository_index(self, headers=None, as_json=False):
+        """Get the index of model repository contents
+
+        Parameters
+        ----------
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+        as_json : bool
+            If True then returns model repository index
+            as a json dict, otherwise as a protobuf message.
+            Default value is False.
+
+        Returns
+        -------
+        dict or protobuf message
+            The JSON dict or RepositoryIndexResponse message holding
+            the model repository index.
+
+        """
+        request = grpc_service_v2_pb2.RepositoryIndexRequest()
+        response = await self._call(self._client_stub.RepositoryIndex,
+                                    request, headers)
+        return _get_response(response, as_json)
+
+    async def load_model(self, model_name, headers=None):
+        """Request the inference server to load or reload specified model.
+
+        Parameters
+        ----------
+        model_name : str
+            The name of the model to be loaded.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to load the model.
+
+        """
+        request = grpc_service_v2_pb2.RepositoryModelLoadRequest(
+            model_name=model_name)
+        await self._call(self._client_stub.RepositoryModelLoad, request,
+                         headers)
+        self._model_cache.invalidate(model_name)
+
+    async def unload_model(self, model_name, headers=None):
+        """Request the inference server to unload specified model.
+
+        Parameters
+        ----------
+        model_name : str
+            The name of the model to be unloaded.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to unload the model.
+
+        """
+        request = grpc_service_v2_pb2.RepositoryModelUnloadRequest(
+            model_name=model_name)
+        await self._call(self._client_stub.RepositoryModelUnload, request,
+                         headers)
+        self._model_cache.invalidate(model_name)
+
+    async def get_inference_statistics(self,
+                                       model_name,
+                                       model_version="",
+                                       headers=None,
+                                       as_json=False):
+        """Get the inference statistics for the specified model name and
+        version.
+
+        Parameters
+        ----------
+        model_name : str
+            The name of the model to get inference statistics.
+        model_version: str
+            The version of the model to get inference statistics. The
+            default value is an empty string which means then the server
+            will return the statistics of all available model versions.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+        as_json : bool
+            If True then returns inference statistics
+            as a json dict, otherwise as a protobuf message.
+            Default value is False.
+
+        Returns
+        -------
+        dict or protobuf message
+            The JSON dict or ModelStatisticsResponse message holding
+            the inference statistics.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get the inference statistics.
+
+        """
+        request = grpc_service_v2_pb2.ModelStatisticsRequest(
+            name=model_name, version=model_version)
+        response = await self._call(self._client_stub.ModelStatistics,
+                                    request, headers)
+        return _get_response(response, as_json)
+
+    async def get_system_shared_memory_status(self,
+                                              region_name="",
+                                              headers=None,
+                                              as_json=False):
+        """Request system shared memory status from the server.
+
+        Parameters
+        ----------
+        region_name : str
+            The name of the region to query status. The default
+            value is an empty string, which means that the status
+            of all active system shared memory will be returned.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+        as_json : bool
+            If True then returns system shared memory status as a
+            json dict, otherwise as a protobuf message. Default
+            value is False.
+
+        Returns
+        -------
+        dict or protobuf message
+            The JSON dict or SystemSharedMemoryStatusResponse message holding
+            the system shared memory status.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get the status of specified shared memory.
+
+        """
+        request = grpc_service_v2_pb2.SystemSharedMemoryStatusRequest(
+            name=region_name)
+        response = await self._call(self._client_stub.SystemSharedMemoryStatus,
+                                    request, headers)
+        return _get_response(response, as_json)
+
+    async def register_system_shared_memory(self,
+                                            name,
+                                            key,
+                                            byte_size,
+                                            offset=0,
+                                            headers=None):
+        """Request the server to register a system shared memory with the
+        following specification.
+
+        Parameters
+        ----------
+        name : str
+            The name of the region to register.
+        key : str
+            The key of the underlying memory object that contains the
+            system shared memory region.
+        byte_size : int
+            The size of the system shared memory region, in bytes.
+        offset : int
+            Offset, in bytes, within the underlying memory object to
+            the start of the system shared memory region. The default
+            value is zero.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to register the specified system shared memory.
+
+        """
+        request = grpc_service_v2_pb2.SystemSharedMemoryRegisterRequest(
+            name=name, key=key, offset=offset, byte_size=byte_size)
+        await self._call(self._client_stub.SystemSharedMemoryRegister,
+                         request, headers)
+
+    async def unregister_system_shared_memory(self, name="", headers=None):
+        """Request the server to unregister a system shared memory with the
+        specified name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the region to unregister. The default value is empty
+            string which means all the system shared memory regions will be
+            unregistered.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to unregister the specified system shared memory region.
+
+        """
+        request = grpc_service_v2_pb2.SystemSharedMemoryUnregisterRequest(
+            name=name)
+        await self._call(self._client_stub.SystemSharedMemoryUnregister,
+                         request, headers)
+
+    async def get_cuda_shared_memory_status(self,
+                                            region_name="",
+                                            headers=None,
+                                            as_json=False):
+        """Request cuda shared memory status from the server.
+
+        Parameters
+        ----------
+        region_name : str
+            The name of the region to query status. The default
+            value is an empty string, which means that the status
+            of all active cuda shared memory will be returned.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+        as_json : bool
+            If True then returns cuda shared memory status as a
+            json dict, otherwise as a protobuf message. Default
+            value is False.
+
+        Returns
+        -------
+        dict or protobuf message
+            The JSON dict or CudaSharedMemoryStatusResponse message holding
+            the cuda shared memory status.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get the status of specified shared memory.
+
+        """
+        request = grpc_service_v2_pb2.CudaSharedMemoryStatusRequest(
+            name=region_name)
+        response = await self._call(self._client_stub.CudaSharedMemoryStatus,
+                                    request, headers)
+        return _get_response(response, as_json)
+
+    async def register_cuda_shared_memory(self,
+                                          name,
+                                          raw_handle,
+                                          device_id,
+                                          byte_size,
+                                          headers=None):
+        """Request the server to register a cuda shared memory with the
+        following specification.
+
+        Parameters
+        ----------
+        name : str
+            The name of the region to register.
+        raw_handle : bytes
+            The raw serialized cudaIPC handle in base64 encoding.
+        device_id : int
+            The GPU device ID on which the cudaIPC handle was created.
+        byte_size : int
+            The size of the cuda shared memory region, in bytes.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to register the specified cuda shared memory.
+
+        """
+        request = grpc_service_v2_pb2.CudaSharedMemoryRegisterRequest(
+            name=name,
+            raw_handle=base64.b64decode(raw_handle),
+            device_id=device_id,
+            byte_size=byte_size)
+        await self._call(self._client_stub.CudaSharedMemoryRegister, request,
+                         headers)
+
+    async def unregister_cuda_shared_memory(self, name="", headers=None):
+        """Request the server to unregister a cuda shared memory with the
+        specified name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the region to unregister. The default value is empty
+            string which means all the cuda shared memory regions will be
+            unregistered.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to unregister the specified cuda shared memory region.
+
+        """
+        request = grpc_service_v2_pb2.CudaSharedMemoryUnregisterRequest(
+            name=name)
+        await self._call(self._client_stub.CudaSharedMemoryUnregister,
+                         request, headers)
+
+    async def infer(self,
+                    model_name,
+                    inputs,
+                    model_version="",
+                    outputs=None,
+                    request_id=None,
+                    sequence_id=0,
+                    sequence_start=False,
+                    sequence_end=False,
+                    headers=None):
+        """Run inference using the supplied 'inputs' requesting the
+        outputs specified by 'outputs'. Many calls can be awaited
+        concurrently on the same client.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model to run inference.
+        inputs : list
+            A list of InferInput objects, each describing data for a input
+            tensor required by the model.
+        model_version: str
+            The version of the model to run inference. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        outputs : list
+            A list of InferOutput objects, each describing how the output
+            data must be returned. If not specified all outputs produced
+            by the model will be returned using default settings.
+        request_id: str
+            Optional identifier for the request. If specified will be returned
+            in the response. Default value is 'None' which means no request_id
+            will be used.
+        sequence_id : int
+            The unique identifier for the sequence being represented by the
+            object. Default value is 0 which means that the request does not
+            belong to a sequence.
+        sequence_start: bool
+            Indicates whether the request being added marks the start of the
+            sequence. Default value is False. This argument is ignored if
+            'sequence_id' is 0.
+        sequence_end: bool
+            Indicates whether the request being added marks the end of the
+            sequence. Default value is False. This argument is ignored if
+            'sequence_id' is 0.
+        headers: dict
+            Optional dictionary specifying additional HTTP headers to include
+            in the request.
+
+        Returns
+        -------
+        InferResult
+            The object holding the result of the inference, including the
+            statistics.
+
+        Raises
+        ------
+        InferenceServerException
+            If server fails to perform inference.
+        """
+        request = _get_inference_request(model_name=model_name,
+                                         inputs=inputs,
+                                         model_version=model_version,
+                                         request_id=request_id,
+                                         outputs=outputs,
+                                         sequence_id=sequence_id,
+                                         sequence_start=sequence_start,
+                                         sequence_end=sequence_end)
+        response = await self._call(self._client_stub.ModelInfer, request,
+                                    headers)
+        return InferResult(response)
+
+    def prepare_infer_request(self,
+                              model_name,
+                              inputs,
+                              model_version="",
+                              outputs=None):
+        """Build the inference request for the specified model, inputs
+        and outputs once so that it can be sent many times with
+        infer_prepared(), only swapping the input data between calls.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model to run inference.
+        inputs : list
+            A list of InferInput objects, each describing an input tensor
+            required by the model. Their data, if set, and parameters are
+            copied into the prepared request.
+        model_version: str
+            The version of the model to run inference. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        outputs : list
+            A list of InferOutput objects, each describing how the output
+            data must be returned. If not specified all outputs produced
+            by the model will be returned using default settings.
+
+        Returns
+        -------
+        PreparedInferRequest
+            The prepared request.
+
+        """
+        return PreparedInferRequest(model_name=model_name,
+                                    inputs=inputs,
+                                    model_version=model_version,
+                                    outputs=outputs)
+
+    async def infer_prepared(self,
+                             prepared_request,
+                             request_id=None,
+                             sequence_id=0,
+                             sequence_start=False,
+                             sequence_end=False,
+                             headers=None):
+        """Run inference using the prepared request. The prepared
+        request must not be updated until the call completes, use one
+        prepared request per concurrent call.
+
+        Parameters
+        ----------
+        prepared_request : PreparedInferRequest
+            The request returned by prepare_infer_request(), holding the
+            input data to use.
+        request_id: str
+            Optional identifier for the request. If specified will be returned
+            in the response. Default value is 'None' which means no request_id
+            will be used.
+        sequence_id : int
+            The unique identifier for the sequence being represented by the
+            object. Default value is 0 which means that the request does not
+            belong to a sequence.
+        sequence_start: bool
+            Indicates whether the request being added marks the start of the
+            sequence. Default value is False. This argument is ignored if
+            'sequence_id' is 0.
+        sequence_end: bool
+            Indicates whether the request being added marks the end of the
+            sequence. Default value is False. This argument is ignored if
+            'sequence_id' is 0.
+        headers: dict
+            Optional dictionary specifying additional HTTP headers to include
+            in the request.
+
+        Returns
+        -------
+        InferResult
+            The object holding the result of the inference, including the
+            statistics.
+
+        Raises
+        ------
+        InferenceServerException
+            If server fails to perform inference.
+        """
+        request = prepared_request._get_request(request_id=request_id,
+                                                sequence_id=sequence_id,
+                                                sequence_start=sequence_start,
+                                                sequence_end=sequence_end)
+        response = await self._call(self._client_stub.ModelInfer, request,
+                                    headers)
+        return InferResult(response)
+
+    def stream_infer(self, requests, headers=None):
+        """Run inference over the gRPC bi-directional streaming API. The
+        requests are consumed from the async iterable 'requests' while
+        the responses are produced by the returned async iterator, so
+        both sides of the stream are driven by the event loop.
+
+        Parameters
+        ----------
+        requests : async iterable
+            The requests to send on the stream, e.g. an async generator.
+            Each request is a dict holding the keyword arguments of
+            infer() other than 'headers': 'model_name' and 'inputs' and
+            optionally 'model_version', 'outputs', 'request_id',
+            'sequence_id', 'sequence_start' and 'sequence_end'. The
+            stream is half-closed once the iterable is exhausted.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include while establishing the gRPC stream.
+
+        Returns
+        -------
+        async iterator
+            The iterator yielding a (result, error) tuple for each
+            response received on the stream, in the order they are
+            received. 'result' is the InferResult of a successful
+            inference and None otherwise, 'error' is None for a
+            successful inference and the InferenceServerException
+            otherwise. An error of the stream itself is yielded last.
+
+        """
+
+        async def request_iterator():
+            async for request in requests:
+                yield _get_inference_request(
+                    model_name=request['model_name'],
+                    inputs=request['inputs'],
+                    model_version=request.get('model_version', ""),
+                    request_id=request.get('request_id'),
+                    outputs=request.get('outputs'),
+                    sequence_id=request.get('sequence_id', 0),
+                    sequence_start=request.get('sequence_start', False),
+                    sequence_end=request.get('sequence_end', False))
+
+        async def response_iterator(call):
+            try:
+                async for response in call:
+                    if not response.error_message:
+                        yield InferResult(response.infer_response), None
+                    else:
+                        yield None, InferenceServerException(
+                            msg=response.error_message)
+            except grpc.RpcError as rpc_error:
+                yield None, get_error_grpc(rpc_error)
+            finally:
+                call.cancel()
+
+        call = self._client_stub.ModelStreamInfer(
+            request_iterator(), metadata=_get_metadata(headers))
+        return response_iterator(call)
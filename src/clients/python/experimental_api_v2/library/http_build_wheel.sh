@@ -48,6 +48,9 @@ function main() {
   cp httpclient.py \
     "${WHLDIR}/tritonhttpclient/core.py"
 
+  cp httpclient_aio.py \
+    "${WHLDIR}/tritonhttpclient/aio.py"
+
   cp utils.py \
     "${WHLDIR}/tritonhttpclient/."
 
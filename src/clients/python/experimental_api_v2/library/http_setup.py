@@ -37,6 +37,10 @@ REQUIRED = [
     'numpy', 'geventhttpclient', 'python-rapidjson'
 ]
 
+EXTRAS_REQUIRED = {
+    'aio': ['aiohttp'],
+}
+
 try:
     from wheel.bdist_wheel import bdist_wheel as _bdist_wheel
 
@@ -64,6 +68,7 @@ setup(
     keywords='triton inference server service client',
     packages=find_packages(),
     install_requires=REQUIRED,
+    extras_require=EXTRAS_REQUIRED,
     zip_safe=False,
     cmdclass={'bdist_wheel': bdist_wheel},
 )
@@ -29,10 +29,17 @@ from geventhttpclient.url import URL
 
 from urllib.parse import quote, quote_plus
 import rapidjson as json
+import gzip
+import time
+import zlib
 import numpy as np
+import gevent
 import gevent.pool
 
 from tritonhttpclient.utils import *
+from tritonhttpclient.utils import _ModelInfoCache
+from tritonhttpclient.utils import _RetryStatistics, _call_with_retries
+from tritonhttpclient.utils import _get_deadline_exceeded_error
 
 
 def _get_error(response):
@@ -57,6 +64,89 @@ def _raise_if_error(response):
         raise error
 
 
+# The size of the chunks in which binary output data is read from the
+# socket into the output buffers.
+_READ_CHUNK_SIZE = 256 * 1024
+
+
+def _read_into(response, view):
+    """Reads exactly len(view) bytes of the response body into the
+    writable memoryview 'view', one chunk at a time.
+    """
+    offset = 0
+    size = len(view)
+    while offset < size:
+        chunk = response.read(min(size - offset, _READ_CHUNK_SIZE))
+        if not chunk:
+            raise_error("connection closed before the end of the response")
+        view[offset:offset + len(chunk)] = chunk
+        offset += len(chunk)
+
+
+def _get_output_buffer(output_buffers, name, datatype, shape, size):
+    """Returns the numpy array the binary data of the output must be
+    read into, either supplied by the caller or newly allocated.
+    """
+    np_dtype = triton_to_np_dtype(datatype)
+    if output_buffers is None:
+        buffer = None
+    elif isinstance(output_buffers, OutputBufferPool):
+        buffer = output_buffers.get(datatype, shape)
+    else:
+        buffer = output_buffers.get(name)
+    if buffer is None:
+        buffer = np.empty(shape, dtype=np_dtype)
+    elif buffer.dtype != np_dtype:
+        raise_error("buffer for output '" + name + "' has data type " +
+                    str(buffer.dtype) + ", expected " + str(np_dtype))
+    elif not (buffer.flags['C_CONTIGUOUS'] and buffer.flags['WRITEABLE']):
+        raise_error("buffer for output '" + name +
+                    "' must be a writable C-contiguous array")
+    if buffer.nbytes != size:
+        raise_error("buffer for output '" + name + "' holds " +
+                    str(buffer.nbytes) + " bytes, expected " + str(size))
+
+    return buffer.reshape(shape)
+
+
+def _get_inference_request(inputs, request_id, outputs, parameters):
+    """Builds the body of an inference request. The body consists of a
+    JSON header optionally followed by the raw binary data of the inputs
+    that requested binary transfer.
+
+    Returns
+    -------
+    (bytes or str, int)
+        The request body and the size of the JSON header in bytes if
+        the body carries binary data, None otherwise.
+    """
+    infer_request = {}
+    if request_id:
+        infer_request['id'] = request_id
+    if parameters:
+        infer_request['parameters'] = parameters
+    infer_request['inputs'] = [
+        this_input._get_tensor() for this_input in inputs
+    ]
+    if outputs:
+        infer_request['outputs'] = [
+            this_output._get_tensor() for this_output in outputs
+        ]
+
+    request_body = json.dumps(infer_request)
+    binary_data = []
+    for this_input in inputs:
+        raw_data = this_input._get_binary_data()
+        if raw_data is not None:
+            binary_data.append(raw_data)
+    if not binary_data:
+        return request_body, None
+
+    request_body = request_body.encode('utf-8')
+    json_size = len(request_body)
+    return b''.join([request_body] + binary_data), json_size
+
+
 def _get_query_string(query_params):
     params = []
     for key, value in query_params.items():
@@ -92,9 +182,34 @@ class InferenceServerClient:
         If True generate verbose output. Default value is False.
     max_greenlets : int
         Determines the maximum allowed number of worker greenlets
-        for handling asynchronous inference requests. Default value
-        is None, which means there will be no restriction on the
-        number of greenlets created.
+        for handling asynchronous inference requests, i.e. the maximum
+        number of asynchronous inference requests that can be in flight
+        at once. Once the limit is reached async_infer() blocks or
+        raises, see async_infer(). Default value is None, which means
+        there will be no restriction on the number of greenlets created.
+    model_cache_ttl : float
+        The time, in seconds, the model metadata and configuration
+        returned by the server are cached by the client. The cache is
+        invalidated when a model is loaded or unloaded through this
+        client. Default value is None which means no caching.
+    compression_threshold : int
+        The minimum size, in bytes, of an inference request body for it
+        to be compressed when compression is requested in infer() or
+        async_infer(). Smaller bodies are sent uncompressed. Default
+        value is 1024.
+    compression_level : int
+        The compression level, from 1 (fastest) to 9 (smallest), used
+        to compress inference request bodies. Default value is 6.
+    retry_policy : RetryPolicy
+        The policy used by infer() to retry requests that fail because
+        the server could not be reached or the connection was reset.
+        Default value is None which means requests are not retried.
+    hedge_delay : float
+        The time, in seconds, infer() waits for the response before
+        sending the same request again on another connection and
+        returning whichever response arrives first. Hedging requires
+        'connection_count' to be greater than 1. Default value is None
+        which means requests are not hedged.
 
     Raises
         ------
@@ -109,7 +224,12 @@ class InferenceServerClient:
                  connection_timeout=60.0,
                  network_timeout=60.0,
                  verbose=False,
-                 max_greenlets=None):
+                 max_greenlets=None,
+                 model_cache_ttl=None,
+                 compression_threshold=1024,
+                 compression_level=6,
+                 retry_policy=None,
+                 hedge_delay=None):
         self._last_request_id = None
         self._parsed_url = URL("http://" + url)
         self._client_stub = HTTPClient.from_url(
@@ -119,6 +239,25 @@ class InferenceServerClient:
             network_timeout=network_timeout)
         self._pool = gevent.pool.Pool(max_greenlets)
         self._verbose = verbose
+        self._model_cache = _ModelInfoCache(model_cache_ttl)
+        self._compression_threshold = compression_threshold
+        self._compression_level = compression_level
+        self._compression_stats = {
+            'compressed_request_count': 0,
+            'uncompressed_request_bytes': 0,
+            'compressed_request_bytes': 0,
+            'compression_time_s': 0.0,
+            'decompressed_response_count': 0,
+            'compressed_response_bytes': 0,
+            'decompressed_response_bytes': 0,
+            'decompression_time_s': 0.0
+        }
+        self._retry_policy = retry_policy
+        self._hedge_delay = hedge_delay
+        self._retry_stats = _RetryStatistics()
+        if (hedge_delay is not None) and (connection_count < 2):
+            raise_error(
+                "hedge_delay requires connection_count to be at least 2")
 
     def __enter__(self):
         return self
@@ -197,6 +336,140 @@ class InferenceServerClient:
 
         return response
 
+    def _prepare_infer(self, inputs, request_id, outputs, parameters,
+                       headers, request_compression_algorithm,
+                       response_compression_algorithm):
+        """Builds the body and the headers of an inference request,
+        compressing the body if requested.
+
+        Returns
+        -------
+        (bytes or str, dict)
+            The request body and the request headers.
+        """
+        request_body, json_size = _get_inference_request(
+            inputs=inputs,
+            request_id=request_id,
+            outputs=outputs,
+            parameters=parameters)
+        if (json_size is not None) or request_compression_algorithm or \
+                response_compression_algorithm:
+            headers = {} if headers is None else dict(headers)
+        if json_size is not None:
+            headers["Inference-Header-Content-Length"] = str(json_size)
+        if request_compression_algorithm:
+            request_body, compressed = self._compress(
+                request_body, request_compression_algorithm)
+            if compressed:
+                headers["Content-Encoding"] = request_compression_algorithm
+        if response_compression_algorithm:
+            if response_compression_algorithm not in ('gzip', 'deflate'):
+                raise_error("unsupported compression algorithm '" +
+                            response_compression_algorithm + "'")
+            headers["Accept-Encoding"] = response_compression_algorithm
+
+        return request_body, headers
+
+    def _compress(self, request_body, algorithm):
+        """Compresses the request body with the specified algorithm if
+        it is at least 'compression_threshold' bytes.
+
+        Returns
+        -------
+        (bytes or str, bool)
+            The request body and whether it was compressed.
+        """
+        if algorithm not in ('gzip', 'deflate'):
+            raise_error("unsupported compression algorithm '" + algorithm +
+                        "'")
+        if isinstance(request_body, str):
+            request_body = request_body.encode('utf-8')
+        if len(request_body) < self._compression_threshold:
+            return request_body, False
+
+        start_time = time.perf_counter()
+        if algorithm == 'gzip':
+            compressed_body = gzip.compress(
+                request_body, compresslevel=self._compression_level)
+        else:
+            compressed_body = zlib.compress(request_body,
+                                            self._compression_level)
+        stats = self._compression_stats
+        stats['compression_time_s'] += time.perf_counter() - start_time
+        stats['compressed_request_count'] += 1
+        stats['uncompressed_request_bytes'] += len(request_body)
+        stats['compressed_request_bytes'] += len(compressed_body)
+
+        return compressed_body, True
+
+    def _get_infer_result(self, response, output_buffers=None):
+        """Creates the InferResult from the inference response. The
+        binary data of uncompressed responses is read from the socket
+        directly into the output buffers, compressed responses are read
+        and decompressed as a whole.
+        """
+        encoding = response.get('Content-Encoding')
+        header_length = response.get('Inference-Header-Content-Length')
+        if (not encoding) and (header_length is not None):
+            return InferResult.from_response_stream(response, header_length,
+                                                    output_buffers)
+
+        body = response.read()
+        if encoding in ('gzip', 'deflate'):
+            start_time = time.perf_counter()
+            if encoding == 'gzip':
+                decompressed_body = gzip.decompress(body)
+            else:
+                decompressed_body = zlib.decompress(body)
+            stats = self._compression_stats
+            stats['decompression_time_s'] += time.perf_counter() - start_time
+            stats['decompressed_response_count'] += 1
+            stats['compressed_response_bytes'] += len(body)
+            stats['decompressed_response_bytes'] += len(decompressed_body)
+            body = decompressed_body
+        elif encoding:
+            raise_error("unsupported response encoding '" + encoding + "'")
+
+        return InferResult.from_response_body(
+            body, response.get('Inference-Header-Content-Length'))
+
+    def get_compression_statistics(self):
+        """Get the statistics of the compression of inference request
+        bodies and of the decompression of inference response bodies.
+
+        Returns
+        -------
+        dict
+            The JSON dict holding the number of compressed requests and
+            decompressed responses, their sizes before and after
+            compression, the resulting compression ratios and the
+            cumulative time, in seconds, spent compressing and
+            decompressing.
+        """
+        stats = dict(self._compression_stats)
+        stats['request_compression_ratio'] = (
+            stats['uncompressed_request_bytes'] /
+            stats['compressed_request_bytes']
+        ) if stats['compressed_request_bytes'] else None
+        stats['response_compression_ratio'] = (
+            stats['decompressed_response_bytes'] /
+            stats['compressed_response_bytes']
+        ) if stats['compressed_response_bytes'] else None
+        return stats
+
+    def get_retry_statistics(self):
+        """Get the number of retries, hedges and missed deadlines of
+        the requests sent by infer().
+
+        Returns
+        -------
+        dict
+            The dict holding 'retry_count', 'hedges_fired', the number
+            of hedged requests sent, 'hedges_won', the number of hedged
+            requests that answered first, and 'deadline_exceeded_count'.
+        """
+        return self._retry_stats.get()
+
     def is_server_live(self, headers=None, query_params=None):
         """Contact the inference server and get liveness.
 
@@ -367,6 +640,10 @@ class InferenceServerClient:
             If unable to get model metadata.
 
         """
+        metadata = self._model_cache.get('metadata', model_name, model_version)
+        if metadata is not None:
+            return metadata
+
         if not model_version:
             request_uri = "v2/models/{}".format(quote(model_name))
         else:
@@ -378,6 +655,7 @@ class InferenceServerClient:
                              query_params=query_params)
         _raise_if_error(response)
         metadata = json.loads(response.read())
+        self._model_cache.put('metadata', model_name, model_version, metadata)
 
         return metadata
 
@@ -415,6 +693,10 @@ class InferenceServerClient:
             If unable to get model configuration.
 
         """
+        config = self._model_cache.get('config', model_name, model_version)
+        if config is not None:
+            return config
+
         if not model_version:
             request_uri = "v2/models/{}/config".format(quote(model_name))
         else:
@@ -426,9 +708,107 @@ class InferenceServerClient:
                              query_params=query_params)
         _raise_if_error(response)
         config = json.loads(response.read())
+        self._model_cache.put('config', model_name, model_version, config)
 
         return config
 
+    def invalidate_model_cache(self, model_name=None):
+        """Drop the cached metadata and configuration of the specified
+        model.
+
+        Parameters
+        ----------
+        model_name : str
+            The name of the model whose cached information, for all
+            versions, is to be dropped. The default value is None which
+            means the information of all the models is dropped.
+
+        """
+        self._model_cache.invalidate(model_name)
+
+    def get_infer_inputs(self,
+                         model_name,
+                         model_version="",
+                         headers=None,
+                         query_params=None):
+        """Create InferInput objects for all the inputs of the specified
+        model, with the name, shape and datatype reported in the model
+        metadata. Dimensions of variable size are reported as -1 and
+        are set along with the data by InferInput.set_data_from_numpy.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model
+        model_version: str
+            The version of the model. The default value is an empty
+            string which means then the server will choose a version
+            based on the model and internal policy.
+        headers: dict
+            Optional dictionary specifying additional HTTP headers to
+            include in the request if the metadata is not cached.
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction if the metadata is not cached.
+
+        Returns
+        -------
+        list
+            The InferInput objects in the order of the model metadata.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get model metadata.
+
+        """
+        model_metadata = self.get_model_metadata(model_name, model_version,
+                                                 headers, query_params)
+        return [
+            InferInput(tensor['name'], tensor['shape'], tensor['datatype'])
+            for tensor in model_metadata['inputs']
+        ]
+
+    def get_infer_outputs(self,
+                          model_name,
+                          model_version="",
+                          headers=None,
+                          query_params=None):
+        """Create InferOutput objects for all the outputs of the specified
+        model as reported in the model metadata.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model
+        model_version: str
+            The version of the model. The default value is an empty
+            string which means then the server will choose a version
+            based on the model and internal policy.
+        headers: dict
+            Optional dictionary specifying additional HTTP headers to
+            include in the request if the metadata is not cached.
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction if the metadata is not cached.
+
+        Returns
+        -------
+        list
+            The InferOutput objects in the order of the model metadata.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get model metadata.
+
+        """
+        model_metadata = self.get_model_metadata(model_name, model_version,
+                                                 headers, query_params)
+        return [
+            InferOutput(tensor['name']) for tensor in model_metadata['outputs']
+        ]
+
     def get_model_repository_index(self, headers=None, query_params=None):
         """Get the index of model repository contents
 
@@ -487,6 +867,7 @@ class InferenceServerClient:
                               headers=headers,
                               query_params=query_params)
         _raise_if_error(response)
+        self._model_cache.invalidate(model_name)
 
     def unload_model(self, model_name, headers=None, query_params=None):
         """Request the inference server to unload specified model.
@@ -514,6 +895,7 @@ class InferenceServerClient:
                               headers=headers,
                               query_params=query_params)
         _raise_if_error(response)
+        self._model_cache.invalidate(model_name)
 
     def get_system_shared_memory_status(self,
                                         region_name="",
@@ -788,7 +1170,11 @@ class InferenceServerClient:
               request_id=None,
               parameters=None,
               headers=None,
-              query_params=None):
+              query_params=None,
+              request_compression_algorithm=None,
+              response_compression_algorithm=None,
+              output_buffers=None,
+              client_timeout=None):
         """Run synchronous inference using the supplied 'inputs' requesting
         the outputs specified by 'outputs'.
 
@@ -819,6 +1205,34 @@ class InferenceServerClient:
         query_params: dict
             Optional url query parameters to use in network
             transaction.
+        request_compression_algorithm : str
+            Optional HTTP compression algorithm to use for the request
+            body, either 'gzip' or 'deflate'. Bodies smaller than the
+            client's 'compression_threshold' are sent uncompressed.
+            Default value is None which means no compression.
+        response_compression_algorithm : str
+            Optional HTTP compression algorithm the server may use for
+            the response body, either 'gzip' or 'deflate'. Compressed
+            responses are decompressed transparently. Default value is
+            None which means no compression.
+        output_buffers : dict or OutputBufferPool
+            Optional numpy arrays the binary data of the outputs is read
+            into, either as a dict mapping output names to arrays or as
+            an OutputBufferPool. Each array must be writable, C-contiguous
+            and match the data type and size of its output. Outputs
+            without a supplied array are read into newly allocated
+            arrays. BYTES outputs are always decoded into new arrays.
+            When the request is hedged or has a 'client_timeout', the
+            data is read into new arrays and only the data of the
+            returned result is copied into the supplied arrays.
+            Default value is None.
+        client_timeout : float
+            The maximum time, in seconds, to wait for the result, including
+            the retries and hedged requests. A request still in flight when
+            the time elapses completes in the background, as interrupting
+            it would leave its connection unusable. Default value is None
+            which means the wait is only bounded by the 'network_timeout'
+            of the client.
 
         Returns
         -------
@@ -829,48 +1243,127 @@ class InferenceServerClient:
         Raises
         ------
         InferenceServerException
-            If server fails to perform inference.
+            If server fails to perform inference or if the result is not
+            received within 'client_timeout'.
         """
-        infer_request = {}
-        if request_id:
-            infer_request['id'] = request_id
-        if parameters:
-            infer_request['parameters'] = parameters
-        infer_request['inputs'] = [
-            this_input._get_tensor() for this_input in inputs
-        ]
-        if outputs:
-            infer_request['outputs'] = [
-                this_output._get_tensor() for this_output in outputs
-            ]
+        request_body, headers = self._prepare_infer(
+            inputs=inputs,
+            request_id=request_id,
+            outputs=outputs,
+            parameters=parameters,
+            headers=headers,
+            request_compression_algorithm=request_compression_algorithm,
+            response_compression_algorithm=response_compression_algorithm)
 
-        request_body = json.dumps(infer_request)
         if not model_version:
             request_uri = "v2/models/{}/infer".format(quote(model_name))
         else:
             request_uri = "v2/models/{}/versions/{}/infer".format(
                 quote(model_name), model_version)
 
+        return _call_with_retries(
+            lambda timeout: self._infer_attempt(
+                request_uri, request_body, headers, query_params,
+                output_buffers, timeout),
+            self._retry_policy,
+            client_timeout,
+            self._retry_stats,
+            sleep=gevent.sleep)
+
+    def _infer_once(self, request_uri, request_body, headers, query_params,
+                    output_buffers):
+        """Sends the inference request and returns the result.
+        """
         response = self._post(request_uri=request_uri,
                               request_body=request_body,
                               headers=headers,
                               query_params=query_params)
-        result = InferResult(response.read())
+        _raise_if_error(response)
+        result = self._get_infer_result(response, output_buffers)
 
         return result
 
+    def _infer_attempt(self, request_uri, request_body, headers,
+                       query_params, output_buffers, timeout):
+        """Sends the inference request once, or twice if it is hedged,
+        and returns the first successful result. Requests that lose the
+        race or miss the deadline are left to complete in their greenlet.
+        """
+        if (timeout is None) and (self._hedge_delay is None):
+            return self._infer_once(request_uri, request_body, headers,
+                                    query_params, output_buffers)
+
+        # A request left to complete in its greenlet must not write into
+        # the arrays of the caller, so each request reads into its own
+        # arrays and the data of the returned result is copied. The pool
+        # hands each request its own arrays.
+        if isinstance(output_buffers, OutputBufferPool):
+            attempt_buffers = output_buffers
+        else:
+            attempt_buffers = None
+
+        def infer_once(buffers):
+            try:
+                return self._infer_once(request_uri, request_body, headers,
+                                        query_params, buffers), None
+            except Exception as error:
+                return None, error
+
+        deadline = None
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+        greenlets = [gevent.spawn(infer_once, attempt_buffers)]
+        if self._hedge_delay is not None:
+            wait_time = self._hedge_delay
+            if timeout is not None:
+                wait_time = min(wait_time, timeout)
+            if not gevent.wait(greenlets, timeout=wait_time) and (
+                (deadline is None) or (time.monotonic() < deadline)):
+                self._retry_stats.increment('hedges_fired')
+                greenlets.append(gevent.spawn(infer_once, attempt_buffers))
+
+        first_error = None
+        pending = list(greenlets)
+        while pending:
+            wait_time = None
+            if deadline is not None:
+                wait_time = max(0, deadline - time.monotonic())
+            ready = gevent.wait(pending, timeout=wait_time, count=1)
+            if not ready:
+                raise _get_deadline_exceeded_error()
+            for greenlet in ready:
+                pending.remove(greenlet)
+                result, error = greenlet.value
+                if error is None:
+                    if greenlet is not greenlets[0]:
+                        self._retry_stats.increment('hedges_won')
+                    if output_buffers and (attempt_buffers is None):
+                        result._copy_outputs_into(output_buffers)
+                    return result
+                # Report the error of the first request, the hedged
+                # request only makes a difference when it succeeds.
+                if (first_error is None) or (greenlet is greenlets[0]):
+                    first_error = error
+        raise first_error
+
     def async_infer(self,
                     model_name,
                     inputs,
-                    callback,
+                    callback=None,
                     model_version="",
                     request_id=None,
                     outputs=None,
                     parameters=None,
                     headers=None,
-                    query_params=None):
+                    query_params=None,
+                    block=True,
+                    request_compression_algorithm=None,
+                    response_compression_algorithm=None,
+                    output_buffers=None):
         """Run asynchronous inference using the supplied 'inputs' requesting
-        the outputs specified by 'outputs'.
+        the outputs specified by 'outputs'. If 'max_greenlets' requests are
+        already in flight the call waits for one of them to complete, or
+        raises if 'block' is False.
 
         Parameters
         ----------
@@ -880,12 +1373,14 @@ class InferenceServerClient:
             A list of InferInput objects, each describing data for a input
             tensor required by the model.
         callback : function
-            Python function that is invoked once the request is completed.
-            The function must reserve the last two arguments (result, error)
-            to hold InferResult and InferenceServerException objects
-            respectively which will be provided to the function when executing
-            the callback. The ownership of these objects will be given to the
-            user. The 'error' would be None for a successful inference.
+            Optional Python function that is invoked once the request is
+            completed. The function must reserve the last two arguments
+            (result, error) to hold InferResult and InferenceServerException
+            objects respectively which will be provided to the function when
+            executing the callback. The ownership of these objects will be
+            given to the user. The 'error' would be None for a successful
+            inference. Default value is None which means the result must
+            be retrieved from the returned InferAsyncRequest.
         model_version: str
             The version of the model to run inference. The default value
             is an empty string which means then the server will choose
@@ -906,46 +1401,203 @@ class InferenceServerClient:
         query_params: dict
             Optional url query parameters to use in network
             transaction.
+        block : bool
+            If True wait for an in-flight request to complete when the
+            'max_greenlets' limit is reached, otherwise raise. Default
+            value is True.
+        request_compression_algorithm : str
+            Optional HTTP compression algorithm to use for the request
+            body, either 'gzip' or 'deflate'. Bodies smaller than the
+            client's 'compression_threshold' are sent uncompressed.
+            Default value is None which means no compression.
+        response_compression_algorithm : str
+            Optional HTTP compression algorithm the server may use for
+            the response body, either 'gzip' or 'deflate'. Compressed
+            responses are decompressed transparently. Default value is
+            None which means no compression.
+        output_buffers : dict or OutputBufferPool
+            Optional numpy arrays the binary data of the outputs is read
+            into, either as a dict mapping output names to arrays or as
+            an OutputBufferPool. Each array must be writable, C-contiguous
+            and match the data type and size of its output. Outputs
+            without a supplied array are read into newly allocated
+            arrays. BYTES outputs are always decoded into new arrays.
+            Default value is None.
+
+        Returns
+        -------
+        InferAsyncRequest
+            The handle to the in-flight request that can be used to
+            retrieve its result or cancel it.
 
         Raises
         ------
         InferenceServerException
-            If server fails to issue inference.
+            If server fails to issue inference or if 'block' is False
+            and the limit of in-flight requests is reached.
         """
 
-        def wrapped_post(request_uri, request_body, headers, query_params):
-            return self._post(request_uri, request_body, headers, query_params)
-
-        def wrapped_callback(response):
-            callback(result=InferResult(response.read()),
-                     error=_get_error(response))
-
-        infer_request = {}
-        if request_id:
-            infer_request['id'] = request_id
-        if parameters:
-            infer_request['parameters'] = parameters
-        infer_request['inputs'] = [
-            this_input._get_tensor() for this_input in inputs
-        ]
-        if outputs:
-            infer_request['outputs'] = [
-                this_output._get_tensor() for this_output in outputs
-            ]
+        def wrapped_infer(request_uri, request_body, headers, query_params):
+            try:
+                response = self._post(request_uri, request_body, headers,
+                                      query_params)
+                error = _get_error(response)
+                if error is not None:
+                    return None, error
+                return self._get_infer_result(response, output_buffers), None
+            except InferenceServerException as error:
+                return None, error
+            except Exception as e:
+                return None, InferenceServerException(msg=str(e))
+
+        request_body, headers = self._prepare_infer(
+            inputs=inputs,
+            request_id=request_id,
+            outputs=outputs,
+            parameters=parameters,
+            headers=headers,
+            request_compression_algorithm=request_compression_algorithm,
+            response_compression_algorithm=response_compression_algorithm)
 
-        request_body = json.dumps(infer_request)
         if not model_version:
             request_uri = "v2/models/{}/infer".format(quote(model_name))
         else:
             request_uri = "v2/models/{}/versions/{}/infer".format(
                 quote(model_name), model_version)
 
-        g = self._pool.apply_async(
-            wrapped_post, (request_uri, request_body, headers, query_params),
-            callback=wrapped_callback)
-
+        g = gevent.Greenlet(wrapped_infer, request_uri, request_body,
+                            headers, query_params)
+        try:
+            self._pool.add(g, blocking=block)
+        except gevent.pool.PoolFull:
+            raise_error("maximum number of in-flight requests reached")
+        async_request = InferAsyncRequest(g)
+        if callback is not None:
+            g.link(lambda _: async_request._run_callback(callback))
         g.start()
 
+        return async_request
+
+
+class InferAsyncRequest:
+    """An object of InferAsyncRequest class is used to track an in-flight
+    asynchronous inference request issued by
+    InferenceServerClient.async_infer().
+
+    Parameters
+    ----------
+    greenlet : gevent.Greenlet
+        The greenlet performing the inference request.
+    """
+
+    def __init__(self, greenlet):
+        self._greenlet = greenlet
+
+    def done(self):
+        """Returns whether the request has completed, either
+        successfully, with an error or by being cancelled.
+
+        Returns
+        -------
+        bool
+            True if the request has completed.
+        """
+        return self._greenlet.ready()
+
+    def cancel(self):
+        """Cancels the request if it has not completed yet. Any
+        subsequent call to get_result() raises.
+        """
+        self._greenlet.kill(block=False)
+
+    def get_result(self, block=True, timeout=None):
+        """Get the result of the request.
+
+        Parameters
+        ----------
+        block : bool
+            If True wait for the request to complete, otherwise raise
+            if it has not completed yet. Default value is True.
+        timeout : float
+            The maximum time to wait for the request to complete, in
+            seconds. Default value is None which means wait forever.
+
+        Returns
+        -------
+        InferResult
+            The object holding the result of the inference.
+
+        Raises
+        ------
+        InferenceServerException
+            If the request failed, was cancelled or did not complete
+            in time.
+        """
+        try:
+            value = self._greenlet.get(block=block, timeout=timeout)
+        except gevent.Timeout:
+            raise_error("request has not completed")
+        if isinstance(value, gevent.GreenletExit):
+            raise_error("request was cancelled")
+        result, error = value
+        if error is not None:
+            raise error
+        return result
+
+    def _run_callback(self, callback):
+        """Invokes the user callback with the outcome of the request.
+        """
+        value = self._greenlet.value
+        if isinstance(value, gevent.GreenletExit):
+            callback(result=None,
+                     error=InferenceServerException(
+                         msg="request was cancelled"))
+        else:
+            result, error = value
+            callback(result=result, error=error)
+
+
+def wait_all(async_requests, timeout=None):
+    """Waits for all the specified requests to complete.
+
+    Parameters
+    ----------
+    async_requests : list
+        The InferAsyncRequest objects to wait for.
+    timeout : float
+        The maximum time to wait, in seconds. Default value is None
+        which means wait forever.
+
+    Returns
+    -------
+    list
+        The InferAsyncRequest objects that have completed.
+    """
+    greenlets = {r._greenlet: r for r in async_requests}
+    completed = gevent.joinall(list(greenlets.keys()), timeout=timeout)
+    return [greenlets[g] for g in completed]
+
+
+def as_completed(async_requests, timeout=None):
+    """Yields the specified requests as they complete.
+
+    Parameters
+    ----------
+    async_requests : list
+        The InferAsyncRequest objects to wait for.
+    timeout : float
+        The maximum time to wait for all the requests, in seconds.
+        Default value is None which means wait forever.
+
+    Returns
+    -------
+    iterator
+        Iterator over the InferAsyncRequest objects in completion order.
+    """
+    greenlets = {r._greenlet: r for r in async_requests}
+    for g in gevent.iwait(list(greenlets.keys()), timeout=timeout):
+        yield greenlets[g]
+
 
 class InferInput:
     """An object of InferInput class is used to describe
@@ -968,6 +1620,7 @@ class InferInput:
         self._datatype = datatype
         self._parameters = {}
         self._data = None
+        self._raw_data = None
 
     def name(self):
         """Get the name of input associated with this object.
@@ -999,7 +1652,7 @@ class InferInput:
         """
         return self._datatype
 
-    def set_data_from_numpy(self, input_tensor):
+    def set_data_from_numpy(self, input_tensor, binary_data=False):
         """Set the tensor data (datatype, shape and data) from the
         specified numpy array for input associated with this object.
 
@@ -1007,13 +1660,26 @@ class InferInput:
         ----------
         input_tensor : numpy array
             The tensor data in numpy array format
+        binary_data : bool
+            Indicates whether to send the tensor data as raw binary
+            data appended to the JSON request header instead of as a
+            JSON list of elements. Default value is False.
         """
         if not isinstance(input_tensor, (np.ndarray,)):
             raise_error("input_tensor must be a numpy array")
         self._datatype = np_to_triton_dtype(input_tensor.dtype)
-        self._shape = input_tensor.shape
-        # FIXMEV2 Use Binary data when support available on the server.
-        self._data = [val.item() for val in input_tensor.flatten()]
+        self._shape = list(input_tensor.shape)
+        self._parameters.pop('binary_data_size', None)
+        if binary_data:
+            self._data = None
+            if self._datatype == "BYTES":
+                self._raw_data = serialize_byte_tensor(input_tensor).tobytes()
+            else:
+                self._raw_data = np.ascontiguousarray(input_tensor).tobytes()
+            self._parameters['binary_data_size'] = len(self._raw_data)
+        else:
+            self._raw_data = None
+            self._data = [val.item() for val in input_tensor.flatten()]
 
     def set_parameter(self, key, value):
         """Adds the specified key-value pair in the requested input parameters
@@ -1037,6 +1703,20 @@ class InferInput:
         
         """
         self._parameters.clear()
+        if self._raw_data is not None:
+            self._parameters['binary_data_size'] = len(self._raw_data)
+
+    def _get_binary_data(self):
+        """Returns the raw binary data of the input if it is to be
+        sent in binary format.
+
+        Returns
+        -------
+        bytes
+            The raw binary data of the input or None if the data is
+            to be sent as a JSON list.
+        """
+        return self._raw_data
 
     def _get_tensor(self):
         """Retrieve the underlying input as json dict.
@@ -1046,13 +1726,15 @@ class InferInput:
         dict
             The underlying tensor specification as dict
         """
-        return {
+        tensor = {
             'name': self._name,
             'shape': self._shape,
             'datatype': self._datatype,
-            'parameters': self._parameters,
-            'data': self._data
+            'parameters': self._parameters
         }
+        if self._raw_data is None:
+            tensor['data'] = self._data
+        return tensor
 
 
 class InferOutput:
@@ -1063,11 +1745,17 @@ class InferOutput:
     ----------
     name : str
         The name of output tensor to associate with this object
+    binary_data : bool
+        Indicates whether to return the output tensor data as raw
+        binary data following the JSON response header instead of
+        as a JSON list of elements. Default value is False.
     """
 
-    def __init__(self, name):
+    def __init__(self, name, binary_data=False):
         self._name = name
         self._parameters = {}
+        if binary_data:
+            self._parameters['binary_data'] = True
 
     def name(self):
         """Get the name of output associated with this object.
@@ -1113,6 +1801,64 @@ class InferOutput:
         return {'name': self._name, 'parameters': self._parameters}
 
 
+class OutputBufferPool:
+    """An object of OutputBufferPool class holds numpy arrays that
+    binary output data can be read into, so that the arrays of
+    completed results can be reused by later inference requests
+    instead of allocating new ones.
+
+    Parameters
+    ----------
+    max_buffers : int
+        The maximum number of free arrays kept for each data type and
+        shape. Arrays returned beyond that limit are dropped. Default
+        value is 16.
+    """
+
+    def __init__(self, max_buffers=16):
+        self._max_buffers = max_buffers
+        self._free_buffers = {}
+
+    def get(self, datatype, shape):
+        """Get an array for the specified data type and shape, reusing
+        a free array if one is available.
+
+        Parameters
+        ----------
+        datatype : str
+            The datatype of the output.
+        shape : list
+            The shape of the output.
+
+        Returns
+        -------
+        numpy array
+            The array the output data can be read into.
+        """
+        np_dtype = triton_to_np_dtype(datatype)
+        free_buffers = self._free_buffers.get(
+            (np.dtype(np_dtype), tuple(shape)))
+        if free_buffers:
+            return free_buffers.pop()
+        return np.empty(shape, dtype=np_dtype)
+
+    def put(self, buffer):
+        """Return an array to the pool once the caller is done with it.
+        The array must no longer be used by the caller.
+
+        Parameters
+        ----------
+        buffer : numpy array
+            The array, typically obtained from InferResult.as_numpy().
+        """
+        if not (buffer.flags['C_CONTIGUOUS'] and buffer.flags['WRITEABLE']):
+            return
+        free_buffers = self._free_buffers.setdefault(
+            (buffer.dtype, buffer.shape), [])
+        if len(free_buffers) < self._max_buffers:
+            free_buffers.append(buffer)
+
+
 class InferResult:
     """An object of InferResult class holds the response of
     an inference request and provide methods to retrieve
@@ -1120,16 +1866,161 @@ class InferResult:
 
     Parameters
     ----------
-    result : dict
+    response : geventhttpclient.response.HTTPSocketPoolResponse
         The inference response from the server
     """
 
-    def __init__(self, result):
-        self._result = json.loads(result)
+    def __init__(self, response):
+        self._parse_response(response.read(),
+                             response.get('Inference-Header-Content-Length'))
+
+    @classmethod
+    def from_response_body(cls, response_body, header_length=None):
+        """Creates an InferResult from the raw body of the inference
+        response.
+
+        Parameters
+        ----------
+        response_body : bytes
+            The body of the inference response.
+        header_length : int
+            The size of the JSON header in the body as reported by the
+            'Inference-Header-Content-Length' response header. Default
+            value is None which means the body is entirely JSON.
+
+        Returns
+        -------
+        InferResult
+            The object holding the result of the inference.
+        """
+        result = cls.__new__(cls)
+        result._parse_response(response_body, header_length)
+        return result
+
+    @classmethod
+    def from_response_stream(cls,
+                             response,
+                             header_length,
+                             output_buffers=None):
+        """Creates an InferResult by streaming the body of the inference
+        response. Only the JSON header is buffered, the binary data of
+        each output is read from the socket directly into its numpy
+        array so that no copy of the whole body is ever held in memory.
+
+        Parameters
+        ----------
+        response : geventhttpclient.response.HTTPSocketPoolResponse
+            The inference response from the server, with its body not
+            yet read.
+        header_length : int
+            The size of the JSON header in the body as reported by the
+            'Inference-Header-Content-Length' response header.
+        output_buffers : dict or OutputBufferPool
+            Optional numpy arrays the binary data of the outputs is read
+            into. See InferenceServerClient.infer(). Default value is
+            None which means new arrays are allocated.
+
+        Returns
+        -------
+        InferResult
+            The object holding the result of the inference.
+
+        Raises
+        ------
+        InferenceServerException
+            If a supplied buffer doesn't match its output or if the
+            response ends prematurely.
+        """
+        result = cls.__new__(cls)
+        try:
+            result._read_response(response, int(header_length),
+                                  output_buffers)
+        except BaseException:
+            # The body is only partially consumed, don't let the
+            # connection be reused.
+            response.release()
+            raise
+        return result
+
+    def _read_response(self, response, header_length, output_buffers):
+        """Reads the JSON header of the response and then the binary
+        data of the outputs, in the order of the outputs in the header.
+        """
+        self._result = json.loads(response.read(header_length))
+        self._buffer = None
+        self._output_index = {}
+        self._output_cache = {}
+        for output in self._result.get('outputs', []):
+            name = output['name']
+            self._output_index[name] = (output, None)
+            size = output.get('parameters', {}).get('binary_data_size')
+            if size is None:
+                continue
+            datatype = output['datatype']
+            if datatype == 'BYTES':
+                # Keep the encoded tensor, it is decoded by as_numpy()
+                # or viewed by as_bytes_tensor().
+                data = bytearray(size)
+                _read_into(response, memoryview(data))
+                self._output_index[name] = (output, memoryview(data))
+            else:
+                np_array = _get_output_buffer(output_buffers, name, datatype,
+                                              output['shape'], size)
+                _read_into(response,
+                           memoryview(np_array.reshape(-1).view(np.uint8)))
+                self._output_cache[name] = np_array
+
+    def _copy_outputs_into(self, output_buffers):
+        """Copies the binary outputs read into new arrays into the
+        arrays supplied for them in 'output_buffers', which are then
+        returned by as_numpy().
+        """
+        for name, np_array in list(self._output_cache.items()):
+            if name not in output_buffers:
+                continue
+            output = self._output_index[name][0]
+            buffer = _get_output_buffer(output_buffers, name,
+                                        output['datatype'], output['shape'],
+                                        np_array.nbytes)
+            np.copyto(buffer, np_array)
+            self._output_cache[name] = buffer
+
+    def _parse_response(self, body, header_length):
+        """Parses the JSON header of the response body and locates the
+        binary data of the outputs.
+        """
+        if header_length is None:
+            self._result = json.loads(body)
+            self._buffer = None
+        else:
+            header_length = int(header_length)
+            self._result = json.loads(body[:header_length])
+            self._buffer = memoryview(body)[header_length:]
+
+        # Index the outputs by name. Binary output data is laid out in
+        # the order of the outputs in the JSON header so record the view
+        # of the data of each output. The data itself is decoded lazily
+        # by as_numpy().
+        self._output_index = {}
+        self._output_cache = {}
+        offset = 0
+        for output in self._result.get('outputs', []):
+            parameters = output.get('parameters', {})
+            if ('binary_data_size' in parameters) and (self._buffer is
+                                                       not None):
+                end = offset + parameters['binary_data_size']
+                self._output_index[output['name']] = (output,
+                                                      self._buffer[offset:end])
+                offset = end
+            else:
+                self._output_index[output['name']] = (output, None)
 
     def as_numpy(self, name):
         """Get the tensor data for output associated with this object
-        in numpy format
+        in numpy format. The output is decoded on the first call and
+        the same array is returned on subsequent calls. Outputs that
+        were returned as binary data are either the arrays the data was
+        streamed into or read-only views over the response body.
 
         Parameters
         ----------
@@ -1142,15 +2033,60 @@ class InferResult:
             The numpy array containing the response data for the tensor or
             None if the data for specified tensor name is not found.
         """
-        for output in self._result['outputs']:
-            if output['name'] == name:
-                datatype = output['datatype']
-                # FIXME: Add the support for binary data when available with server
-                np_array = np.array(output['data'],
-                                    dtype=triton_to_np_dtype(datatype))
-                np.resize(np_array, output['shape'])
-                return np_array
-        return None
+        np_array = self._output_cache.get(name)
+        if np_array is not None:
+            return np_array
+
+        indexed_output = self._output_index.get(name)
+        if indexed_output is None:
+            return None
+
+        output, data = indexed_output
+        datatype = output['datatype']
+        if data is not None:
+            if datatype == 'BYTES':
+                np_array = deserialize_bytes_tensor(data)
+            else:
+                np_array = np.frombuffer(data,
+                                         dtype=triton_to_np_dtype(datatype))
+        else:
+            np_array = np.array(output['data'],
+                                dtype=triton_to_np_dtype(datatype))
+        np_array = np_array.reshape(output['shape'])
+
+        self._output_cache[name] = np_array
+        return np_array
+
+    def as_bytes_tensor(self, name):
+        """Get the data of the BYTES output associated with this
+        object as a BytesTensor viewing the binary data of the response,
+        without decoding or copying the elements.
+
+        Parameters
+        ----------
+        name : str
+            The name of the output tensor whose result is to be retrieved.
+
+        Returns
+        -------
+        BytesTensor
+            The tensor holding the elements of the output or None if the
+            binary data for specified tensor name is not found.
+
+        Raises
+        ------
+        InferenceServerException
+            If the output is not a BYTES tensor.
+        """
+        indexed_output = self._output_index.get(name)
+        if indexed_output is None:
+            return None
+        output, data = indexed_output
+        if output['datatype'] != 'BYTES':
+            raise_error("output '" + name + "' is not a BYTES tensor")
+        if data is None:
+            return None
+        return BytesTensor(data, output['shape'])
 
     def get_response(self):
         """Retrieves the complete response
@@ -0,0 +1,950 @@
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import aiohttp
+
+from urllib.parse import quote
+import rapidjson as json
+
+from tritonhttpclient.core import InferInput, InferOutput, InferResult
+from tritonhttpclient.core import _get_inference_request, _get_query_string
+from tritonhttpclient.utils import *
+from tritonhttpclient.utils import _ModelInfoCache
+
+
+async def _get_error(response):
+    """
+    Returns the InferenceServerException object if response
+    indicates the error. If no error then return None
+    """
+    if response.status != 200:
+        error_response = json.loads(await response.read())
+        return InferenceServerException(msg=error_response["error"])
+    else:
+        return None
+
+
+async def _raise_if_error(response):
+    """
+    Raise InferenceServerException if received non-Success
+    response from the server
+    """
+    error = await _get_error(response)
+    if error:
+        raise error
+
+
+class InferenceServerClient:
+    """An InferenceServerClient object is used to perform any kind of
+    communication with the InferenceServer using http protocol from
+    within an asyncio event loop. All the methods communicating with
+    the server are coroutines.
+
+    Parameters
+    ----------
+    url : str
+        The inference server URL, e.g. 'localhost:8000'.
+    connection_count : int
+        The maximum number of simultaneous connections kept open to
+        the server. Requests beyond this limit wait for a connection
+        to be released. Default value is 100.
+    connection_timeout : float
+        The timeout value for establishing a connection. Default
+        value is 60.0 sec.
+    network_timeout : float
+        The timeout value for the network. Default value is
+        60.0 sec.
+    keepalive_timeout : float
+        The time an idle connection is kept alive in the pool before
+        being closed. Default value is 15.0 sec.
+    verbose : bool
+        If True generate verbose output. Default value is False.
+    model_cache_ttl : float
+        The time, in seconds, the model metadata and configuration
+        returned by the server are cached by the client. The cache is
+        invalidated when a model is loaded or unloaded through this
+        client. Default value is None which means no caching.
+
+    Raises
+    ------
+    Exception
+        If unable to create a client.
+
+    """
+
+    def __init__(self,
+                 url,
+                 connection_count=100,
+                 connection_timeout=60.0,
+                 network_timeout=60.0,
+                 keepalive_timeout=15.0,
+                 verbose=False,
+                 model_cache_ttl=None):
+        self._base_uri = "http://" + url
+        self._connection_count = connection_count
+        self._timeout = aiohttp.ClientTimeout(connect=connection_timeout,
+                                              sock_read=network_timeout)
+        self._keepalive_timeout = keepalive_timeout
+        self._session = None
+        self._verbose = verbose
+        self._model_cache = _ModelInfoCache(model_cache_ttl)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the client. Any future calls to server
+        will result in an Error.
+
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self):
+        """Returns the session used to talk to the server, creating it
+        on first use so that it is bound to the running event loop.
+        """
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self._connection_count,
+                keepalive_timeout=self._keepalive_timeout)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  timeout=self._timeout)
+        return self._session
+
+    def _get_url(self, request_uri, query_params):
+        url = self._base_uri + "/" + request_uri
+        if query_params:
+            url = url + "?" + _get_query_string(query_params)
+        return url
+
+    async def _get(self, request_uri, headers, query_params):
+        """Issues the GET request to the server
+
+         Parameters
+        ----------
+        request_uri: str
+            The request URI to be used in GET request.
+        headers: dict
+            Additional HTTP headers to include in the request.
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction.
+
+        Returns
+        -------
+        aiohttp.ClientResponse
+            The response from server.
+        """
+        url = self._get_url(request_uri, query_params)
+        return await self._get_session().get(url, headers=headers)
+
+    async def _post(self, request_uri, request_body, headers, query_params):
+        """Issues the POST request to the server
+
+        Parameters
+        ----------
+        request_uri: str
+            The request URI to be used in POST request.
+        request_body: str
+            The body of the request
+        headers: dict
+            Additional HTTP headers to include in the request.
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction.
+
+        Returns
+        -------
+        aiohttp.ClientResponse
+            The response from server.
+        """
+        url = self._get_url(request_uri, query_params)
+        return await self._get_session().post(url,
+                                              data=request_body,
+                                              headers=headers)
+
+    async def _get_json(self, request_uri, headers, query_params):
+        """Issues the GET request and returns the response as a
+        JSON dict.
+        """
+        async with await self._get(request_uri=request_uri,
+                                   headers=headers,
+                                   query_params=query_params) as response:
+            await _raise_if_error(response)
+            return json.loads(await response.read())
+
+    async def _post_checked(self, request_uri, request_body, headers,
+                            query_params):
+        """Issues the POST request and raises if the server reports
+        an error.
+        """
+        async with await self._post(request_uri=request_uri,
+                                    request_body=request_body,
+                                    headers=headers,
+                                    query_params=query_params) as response:
+            await _raise_if_error(response)
+
+    async def _get_status(self, request_uri, headers, query_params):
+        """Issues the GET request and returns whether the server
+        responded with success.
+        """
+        async with await self._get(request_uri=request_uri,
+                                   headers=headers,
+                                   query_params=query_params) as response:
+            return response.status == 200
+
+    async def is_server_live(self, headers=None, query_params=None):
+        """Contact the inference server and get liveness.
+
+        Parameters
+        ----------
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction.
+
+        Returns
+        -------
+        bool
+            True if server is live, False if server is not live.
+
+        Raises
+        ------
+        Exception
+            If unable to get liveness.
+
+        """
+        return await self._get_status(request_uri="v2/health/live",
+                                      headers=headers,
+                                      query_params=query_params)
+
+    async def is_server_ready(self, headers=None, query_params=None):
+        """Contact the inference server and get readiness.
+
+        Parameters
+        ----------
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction.
+
+        Returns
+        -------
+        bool
+            True if server is ready, False if server is not ready.
+
+        Raises
+        ------
+        Exception
+            If unable to get readiness.
+
+        """
+        return await self._get_status(request_uri="v2/health/ready",
+                                      headers=headers,
+                                      query_params=query_params)
+
+    async def is_model_ready(self,
+                             model_name,
+                             model_version="",
+                             headers=None,
+                             query_params=None):
+        """Contact the inference server and get the readiness of specified model.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model to check for readiness.
+        model_version: str
+            The version of the model to check for readiness. The default value
+            is an empty string which means then the server will choose a version
+            based on the model and internal policy.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction.
+
+        Returns
+        -------
+        bool
+            True if the model is ready, False if not ready.
+
+        Raises
+        ------
+        Exception
+            If unable to get model readiness.
+
+        """
+        if not model_version:
+            request_uri = "v2/models/{}/ready".format(quote(model_name))
+        else:
+            request_uri = "v2/models/{}/versions/{}/ready".format(
+                quote(model_name), model_version)
+
+        return await self._get_status(request_uri=request_uri,
+                                      headers=headers,
+                                      query_params=query_params)
+
+    async def get_server_metadata(self, headers=None, query_params=None):
+        """Contact the inference server and get its metadata.
+
+        Parameters
+        ----------
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction.
+
+        Returns
+        -------
+        dict
+            The JSON dict holding the metadata.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get server metadata.
+
+        """
+        return await self._get_json(request_uri="v2",
+                                    headers=headers,
+                                    query_params=query_params)
+
+    async def get_model_metadata(self,
+                                 model_name,
+                                 model_version="",
+                                 headers=None,
+                                 query_params=None):
+        """Contact the inference server and get the metadata for specified model.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model
+        model_version: str
+            The version of the model to get metadata. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        headers: dict
+            Optional dictionary specifying additional
+            HTTP headers to include in the request
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction
+
+        Returns
+        -------
+        dict
+            The JSON dict holding the metadata.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get model metadata.
+
+        """
+        metadata = self._model_cache.get('metadata', model_name, model_version)
+        if metadata is not None:
+            return metadata
+
+        if not model_version:
+            request_uri = "v2/models/{}".format(quote(model_name))
+        else:
+            request_uri = "v2/models/{}/versions/{}".format(
+                quote(model_name), model_version)
+
+        metadata = await self._get_json(request_uri=request_uri,
+                                        headers=headers,
+                                        query_params=query_params)
+        self._model_cache.put('metadata', model_name, model_version, metadata)
+
+        return metadata
+
+    async def get_model_config(self,
+                               model_name,
+                               model_version="",
+                               headers=None,
+                               query_params=None):
+        """Contact the inference server and get the configuration for specified model.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model
+        model_version: str
+            The version of the model to get configuration. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        headers: dict
+            Optional dictionary specifying additional
+            HTTP headers to include in the request
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction
+
+        Returns
+        -------
+        dict
+            The JSON dict holding the model config.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get model configuration.
+
+        """
+        config = self._model_cache.get('config', model_name, model_version)
+        if config is not None:
+            return config
+
+        if not model_version:
+            request_uri = "v2/models/{}/config".format(quote(model_name))
+        else:
+            request_uri = "v2/models/{}/versions/{}/config".format(
+                quote(model_name), model_version)
+
+        config = await self._get_json(request_uri=request_uri,
+                                      headers=headers,
+                                      query_params=query_params)
+        self._model_cache.put('config', model_name, model_version, config)
+
+        return config
+
+    def invalidate_model_cache(self, model_name=None):
+        """Drop the cached metadata and configuration of the specified
+        model.
+
+        Parameters
+        ----------
+        model_name : str
+            The name of the model whose cached information, for all
+            versions, is to be dropped. The default value is None which
+            means the information of all the models is dropped.
+
+        """
+        self._model_cache.invalidate(model_name)
+
+    async def get_infer_inputs(self,
+                               model_name,
+                               model_version="",
+                               headers=None,
+                               query_params=None):
+        """Create InferInput objects for all the inputs of the specified
+        model, with the name, shape and datatype reported in the model
+        metadata. Dimensions of variable size are reported as -1 and
+        are set along with the data by InferInput.set_data_from_numpy.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model
+        model_version: str
+            The version of the model. The default value is an empty
+            string which means then the server will choose a version
+            based on the model and internal policy.
+        headers: dict
+            Optional dictionary specifying additional HTTP headers to
+            include in the request if the metadata is not cached.
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction if the metadata is not cached.
+
+        Returns
+        -------
+        list
+            The InferInput objects in the order of the model metadata.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get model metadata.
+
+        """
+        model_metadata = await self.get_model_metadata(model_name, model_version,
+                                                       headers, query_params)
+        return [
+            InferInput(tensor['name'], tensor['shape'], tensor['datatype'])
+            for tensor in model_metadata['inputs']
+        ]
+
+    async def get_infer_outputs(self,
+                                model_name,
+                                model_version="",
+                                headers=None,
+                                query_params=None):
+        """Create InferOutput objects for all the outputs of the specified
+        model as reported in the model metadata.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model
+        model_version: str
+            The version of the model. The default value is an empty
+            string which means then the server will choose a version
+            based on the model and internal policy.
+        headers: dict
+            Optional dictionary specifying additional HTTP headers to
+            include in the request if the metadata is not cached.
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction if the metadata is not cached.
+
+        Returns
+        -------
+        list
+            The InferOutput objects in the order of the model metadata.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get model metadata.
+
+        """
+        model_metadata = await self.get_model_metadata(model_name, model_version,
+                                                       headers, query_params)
+        return [
+            InferOutput(tensor['name']) for tensor in model_metadata['outputs']
+        ]
+
+    async def get_model_repository_index(self, headers=None, query_params=None):
+        """Get the index of model repository contents
+
+        Parameters
+        ----------
+        headers: dict
+            Optional dictionary specifying additional
+            HTTP headers to include in the request
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction
+
+        Returns
+        -------
+        dict
+            The JSON dict holding the model repository index.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get the repository index.
+
+        """
+        return await self._get_json(request_uri="v2/repository/index",
+                                    headers=headers,
+                                    query_params=query_params)
+
+    async def load_model(self, model_name, headers=None, query_params=None):
+        """Request the inference server to load or reload specified model.
+
+        Parameters
+        ----------
+        model_name : str
+            The name of the model to be loaded.
+        headers: dict
+            Optional dictionary specifying additional
+            HTTP headers to include in the request
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to load the model.
+
+        """
+        request_uri = "v2/repository/model/{}/load".format(quote(model_name))
+        await self._post_checked(request_uri=request_uri,
+                                 request_body="",
+                                 headers=headers,
+                                 query_params=query_params)
+        self._model_cache.invalidate(model_name)
+
+    async def unload_model(self, model_name, headers=None, query_params=None):
+        """Request the inference server to unload specified model.
+
+        Parameters
+        ----------
+        model_name : str
+            The name of the model to be unloaded.
+        headers: dict
+            Optional dictionary specifying additional
+            HTTP headers to include in the request
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to unload the model.
+
+        """
+        request_uri = "v2/repository/model/{}/unload".format(quote(model_name))
+        await self._post_checked(request_uri=request_uri,
+                                 request_body="",
+                                 headers=headers,
+                                 query_params=query_params)
+        self._model_cache.invalidate(model_name)
+
+    async def get_system_shared_memory_status(self,
+                                              region_name="",
+                                              headers=None,
+                                              query_params=None):
+        """Request system shared memory status from the server.
+
+        Parameters
+        ----------
+        region_name : str
+            The name of the region to query status. The default
+            value is an empty string, which means that the status
+            of all active system shared memory will be returned.
+        headers: dict
+            Optional dictionary specifying additional
+            HTTP headers to include in the request
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction
+
+        Returns
+        -------
+        dict
+            The JSON dict holding system shared memory status.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get the status of specified shared memory.
+
+        """
+        if not region_name:
+            request_uri = "v2/systemsharedmemory/status"
+        else:
+            request_uri = "v2/systemsharedmemory/region/{}/status".format(
+                quote(region_name))
+
+        return await self._get_json(request_uri=request_uri,
+                                    headers=headers,
+                                    query_params=query_params)
+
+    async def register_system_shared_memory(self,
+                                            name,
+                                            key,
+                                            byte_size,
+                                            offset=0,
+                                            headers=None,
+                                            query_params=None):
+        """Request the server to register a system shared memory with the
+        following specification.
+
+        Parameters
+        ----------
+        name : str
+            The name of the region to register.
+        key : str
+            The key of the underlying memory object that contains the
+            system shared memory region.
+        byte_size : int
+            The size of the system shared memory region, in bytes.
+        offset : int
+            Offset, in bytes, within the underlying memory object to
+            the start of the system shared memory region. The default
+            value is zero.
+        headers: dict
+            Optional dictionary specifying additional
+            HTTP headers to include in the request
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to register the specified system shared memory.
+
+        """
+        request_uri = "v2/systemsharedmemory/region/{}/register".format(
+            quote(name))
+
+        register_request = {
+            'key': key,
+            'offset': offset,
+            'byte_size': byte_size
+        }
+        await self._post_checked(request_uri=request_uri,
+                                 request_body=json.dumps(register_request),
+                                 headers=headers,
+                                 query_params=query_params)
+
+    async def unregister_system_shared_memory(self,
+                                              name="",
+                                              headers=None,
+                                              query_params=None):
+        """Request the server to unregister a system shared memory with the
+        specified name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the region to unregister. The default value is empty
+            string which means all the system shared memory regions will be
+            unregistered.
+        headers: dict
+            Optional dictionary specifying additional
+            HTTP headers to include in the request
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to unregister the specified system shared memory region.
+
+        """
+        if not name:
+            request_uri = "v2/systemsharedmemory/unregister"
+        else:
+            request_uri = "v2/systemsharedmemory/region/{}/unregister".format(
+                quote(name))
+
+        await self._post_checked(request_uri=request_uri,
+                                 request_body="",
+                                 headers=headers,
+                                 query_params=query_params)
+
+    async def get_cuda_shared_memory_status(self,
+                                            region_name="",
+                                            headers=None,
+                                            query_params=None):
+        """Request cuda shared memory status from the server.
+
+        Parameters
+        ----------
+        region_name : str
+            The name of the region to query status. The default
+            value is an empty string, which means that the status
+            of all active cuda shared memory will be returned.
+        headers: dict
+            Optional dictionary specifying additional
+            HTTP headers to include in the request
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction
+
+        Returns
+        -------
+        dict
+            The JSON dict holding cuda shared memory status.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get the status of specified shared memory.
+
+        """
+        if not region_name:
+            request_uri = "v2/cudasharedmemory/status"
+        else:
+            request_uri = "v2/cudasharedmemory/region/{}/status".format(
+                quote(region_name))
+
+        return await self._get_json(request_uri=request_uri,
+                                    headers=headers,
+                                    query_params=query_params)
+
+    async def register_cuda_shared_memory(self,
+                                          name,
+                                          raw_handle,
+                                          device_id,
+                                          byte_size,
+                                          headers=None,
+                                          query_params=None):
+        """Request the server to register a system shared memory with the
+        following specification.
+
+        Parameters
+        ----------
+        name : str
+            The name of the region to register.
+        raw_handle : bytes
+            The raw serialized cudaIPC handle in base64 encoding.
+        device_id : int
+            The GPU device ID on which the cudaIPC handle was created.
+        byte_size : int
+            The size of the cuda shared memory region, in bytes.
+        headers: dict
+            Optional dictionary specifying additional
+            HTTP headers to include in the request
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to register the specified cuda shared memory.
+
+        """
+        request_uri = "v2/cudasharedmemory/region/{}/register".format(
+            quote(name))
+
+        register_request = {
+            'raw_handle': raw_handle,
+            'device_id': device_id,
+            'byte_size': byte_size
+        }
+        await self._post_checked(request_uri=request_uri,
+                                 request_body=json.dumps(register_request),
+                                 headers=headers,
+                                 query_params=query_params)
+
+    async def unregister_cuda_shared_memory(self,
+                                            name="",
+                                            headers=None,
+                                            query_params=None):
+        """Request the server to unregister a cuda shared memory with the
+        specified name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the region to unregister. The default value is empty
+            string which means all the cuda shared memory regions will be
+            unregistered.
+        headers: dict
+            Optional dictionary specifying additional
+            HTTP headers to include in the request
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to unregister the specified cuda shared memory region.
+
+        """
+        if not name:
+            request_uri = "v2/cudasharedmemory/unregister"
+        else:
+            request_uri = "v2/cudasharedmemory/region/{}/unregister".format(
+                quote(name))
+
+        await self._post_checked(request_uri=request_uri,
+                                 request_body="",
+                                 headers=headers,
+                                 query_params=query_params)
+
+    async def infer(self,
+                    model_name,
+                    inputs,
+                    model_version="",
+                    outputs=None,
+                    request_id=None,
+                    parameters=None,
+                    headers=None,
+                    query_params=None):
+        """Run inference using the supplied 'inputs' requesting the
+        outputs specified by 'outputs'. Many calls can be awaited
+        concurrently on the same client.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model to run inference.
+        inputs : list
+            A list of InferInput objects, each describing data for a input
+            tensor required by the model.
+        model_version: str
+            The version of the model to run inference. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        outputs : list
+            A list of InferOutput objects, each describing how the output
+            data must be returned. If not specified all outputs produced
+            by the model will be returned using default settings.
+        request_id: str
+            Optional identifier for the request. If specified will be returned
+            in the response. Default value is 'None' which means no request_id
+            will be used.
+        parameters: dict
+            Optional inference parameters described as key-value pairs.
+        headers: dict
+            Optional dictionary specifying additional HTTP
+            headers to include in the request.
+        query_params: dict
+            Optional url query parameters to use in network
+            transaction.
+
+        Returns
+        -------
+        InferResult
+            The object holding the result of the inference, including the
+            statistics.
+
+        Raises
+        ------
+        InferenceServerException
+            If server fails to perform inference.
+        """
+        request_body, json_size = _get_inference_request(
+            inputs=inputs,
+            request_id=request_id,
+            outputs=outputs,
+            parameters=parameters)
+        if json_size is not None:
+            headers = {} if headers is None else dict(headers)
+            headers["Inference-Header-Content-Length"] = str(json_size)
+
+        if not model_version:
+            request_uri = "v2/models/{}/infer".format(quote(model_name))
+        else:
+            request_uri = "v2/models/{}/versions/{}/infer".format(
+                quote(model_name), model_version)
+
+        async with await self._post(request_uri=request_uri,
+                                    request_body=request_body,
+                                    headers=headers,
+                                    query_params=query_params) as response:
+            await _raise_if_error(response)
+            header_length = response.headers.get(
+                'Inference-Header-Content-Length')
+            return InferResult.from_response_body(await response.read(),
+                                                  header_length)
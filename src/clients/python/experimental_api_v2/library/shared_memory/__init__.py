@@ -24,55 +24,45 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from builtins import range
-from enum import IntEnum
-from functools import partial
-from future.utils import iteritems
-from ctypes import *
+import bisect
+import mmap
 import numpy as np
-from numpy.ctypeslib import ndpointer
-import pkg_resources
-import struct
-
-class _utf8(object):
-    @classmethod
-    def from_param(cls, value):
-        if value is None:
-            return None
-        elif isinstance(value, bytes):
-            return value
-        else:
-            return value.encode('utf8')
-
 import os
-_cshm_lib = "cshmv2" if os.name == 'nt' else 'libcshmv2.so'
-_cshm_path = pkg_resources.resource_filename('tritongrpcclient.shared_memory', _cshm_lib)
-_cshm = cdll.LoadLibrary(_cshm_path)
-
-_cshm_shared_memory_region_create = _cshm.SharedMemoryRegionCreate
-_cshm_shared_memory_region_create.restype = c_int
-_cshm_shared_memory_region_create.argtypes = [_utf8, _utf8, c_uint64, POINTER(c_void_p)]
-_cshm_shared_memory_region_set = _cshm.SharedMemoryRegionSet
-_cshm_shared_memory_region_set.restype = c_int
-_cshm_shared_memory_region_set.argtypes = [c_void_p, c_uint64, c_uint64, c_void_p]
-_cshm_shared_memory_region_destroy = _cshm.SharedMemoryRegionDestroy
-_cshm_shared_memory_region_destroy.restype = c_int
-_cshm_shared_memory_region_destroy.argtypes = [c_void_p]
-
-def _raise_if_error(errno):
-    """
-    Raise SharedMemoryException if 'err' is non-success.
-    Otherwise return nothing.
-    """
-    if errno.value != 0:
-        ex = SharedMemoryException(errno)
-        raise ex
-    return
+import threading
+import time
+
+from tritongrpcclient.utils import InferenceServerException
+from tritongrpcclient.utils import _get_byte_tensor_elements, _pack_length_prefixed, _scan_bytes_tensor
+
+# POSIX shared memory objects are files of the tmpfs mounted at /dev/shm,
+# which is where shm_open() creates them.
+_SHM_DIR = "/dev/shm"
 
 def _raise_error(msg):
     ex = SharedMemoryException(msg)
     raise ex
 
+_DATATYPE_BYTE_SIZES = {
+    'BOOL': 1, 'INT8': 1, 'INT16': 2, 'INT32': 4, 'INT64': 8, 'UINT8': 1,
+    'UINT16': 2, 'UINT32': 4, 'UINT64': 8, 'FP16': 2, 'FP32': 4, 'FP64': 8
+}
+
+class _SharedMemoryHandle:
+    """The handle for a shared memory region mapped in the process.
+    """
+
+    def __init__(self, triton_shm_name, shm_key, shm_map, byte_size):
+        self.triton_shm_name = triton_shm_name
+        self.shm_key = shm_key
+        self.shm_map = shm_map
+        self.byte_size = byte_size
+
+def _get_shm_path(shm_key):
+    name = shm_key.lstrip("/")
+    if (not name) or ("/" in name):
+        _raise_error("invalid shared memory key '" + shm_key + "'")
+    return os.path.join(_SHM_DIR, name)
+
 def create_shared_memory_region(triton_shm_name, shm_key, byte_size):
     """Creates a shared memory region with the specified name and size.
 
@@ -87,7 +77,7 @@ def create_shared_memory_region(triton_shm_name, shm_key, byte_size):
 
     Returns
     -------
-    shm_handle : c_void_p
+    shm_handle : _SharedMemoryHandle
         The handle for the shared memory region.
 
     Raises
@@ -96,50 +86,758 @@ def create_shared_memory_region(triton_shm_name, shm_key, byte_size):
         If unable to create the shared memory region.
     """
 
-    shm_handle = c_void_p()
-    _raise_if_error(
-        c_int(_cshm_shared_memory_region_create(triton_shm_name, shm_key, byte_size, byref(shm_handle))))
+    try:
+        shm_fd = os.open(_get_shm_path(shm_key), os.O_RDWR | os.O_CREAT, 0o600)
+    except OSError:
+        _raise_error("unable to get shared memory descriptor")
+    try:
+        # extend shared memory object as by default it's initialized with size 0
+        try:
+            os.ftruncate(shm_fd, byte_size)
+        except OSError:
+            _raise_error("unable to initialize the size")
+        try:
+            shm_map = mmap.mmap(shm_fd, byte_size, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+        except (OSError, ValueError):
+            _raise_error("unable to read/mmap the shared memory region")
+    finally:
+        os.close(shm_fd)
 
-    return shm_handle
+    return _SharedMemoryHandle(triton_shm_name, shm_key, shm_map, byte_size)
 
-def set_shared_memory_region(shm_handle, input_values):
+def set_shared_memory_region(shm_handle, input_values, offset=0):
     """Copy the contents of the numpy array into a shared memory region.
+    Each array is copied once, straight into the mapped region, whether
+    it is contiguous or not. Arrays of np.object, np.bytes_ or np.str_
+    are serialized as BYTES tensors directly into the region.
 
     Parameters
     ----------
-    shm_handle : c_void_p
+    shm_handle : _SharedMemoryHandle
         The handle for the shared memory region.
-    input_values : np.array
-        The list of numpy arrays to be copied into the shared memory region.
+    input_values : list
+        The list of numpy arrays to be copied into the shared memory
+        region. An element may also be an (array, offset) tuple to copy
+        the array at the specified offset, in bytes, in the region. An
+        array without offset is copied right after the previous one.
+    offset : int
+        The offset, in bytes, in the shared memory region at which the
+        first array without explicit offset is copied. Default value
+        is 0.
 
     Raises
     ------
     SharedMemoryException
-        If unable to mmap or set values in the shared memory region.
+        If the arrays don't fit in the shared memory region.
     """
 
     if not isinstance(input_values, (list,tuple)):
         _raise_error("input_values must be specified as a list/tuple of numpy arrays")
     for input_value in input_values:
+        if isinstance(input_value, tuple):
+            input_value = input_value[0]
         if not isinstance(input_value, np.ndarray):
-            _raise_error("each element of input_values must be a numpy array")
+            _raise_error("each element of input_values must be a numpy array or an (array, offset) tuple")
 
-    offset_current = 0
+    offset_current = offset
     for input_value in input_values:
-        input_value = np.ascontiguousarray(input_value).flatten()
-        byte_size = input_value.size * input_value.itemsize
-        _raise_if_error(
-            c_int(_cshm_shared_memory_region_set(shm_handle, c_uint64(offset_current), \
-                c_uint64(byte_size), input_value.ctypes.data_as(c_void_p))))
-        offset_current += byte_size
+        if isinstance(input_value, tuple):
+            input_value, offset_current = input_value
+        offset_current += _write_array(shm_handle, input_value, offset_current, shm_handle.byte_size - offset_current)
     return
 
+def _write_array(shm_handle, input_value, offset, max_byte_size):
+    """Copies the array, or serializes the BYTES tensor, into the region
+    at the offset and returns its size in bytes, raising if the size
+    exceeds 'max_byte_size'.
+    """
+    is_bytes = input_value.dtype.hasobject or (input_value.dtype.type in (np.bytes_, np.str_))
+    if is_bytes:
+        if input_value.size == 0:
+            return 0
+        lengths, payload = _get_byte_tensor_elements(input_value)
+        byte_size = 4 * lengths.size + payload.size
+    else:
+        byte_size = input_value.size * input_value.itemsize
+    if (offset < 0) or (byte_size > max_byte_size):
+        _raise_error("input_values exceed the shared memory region")
+    if byte_size == 0:
+        return 0
+    if is_bytes:
+        _pack_length_prefixed(lengths, payload, out=np.frombuffer(shm_handle.shm_map, dtype=np.uint8, count=byte_size,
+                                                                  offset=offset))
+    else:
+        region_view = np.frombuffer(shm_handle.shm_map, dtype=input_value.dtype, count=input_value.size, offset=offset)
+        np.copyto(region_view.reshape(input_value.shape), input_value)
+    return byte_size
+
+def get_contents_as_numpy(shm_handle, datatype, shape, offset=0):
+    """Get a numpy array of the contents of a shared memory region. The
+    array of a numeric datatype is a view over the mapped region, not a
+    copy, so it reflects later writes to the region. The elements of a
+    BYTES tensor are decoded directly from the region.
+
+    Parameters
+    ----------
+    shm_handle : _SharedMemoryHandle
+        The handle for the shared memory region.
+    datatype : np.dtype
+        The datatype of the array, np.object or np.bytes_ for a BYTES
+        tensor serialized in the region, whose elements are returned as
+        bytes, or np.str_ to decode them as UTF-8 strings.
+    shape : list
+        The shape of the array.
+    offset : int
+        The offset, in bytes, of the array in the shared memory region.
+        Default value is 0.
+
+    Returns
+    -------
+    np.array
+        The numpy array of the contents of the shared memory region.
+
+    Raises
+    ------
+    SharedMemoryException
+        If the array doesn't fit in the shared memory region or the
+        elements of a np.str_ array are not valid UTF-8.
+    """
+
+    byte_size = shm_handle.byte_size
+    element_count = int(np.prod(shape))
+    datatype = np.dtype(datatype)
+    if datatype.type in (np.object_, np.bytes_, np.str_):
+        if (offset < 0) or (offset > byte_size):
+            _raise_error("BYTES tensor exceeds the shared memory region")
+        # The view of the mapping is dropped as soon as it is no longer
+        # needed, and before raising, so that the traceback of an error
+        # does not keep the mapping exported and prevent its unmapping.
+        buffer = memoryview(shm_handle.shm_map)[offset:]
+        try:
+            offsets, lengths = _scan_bytes_tensor(buffer, element_count)
+        except InferenceServerException:
+            offsets = None
+        if offsets is None:
+            del buffer
+            _raise_error("BYTES tensor exceeds the shared memory region")
+        result = np.empty(element_count, dtype=np.object)
+        result[:] = [
+            buffer[start:start + length].tobytes()
+            for start, length in zip(offsets.tolist(), lengths.tolist())
+        ]
+        del buffer
+        if datatype.type == np.str_:
+            try:
+                result = np.array([element.decode('utf-8') for element in result], dtype=np.str_)
+            except UnicodeDecodeError:
+                _raise_error("BYTES tensor elements are not valid UTF-8")
+        return result.reshape(shape)
+
+    if offset + element_count * datatype.itemsize > byte_size:
+        _raise_error("array exceeds the shared memory region")
+    if element_count == 0:
+        return np.empty(shape, dtype=datatype)
+    return np.frombuffer(shm_handle.shm_map, dtype=datatype, count=element_count, offset=offset).reshape(shape)
+
+class SharedMemoryArena:
+    """An object of SharedMemoryArena class creates one system shared
+    memory region, registers it with the server once and sub-allocates
+    the tensors of inference requests from it, so that no region has to
+    be created or registered per request.
+
+    Parameters
+    ----------
+    client : InferenceServerClient
+        The client used to register the region with the server and to
+        unregister it on close().
+    triton_shm_name : str
+        The unique name of the shared memory region to be created.
+    shm_key : str
+        The unique key of the shared memory object.
+    byte_size : int
+        The size in bytes of the shared memory region to be created.
+    alignment : int
+        The alignment, in bytes, of the offset of every allocation.
+        Default value is 64.
+
+    Raises
+    ------
+    SharedMemoryException
+        If unable to create the shared memory region.
+    InferenceServerException
+        If unable to register the shared memory region.
+    """
+
+    def __init__(self, client, triton_shm_name, shm_key, byte_size, alignment=64):
+        if (alignment < 1) or (alignment & (alignment - 1)):
+            _raise_error("alignment must be a power of two")
+        self._client = client
+        self._name = triton_shm_name
+        self._byte_size = byte_size
+        self._alignment = alignment
+        self._handle = create_shared_memory_region(triton_shm_name, shm_key, byte_size)
+        try:
+            client.register_system_shared_memory(triton_shm_name, shm_key, byte_size)
+        except Exception:
+            destroy_shared_memory_region(self._handle)
+            raise
+        # The free blocks as (offset, size) ordered by offset, adjacent
+        # blocks are merged when an allocation is freed.
+        self._free_blocks = [(0, byte_size)]
+        # The offset of every allocation mapped to its aligned size.
+        self._allocations = {}
+        self._cv = threading.Condition()
+        self._stats = {
+            'allocation_count': 0,
+            'free_count': 0,
+            'wait_count': 0,
+            'failed_allocation_count': 0,
+            'allocated_bytes': 0,
+            'peak_allocated_bytes': 0
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    @property
+    def handle(self):
+        """The handle for the shared memory region of the arena."""
+        return self._handle
+
+    @property
+    def name(self):
+        """The name the shared memory region is registered with."""
+        return self._name
+
+    def allocate(self, byte_size, block=True, timeout=None):
+        """Allocate a slice of the shared memory region.
+
+        Parameters
+        ----------
+        byte_size : int
+            The size in bytes of the slice.
+        block : bool
+            If True wait for enough memory to be freed when the arena is
+            full, otherwise raise. Default value is True.
+        timeout : float
+            The maximum time, in seconds, to wait for memory to be freed.
+            Default value is None which means wait forever.
+
+        Returns
+        -------
+        tuple
+            The (region_name, offset, byte_size) of the slice, to be used
+            as the 'shared_memory_region', 'shared_memory_offset' and
+            'shared_memory_byte_size' parameters of a tensor.
+
+        Raises
+        ------
+        SharedMemoryException
+            If the slice is larger than the region or if no memory was
+            freed in time.
+        """
+        aligned_size = max(self._alignment, (byte_size + self._alignment - 1) & ~(self._alignment - 1))
+        if aligned_size > self._byte_size:
+            _raise_error("allocation of " + str(byte_size) + " bytes exceeds the shared memory arena")
+        with self._cv:
+            offset = self._find_block(aligned_size)
+            if (offset is None) and block:
+                self._stats['wait_count'] += 1
+                self._cv.wait_for(
+                    lambda: self._has_block(aligned_size), timeout=timeout)
+                offset = self._find_block(aligned_size)
+            if offset is None:
+                self._stats['failed_allocation_count'] += 1
+                _raise_error("shared memory arena is out of memory")
+            self._allocations[offset] = aligned_size
+            self._stats['allocation_count'] += 1
+            self._stats['allocated_bytes'] += aligned_size
+            self._stats['peak_allocated_bytes'] = max(
+                self._stats['peak_allocated_bytes'], self._stats['allocated_bytes'])
+        return (self._name, offset, byte_size)
+
+    def free(self, allocation):
+        """Return a slice to the arena.
+
+        Parameters
+        ----------
+        allocation : tuple
+            The (region_name, offset, byte_size) returned by allocate().
+
+        Raises
+        ------
+        SharedMemoryException
+            If the slice is not allocated from this arena.
+        """
+        offset = allocation[1]
+        with self._cv:
+            aligned_size = self._allocations.pop(offset, None)
+            if aligned_size is None:
+                _raise_error("offset " + str(offset) + " is not allocated from the shared memory arena")
+            self._stats['free_count'] += 1
+            self._stats['allocated_bytes'] -= aligned_size
+            self._insert_block(offset, aligned_size)
+            self._cv.notify_all()
+
+    def free_on_completion(self, allocations, callback=None):
+        """Get the callback for async_infer() that invokes 'callback'
+        once the request completes and then frees the slices of the
+        request, even if 'callback' raises.
+
+        Parameters
+        ----------
+        allocations : list
+            The (region_name, offset, byte_size) tuples of the request.
+        callback : function
+            Optional callback invoked with the (result, error) of the
+            request before the slices are freed, so that it can still
+            read the outputs placed in them. Default value is None.
+
+        Returns
+        -------
+        function
+            The callback to pass to async_infer().
+        """
+
+        def wrapped_callback(result, error):
+            try:
+                if callback is not None:
+                    callback(result=result, error=error)
+            finally:
+                for allocation in allocations:
+                    self.free(allocation)
+
+        return wrapped_callback
+
+    def get_statistics(self):
+        """Get the allocation statistics of the arena.
+
+        Returns
+        -------
+        dict
+            The dict holding the allocation, free, wait and failed
+            allocation counts, the current and peak allocated bytes, the
+            number of free blocks and the size of the largest one.
+        """
+        with self._cv:
+            stats = dict(self._stats)
+            stats['free_block_count'] = len(self._free_blocks)
+            stats['largest_free_block'] = max(
+                [size for _, size in self._free_blocks], default=0)
+        return stats
+
+    def close(self):
+        """Unregister and destroy the shared memory region. Slices still
+        allocated must not be used afterwards.
+        """
+        if self._handle is not None:
+            self._client.unregister_system_shared_memory(self._name)
+            destroy_shared_memory_region(self._handle)
+            self._handle = None
+
+    def _has_block(self, aligned_size):
+        return any(size >= aligned_size for _, size in self._free_blocks)
+
+    def _find_block(self, aligned_size):
+        """Carves the allocation out of the smallest free block that
+        fits, returning its offset or None if no block fits.
+        """
+        best = None
+        for index, (_, size) in enumerate(self._free_blocks):
+            if (size >= aligned_size) and ((best is None) or (size < self._free_blocks[best][1])):
+                best = index
+                if size == aligned_size:
+                    break
+        if best is None:
+            return None
+        offset, size = self._free_blocks[best]
+        if size == aligned_size:
+            del self._free_blocks[best]
+        else:
+            self._free_blocks[best] = (offset + aligned_size, size - aligned_size)
+        return offset
+
+    def _insert_block(self, offset, size):
+        index = bisect.bisect(self._free_blocks, (offset, size))
+        # Merge with the following and the preceding free blocks
+        if (index < len(self._free_blocks)) and (self._free_blocks[index][0] == offset + size):
+            size += self._free_blocks[index][1]
+            del self._free_blocks[index]
+        if (index > 0) and (sum(self._free_blocks[index - 1]) == offset):
+            offset = self._free_blocks[index - 1][0]
+            size += self._free_blocks[index - 1][1]
+            index -= 1
+            del self._free_blocks[index]
+        self._free_blocks.insert(index, (offset, size))
+
+class SharedMemorySlotPool:
+    """An object of SharedMemorySlotPool class holds a fixed number of
+    slots, each made of an input and an output system shared memory
+    region registered with the server up front and large enough for all
+    the inputs and outputs of a model. A slot is acquired for each
+    asynchronous inference request and released once the request
+    completes, so that up to 'slot_count' requests can be in flight
+    without overwriting each other's inputs.
+
+    Parameters
+    ----------
+    client : InferenceServerClient
+        The client used to get the model metadata and to register and
+        unregister the regions of the slots.
+    model_name : str
+        The name of the model whose tensors the slots hold.
+    slot_count : int
+        The number of slots, i.e. the maximum number of requests using
+        the pool that can be in flight at once.
+    model_version : str
+        The version of the model. Default value is an empty string which
+        means the server will choose a version.
+    batch_size : int
+        The batch size used for the batch dimension of the tensors, i.e.
+        the leading variable-size dimension of the shapes in the model
+        metadata. Default value is 1.
+    byte_sizes : dict
+        Optional byte size to reserve for each input or output, given by
+        name, overriding the size computed from the model metadata. It
+        is required for BYTES tensors and for tensors with variable-size
+        dimensions other than the batch dimension. Default value is None.
+    name_prefix : str
+        The prefix of the names and keys of the regions. Default value
+        is None which means the model name is used.
+
+    Raises
+    ------
+    SharedMemoryException
+        If the size of a tensor is unknown or if unable to create the
+        shared memory regions.
+    InferenceServerException
+        If unable to get the model metadata or to register the regions.
+    """
+
+    def __init__(self, client, model_name, slot_count, model_version="", batch_size=1, byte_sizes=None,
+                 name_prefix=None):
+        if slot_count < 1:
+            _raise_error("slot_count must be at least 1")
+        metadata = client.get_model_metadata(model_name, model_version)
+        if isinstance(metadata, dict):
+            input_tensors, output_tensors = metadata.get('inputs', []), metadata.get('outputs', [])
+        else:
+            input_tensors, output_tensors = metadata.inputs, metadata.outputs
+        input_layout, input_byte_size = _get_tensor_layout(input_tensors, batch_size, byte_sizes)
+        output_layout, output_byte_size = _get_tensor_layout(output_tensors, batch_size, byte_sizes)
+        if name_prefix is None:
+            name_prefix = model_name
+
+        self._client = client
+        self._slots = []
+        try:
+            for index in range(slot_count):
+                self._slots.append(SharedMemorySlot(
+                    client, index, name_prefix + "_" + str(index), input_layout, input_byte_size,
+                    output_layout, output_byte_size))
+        except Exception:
+            for slot in self._slots:
+                slot._close()
+            raise
+        self._free_slots = list(self._slots)
+        self._in_use_slots = set()
+        self._cv = threading.Condition()
+        self._stats = {
+            'acquire_count': 0,
+            'exhausted_count': 0,
+            'timeout_count': 0,
+            'cumulative_wait_time_s': 0.0,
+            'max_wait_time_s': 0.0
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def acquire(self, block=True, timeout=None):
+        """Acquire a free slot.
+
+        Parameters
+        ----------
+        block : bool
+            If True wait for a slot to be released when all the slots
+            are in use, otherwise raise. Default value is True.
+        timeout : float
+            The maximum time, in seconds, to wait for a slot. Default
+            value is None which means wait forever.
+
+        Returns
+        -------
+        SharedMemorySlot
+            The slot, to be released with release() or with the callback
+            returned by release_on_completion().
+
+        Raises
+        ------
+        SharedMemoryException
+            If no slot is free, when 'block' is False, or if no slot was
+            released in time.
+        """
+        with self._cv:
+            self._stats['acquire_count'] += 1
+            if not self._free_slots:
+                self._stats['exhausted_count'] += 1
+                if block:
+                    start_time = time.monotonic()
+                    self._cv.wait_for(lambda: self._free_slots, timeout=timeout)
+                    wait_time = time.monotonic() - start_time
+                    self._stats['cumulative_wait_time_s'] += wait_time
+                    self._stats['max_wait_time_s'] = max(self._stats['max_wait_time_s'], wait_time)
+                if not self._free_slots:
+                    self._stats['timeout_count'] += 1
+                    _raise_error("no shared memory slot available")
+            slot = self._free_slots.pop()
+            self._in_use_slots.add(slot)
+            slot._use_count += 1
+            return slot
+
+    def release(self, slot):
+        """Return a slot to the pool.
+
+        Parameters
+        ----------
+        slot : SharedMemorySlot
+            The slot returned by acquire().
+
+        Raises
+        ------
+        SharedMemoryException
+            If the slot is not held, e.g. it was already released or
+            belongs to another pool.
+        """
+        with self._cv:
+            if slot not in self._in_use_slots:
+                _raise_error("shared memory slot is not in use")
+            self._in_use_slots.remove(slot)
+            self._free_slots.append(slot)
+            self._cv.notify()
+
+    def release_on_completion(self, slot, callback=None):
+        """Get the callback for async_infer() that invokes 'callback'
+        once the request completes and then releases the slot.
+
+        Parameters
+        ----------
+        slot : SharedMemorySlot
+            The slot used by the request.
+        callback : function
+            Optional callback invoked with the (result, error) of the
+            request. The outputs in the slot may be overwritten by the
+            next request once it returns. Default value is None.
+
+        Returns
+        -------
+        function
+            The callback to pass to async_infer().
+        """
+
+        def wrapped_callback(result, error):
+            try:
+                if callback is not None:
+                    callback(result=result, error=error)
+            finally:
+                self.release(slot)
+
+        return wrapped_callback
+
+    def get_statistics(self):
+        """Get the usage statistics of the pool.
+
+        Returns
+        -------
+        dict
+            The dict holding the 'slot_count', the number of slots
+            'in_use', the 'acquire_count', the number of acquisitions
+            that found no free slot ('exhausted_count') or gave up
+            ('timeout_count'), the cumulative and maximum time, in
+            seconds, spent waiting for a slot and the number of times
+            each slot was used ('slot_use_counts').
+        """
+        with self._cv:
+            stats = dict(self._stats)
+            stats['slot_count'] = len(self._slots)
+            stats['in_use'] = len(self._in_use_slots)
+            stats['slot_use_counts'] = [slot._use_count for slot in self._slots]
+        return stats
+
+    def close(self):
+        """Unregister and destroy the regions of all the slots.
+        """
+        for slot in self._slots:
+            slot._close()
+        self._slots = []
+        self._free_slots = []
+        self._in_use_slots = set()
+
+class SharedMemorySlot:
+    """An object of SharedMemorySlot class holds the input and output
+    regions of a slot of a SharedMemorySlotPool. It is not created
+    directly but acquired from the pool.
+    """
+
+    def __init__(self, client, index, name, input_layout, input_byte_size, output_layout, output_byte_size):
+        self._client = client
+        self._index = index
+        self._use_count = 0
+        self._input_layout = input_layout
+        self._output_layout = output_layout
+        self._input_name = name + "_input"
+        self._output_name = name + "_output"
+        self._output_handle = None
+        self._input_handle = _create_registered_region(client, self._input_name, input_byte_size)
+        try:
+            self._output_handle = _create_registered_region(client, self._output_name, output_byte_size)
+        except Exception:
+            self._close()
+            raise
+
+    @property
+    def index(self):
+        """The index of the slot in the pool."""
+        return self._index
+
+    def set_input(self, infer_input, input_value):
+        """Copy the data of an input into the slot and set the shared
+        memory parameters of the input to use it.
+
+        Parameters
+        ----------
+        infer_input : InferInput
+            The input, whose name must be an input of the model.
+        input_value : np.array
+            The data of the input. Arrays of np.object, np.bytes_ or
+            np.str_ are serialized as BYTES tensors.
+
+        Raises
+        ------
+        SharedMemoryException
+            If the input is unknown or its data exceeds its reserved size.
+        """
+        offset, byte_size = self._get_tensor(self._input_layout, infer_input.name())
+        try:
+            data_byte_size = _write_array(self._input_handle, input_value, offset, byte_size)
+        except SharedMemoryException:
+            _raise_error("data of input '" + infer_input.name() + "' exceeds the " + str(byte_size) +
+                         " bytes reserved in the shared memory slot")
+        infer_input.set_parameter("shared_memory_region", self._input_name)
+        infer_input.set_parameter("shared_memory_offset", offset)
+        infer_input.set_parameter("shared_memory_byte_size", data_byte_size)
+
+    def set_output(self, infer_output):
+        """Set the shared memory parameters of an output so that it is
+        written into the slot.
+
+        Parameters
+        ----------
+        infer_output : InferOutput
+            The output, whose name must be an output of the model.
+
+        Raises
+        ------
+        SharedMemoryException
+            If the output is unknown.
+        """
+        offset, byte_size = self._get_tensor(self._output_layout, infer_output.name())
+        infer_output.set_parameter("shared_memory_region", self._output_name)
+        infer_output.set_parameter("shared_memory_offset", offset)
+        infer_output.set_parameter("shared_memory_byte_size", byte_size)
+
+    def get_output(self, name, datatype, shape):
+        """Get the data of an output written into the slot.
+
+        Parameters
+        ----------
+        name : str
+            The name of the output.
+        datatype : np.dtype
+            The datatype of the output, see get_contents_as_numpy().
+        shape : list
+            The shape of the output.
+
+        Returns
+        -------
+        np.array
+            The view over the output data in the slot, valid until the
+            slot is released.
+
+        Raises
+        ------
+        SharedMemoryException
+            If the output is unknown.
+        """
+        offset, _ = self._get_tensor(self._output_layout, name)
+        return get_contents_as_numpy(self._output_handle, datatype, shape, offset)
+
+    def _get_tensor(self, layout, name):
+        tensor = layout.get(name)
+        if tensor is None:
+            _raise_error("unknown tensor '" + name + "' for the shared memory slot")
+        return tensor
+
+    def _close(self):
+        for name, handle in ((self._input_name, self._input_handle), (self._output_name, self._output_handle)):
+            if handle is not None:
+                self._client.unregister_system_shared_memory(name)
+                destroy_shared_memory_region(handle)
+        self._input_handle = None
+        self._output_handle = None
+
+def _create_registered_region(client, name, byte_size):
+    """Creates the shared memory region keyed after its name and
+    registers it with the server.
+    """
+    key = "/" + name
+    handle = create_shared_memory_region(name, key, byte_size)
+    try:
+        client.register_system_shared_memory(name, key, byte_size)
+    except Exception:
+        destroy_shared_memory_region(handle)
+        raise
+    return handle
+
+def _get_tensor_layout(tensors, batch_size, byte_sizes, alignment=64):
+    """Returns the (offset, byte_size) of each tensor in a region holding
+    all of them, aligned, and the size of the region.
+    """
+    layout = {}
+    offset = 0
+    for tensor in tensors:
+        if isinstance(tensor, dict):
+            name, datatype, shape = tensor['name'], tensor['datatype'], tensor['shape']
+        else:
+            name, datatype, shape = tensor.name, tensor.datatype, tensor.shape
+        if (byte_sizes is not None) and (name in byte_sizes):
+            byte_size = byte_sizes[name]
+        else:
+            shape = [int(dim) for dim in shape]
+            if shape and (shape[0] == -1):
+                shape[0] = batch_size
+            if (datatype not in _DATATYPE_BYTE_SIZES) or any(dim < 0 for dim in shape):
+                _raise_error("the byte size of tensor '" + name + "' must be specified in 'byte_sizes'")
+            byte_size = int(np.prod(shape)) * _DATATYPE_BYTE_SIZES[datatype]
+        layout[name] = (offset, byte_size)
+        offset += (byte_size + alignment - 1) // alignment * alignment
+    return layout, max(offset, 1)
+
 def destroy_shared_memory_region(shm_handle):
-    """Unlink a shared memory region with the specified handle.
+    """Unlink and unmap a shared memory region with the specified
+    handle. If numpy arrays returned by get_contents_as_numpy() still
+    view the region, it can not be unmapped yet and stays mapped until
+    those arrays and the handle are released.
 
     Parameters
     ----------
-    shm_handle : c_void_p
+    shm_handle : _SharedMemoryHandle
         The handle for the shared memory region.
 
     Raises
@@ -148,8 +846,16 @@ def destroy_shared_memory_region(shm_handle):
         If unable to unlink the shared memory region.
     """
 
-    _raise_if_error(
-        c_int(_cshm_shared_memory_region_destroy(shm_handle)))
+    try:
+        os.unlink(_get_shm_path(shm_handle.shm_key))
+    except OSError:
+        _raise_error("unable to unlink the shared memory region")
+    try:
+        shm_handle.shm_map.close()
+    except BufferError:
+        # Arrays exported from the mapping are still alive, the mapping
+        # is released once they are garbage collected.
+        pass
     return
 
 class SharedMemoryException(Exception):
@@ -157,20 +863,12 @@ class SharedMemoryException(Exception):
 
     Parameters
     ----------
-    err : c_void_p
-        Pointer to an Error that should be used to initialize the exception.
+    err : str
+        A brief description of error
 
     """
     def __init__(self, err):
-        self.err_code_map = { -2: "unable to get shared memory descriptor",
-                            -3: "unable to initialize the size",
-                            -4: "unable to read/mmap the shared memory region",
-                            -5: "unable to unlink the shared memory region"}
-        self._msg = None
-        if type(err) == str:
-            self._msg = err
-        elif err.value != 0 and err.value in self.err_code_map:
-            self._msg = self.err_code_map[err.value]
+        self._msg = err
 
     def __str__(self):
         msg = super().__str__() if self._msg is None else self._msg
@@ -25,12 +25,16 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import numpy as np
+import random
 import struct
+import threading
+import time
 
 __all__ = [
     'raise_error', 'np_to_triton_dtype', 'triton_to_np_dtype',
     'InferenceServerException', 'serialize_byte_tensor',
-    'deserialize_bytes_tensor'
+    'deserialize_bytes_tensor', 'BytesTensor', 'MultiEndpointClient',
+    'RetryPolicy'
 ]
 
 
@@ -128,9 +132,10 @@ def np_to_triton_dtype(np_dtype):
         return "FP32"
     elif np_dtype == np.float64:
         return "FP64"
-    # FIXMEPV2 support np.bytes_ or np.str_
     elif np_dtype == np.object:
         return "BYTES"
+    elif np.dtype(np_dtype).type in (np.bytes_, np.str_):
+        return "BYTES"
     return None
 
 
@@ -193,29 +198,66 @@ def serialize_byte_tensor(input_tensor):
     # a 1-dimensional array containing the 4-byte byte size followed by the
     # actual element bytes. All elements are concatenated together in "C"
     # order.
-    if (input_tensor.dtype == np.object) or (
-            input_tensor.dtype.type == np.bytes_):
-        flattened = bytes()
-        for obj in np.nditer(input_tensor, flags=["refs_ok"], order='C'):
-            # If directly passing bytes to BYTES type,
-            # don't convert it to str as Python will encode the
-            # bytes which may distort the meaning
-            if obj.dtype.type == np.bytes_:
-                if type(obj.item()) == bytes:
-                    s = obj.item()
-                else:
-                    s = bytes(obj)
-            else:
-                s = str(obj).encode('utf-8')
-            flattened += struct.pack("<I", len(s))
-            flattened += s
-        flattened_array = np.asarray(flattened)
-        if not flattened_array.flags['C_CONTIGUOUS']:
-            flattened_array = np.ascontiguousarray(flattened_array)
-        return flattened_array
+    lengths, payload = _get_byte_tensor_elements(input_tensor)
+    return _pack_length_prefixed(lengths, payload)
+
+
+def _get_byte_tensor_elements(input_tensor):
+    """Returns the 1-D int64 array of the length of each element of the
+    bytes tensor and the uint8 array of all the elements concatenated,
+    in 'C' order.
+    """
+    if input_tensor.dtype.type == np.str_:
+        input_tensor = np.char.encode(input_tensor, 'utf-8')
+    if input_tensor.dtype.type == np.bytes_:
+        # The elements are stored with a fixed width, padded with
+        # trailing zeros that are not part of the element.
+        lengths = np.char.str_len(input_tensor).reshape(-1).astype(np.int64)
+        itemsize = input_tensor.dtype.itemsize
+        if itemsize == 0:
+            payload = np.empty(0, dtype=np.uint8)
+        else:
+            chars = np.ascontiguousarray(input_tensor).view(np.uint8).reshape(
+                -1, itemsize)
+            payload = chars[np.arange(itemsize) < lengths[:, None]]
+    elif input_tensor.dtype == np.object:
+        # If directly passing bytes to BYTES type,
+        # don't convert it to str as Python will encode the
+        # bytes which may distort the meaning
+        elements = [
+            obj if isinstance(obj, bytes) else str(obj).encode('utf-8')
+            for obj in input_tensor.reshape(-1)
+        ]
+        lengths = np.fromiter(map(len, elements),
+                              dtype=np.int64,
+                              count=len(elements))
+        payload = np.frombuffer(b''.join(elements), dtype=np.uint8)
     else:
         raise_error("cannot serialize bytes tensor: invalid datatype")
-    return None
+    return lengths, payload
+
+
+def _pack_length_prefixed(lengths, payload, out=None):
+    """Interleaves the 4-byte little-endian lengths with the elements
+    concatenated in 'payload' into 'out', a 1-D uint8 array of exactly
+    the serialized size, or into a new array if 'out' is None.
+    """
+    if (lengths.size != 0) and (lengths.max() > np.iinfo(np.uint32).max):
+        raise_error("cannot serialize bytes tensor: element exceeds 4 GB")
+    element_count = lengths.size
+    flattened = out
+    if flattened is None:
+        flattened = np.empty(4 * element_count + payload.size, dtype=np.uint8)
+    # Each length prefix starts after the prefixes and the elements
+    # that precede it.
+    prefix_offsets = 4 * np.arange(element_count, dtype=np.int64) + (
+        np.cumsum(lengths) - lengths)
+    prefix_indices = (prefix_offsets[:, None] + np.arange(4)).reshape(-1)
+    flattened[prefix_indices] = lengths.astype('<u4').view(np.uint8)
+    is_payload = np.ones(flattened.size, dtype=bool)
+    is_payload[prefix_indices] = False
+    flattened[is_payload] = payload
+    return flattened
 
 
 def deserialize_bytes_tensor(encoded_tensor):
@@ -225,24 +267,749 @@ def deserialize_bytes_tensor(encoded_tensor):
 
     Parameters
     ----------
-    encoded_tensor : bytes
+    encoded_tensor : bytes-like
         The encoded bytes tensor where each element
         has its length in first 4 bytes followed by
         the content
     Returns
     -------
     string_tensor : np.array
-        The 1-D numpy array of type object containing the
-        deserialized bytes in 'C' order.
-   
+        The 1-D numpy array of type str containing the
+        deserialized bytes in 'C' order. Use BytesTensor
+        to access the elements as bytes instead.
+
+    Raises
+    ------
+    InferenceServerException
+        If the encoded tensor is truncated.
     """
-    strs = list()
+    if not isinstance(encoded_tensor, bytes):
+        encoded_tensor = memoryview(encoded_tensor).tobytes()
+    offsets, lengths = _scan_bytes_tensor(encoded_tensor)
+    strs = [
+        encoded_tensor[offset:offset + length]
+        for offset, length in zip(offsets.tolist(), lengths.tolist())
+    ]
+    return (np.array(strs, dtype=str))
+
+
+def _scan_bytes_tensor(encoded_tensor, count=None):
+    """Returns the int64 numpy arrays of the offsets and the lengths of
+    the elements of the encoded bytes tensor. If 'count' is specified
+    only the first 'count' elements are scanned and any data following
+    them is ignored.
+
+    The position of each length prefix depends on all the previous
+    lengths, so in general the prefixes are read one at a time in a
+    Python loop and only the copies of the elements are avoided. When
+    all the elements have the same length, which is checked on a strided
+    view of the prefixes, the offsets are computed with numpy instead.
+    """
+    buffer = np.frombuffer(encoded_tensor, dtype=np.uint8)
+    size = buffer.size
+    if (size == 0 and count is None) or (count == 0):
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    if size < 4:
+        raise_error("encoded bytes tensor is truncated")
+
+    unpack_from = _BYTES_LENGTH_PREFIX.unpack_from
+    length = unpack_from(buffer, 0)[0]
+    stride = 4 + length
+    if count is None:
+        fixed_count = (size // stride) if (size % stride == 0) else 0
+    else:
+        fixed_count = count if (count * stride <= size) else 0
+    if fixed_count > 0:
+        prefixes = np.ndarray((fixed_count,),
+                              dtype='<u4',
+                              buffer=buffer,
+                              strides=(stride,))
+        if (prefixes == length).all():
+            offsets = np.arange(fixed_count, dtype=np.int64) * stride + 4
+            return offsets, np.full(fixed_count, length, dtype=np.int64)
+
+    offsets = []
+    lengths = []
     offset = 0
-    val_buf = encoded_tensor
-    while offset < len(val_buf):
-        l = struct.unpack_from("<I", val_buf, offset)[0]
+    while (offset < size) and ((count is None) or (len(offsets) < count)):
+        if offset + 4 > size:
+            raise_error("encoded bytes tensor is truncated")
+        length = unpack_from(buffer, offset)[0]
         offset += 4
-        sb = struct.unpack_from("<{}s".format(l), val_buf, offset)[0]
-        offset += l
-        strs.append(sb)
-    return (np.array(strs, dtype=str))
+        offsets.append(offset)
+        lengths.append(length)
+        offset += length
+    if (offset > size) or ((count is not None) and (len(offsets) < count)):
+        raise_error("encoded bytes tensor is truncated")
+    return np.array(offsets, dtype=np.int64), np.array(lengths,
+                                                       dtype=np.int64)
+
+
+_BYTES_LENGTH_PREFIX = struct.Struct("<I")
+
+
+class BytesTensor:
+    """An object of BytesTensor class holds the elements of a BYTES
+    tensor as offsets into the encoded tensor they were decoded from,
+    so that no element is copied until it is accessed.
+
+    Parameters
+    ----------
+    encoded_tensor : bytes-like
+        The encoded bytes tensor where each element has its length in
+        first 4 bytes followed by the content. The object is referenced,
+        not copied, and must not be modified while in use.
+    shape : list
+        The shape of the tensor. Default value is None which means a
+        1-D tensor of all the elements.
+
+    Raises
+    ------
+    InferenceServerException
+        If the encoded tensor is truncated or if its number of elements
+        doesn't match the shape.
+
+    """
+
+    def __init__(self, encoded_tensor, shape=None):
+        self._buffer = memoryview(encoded_tensor).cast('B')
+        self._offsets, self._lengths = _scan_bytes_tensor(self._buffer)
+        self._shape = (self.size,)
+        if shape is not None:
+            self._shape = self._get_shape(shape)
+
+    @property
+    def shape(self):
+        """The shape of the tensor as a tuple."""
+        return self._shape
+
+    @property
+    def size(self):
+        """The number of elements of the tensor."""
+        return len(self._offsets)
+
+    @property
+    def offsets(self):
+        """The 1-D int64 numpy array of the offset of each element in
+        the encoded tensor, in 'C' order."""
+        return self._offsets
+
+    @property
+    def lengths(self):
+        """The 1-D int64 numpy array of the length of each element, in
+        'C' order."""
+        return self._lengths
+
+    def __len__(self):
+        return self._shape[0] if self._shape else 1
+
+    def __getitem__(self, index):
+        """Get the element at the index, given as the position in
+        'C' order for 1-D tensors or as a tuple of indices, as bytes.
+        """
+        if not isinstance(index, tuple):
+            index = (index,)
+        flat_index = int(np.ravel_multi_index(index, self._shape))
+        return self.get_view(flat_index).tobytes()
+
+    def __iter__(self):
+        for flat_index in range(self.size):
+            yield self.get_view(flat_index).tobytes()
+
+    def get_view(self, flat_index):
+        """Get the element at the position in 'C' order without copying
+        it.
+
+        Parameters
+        ----------
+        flat_index : int
+            The position of the element in 'C' order.
+
+        Returns
+        -------
+        memoryview
+            The view of the element in the encoded tensor.
+        """
+        offset = self._offsets[flat_index]
+        return self._buffer[offset:offset + self._lengths[flat_index]]
+
+    def reshape(self, shape):
+        """Get a tensor of the same elements with a different shape.
+
+        Parameters
+        ----------
+        shape : list
+            The new shape, which may contain one -1 dimension inferred
+            from the number of elements.
+
+        Returns
+        -------
+        BytesTensor
+            The tensor sharing the encoded tensor of this one.
+
+        Raises
+        ------
+        InferenceServerException
+            If the number of elements doesn't match the shape.
+        """
+        tensor = BytesTensor.__new__(BytesTensor)
+        tensor._buffer = self._buffer
+        tensor._offsets = self._offsets
+        tensor._lengths = self._lengths
+        tensor._shape = self._get_shape(shape)
+        return tensor
+
+    def as_numpy(self):
+        """Get the elements as a numpy array of bytes objects.
+
+        Returns
+        -------
+        numpy array
+            The numpy array of type object with the shape of the tensor.
+        """
+        buffer = self._buffer.tobytes()
+        strs = np.empty(self.size, dtype=np.object)
+        strs[:] = [
+            buffer[offset:offset + length]
+            for offset, length in zip(self._offsets.tolist(),
+                                      self._lengths.tolist())
+        ]
+        return strs.reshape(self._shape)
+
+    def _get_shape(self, shape):
+        shape = [int(dim) for dim in shape]
+        if shape.count(-1) == 1:
+            known_size = int(np.prod([dim for dim in shape if dim != -1]))
+            if (known_size == 0) or (self.size % known_size != 0):
+                raise_error("cannot reshape bytes tensor of " +
+                            str(self.size) + " elements to " + str(shape))
+            shape[shape.index(-1)] = self.size // known_size
+        if int(np.prod(shape)) != self.size:
+            raise_error("cannot reshape bytes tensor of " + str(self.size) +
+                        " elements to " + str(shape))
+        return tuple(shape)
+
+
+class _ModelInfoCache:
+    """Caches the metadata and configuration of models, keyed by the
+    kind of information, model name and model version.
+
+    Parameters
+    ----------
+    ttl : float
+        The time, in seconds, an entry stays valid after being added.
+        None disables the cache.
+    """
+
+    def __init__(self, ttl):
+        self._ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind, model_name, model_version):
+        """Returns the cached value or None if there is no valid entry.
+        """
+        if self._ttl is None:
+            return None
+        key = (kind, model_name, model_version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expiry_time = entry
+            if time.monotonic() >= expiry_time:
+                del self._entries[key]
+                return None
+            return value
+
+    def put(self, kind, model_name, model_version, value):
+        if self._ttl is None:
+            return
+        with self._lock:
+            self._entries[(kind, model_name, model_version)] = (
+                value, time.monotonic() + self._ttl)
+
+    def invalidate(self, model_name=None):
+        """Drops the entries of every version of the specified model or
+        all the entries if 'model_name' is None.
+        """
+        with self._lock:
+            if model_name is None:
+                self._entries.clear()
+            else:
+                for key in [
+                        key for key in self._entries if key[1] == model_name
+                ]:
+                    del self._entries[key]
+
+
+class _Endpoint:
+    """The state MultiEndpointClient keeps for each endpoint.
+    """
+
+    def __init__(self, url, client):
+        self.url = url
+        self.client = client
+        self.ready = True
+        self.outstanding = 0
+        self.request_count = 0
+        self.failure_count = 0
+        self.cumulative_latency_s = 0.0
+        self.average_latency_s = 0.0
+
+    def statistics(self):
+        return {
+            'ready': self.ready,
+            'outstanding': self.outstanding,
+            'request_count': self.request_count,
+            'failure_count': self.failure_count,
+            'cumulative_latency_s': self.cumulative_latency_s,
+            'average_latency_s': self.average_latency_s
+        }
+
+
+class MultiEndpointClient:
+    """Distributes inference requests across several inference servers
+    serving the same models. Each request is sent to one of the ready
+    endpoints selected by the load balancing policy. Endpoints that fail
+    with a connection error or the UNAVAILABLE status are evicted until
+    a probe finds them ready again, other errors are raised without
+    affecting the endpoint.
+
+    Parameters
+    ----------
+    urls : list
+        The inference server URLs, e.g. ['host0:8001', 'host1:8001'].
+    client_class : class
+        The InferenceServerClient class of the protocol to use, e.g.
+        tritongrpcclient.core.InferenceServerClient.
+    policy : str
+        The load balancing policy, either 'least_outstanding' to pick
+        the endpoint with the fewest in-flight requests or
+        'power_of_two' to pick the less loaded of two random endpoints.
+        Default value is 'least_outstanding'.
+    probe_model_name : str
+        Optional name of a model that must be ready on an endpoint for
+        the endpoint to be used. Default value is None which means only
+        the server readiness is probed.
+    probe_model_version : str
+        The version of 'probe_model_name' to probe. Default value is an
+        empty string which means the server will choose a version.
+    probe_interval : float
+        The interval, in seconds, at which endpoints are probed. The
+        probe runs from within infer() and async_infer() once the
+        interval has elapsed. While every endpoint is evicted the probe
+        also runs from within them, at most once per second, and the requests issued in
+        between fail without waiting for it. Default value is None which
+        means endpoints are otherwise only probed by calling probe()
+        explicitly.
+    client_kwargs : dict
+        Additional keyword arguments used when creating the client of
+        each endpoint.
+
+    Raises
+    ------
+    InferenceServerException
+        If the arguments are invalid.
+
+    """
+
+    # The minimum interval, in seconds, between the probes run from
+    # infer() while every endpoint is evicted.
+    _EVICTED_PROBE_INTERVAL = 1.0
+
+    def __init__(self,
+                 urls,
+                 client_class,
+                 policy='least_outstanding',
+                 probe_model_name=None,
+                 probe_model_version="",
+                 probe_interval=None,
+                 **client_kwargs):
+        if not urls:
+            raise_error("at least one endpoint url must be specified")
+        if policy not in ('least_outstanding', 'power_of_two'):
+            raise_error("unsupported load balancing policy '" + policy + "'")
+        self._endpoints = [
+            _Endpoint(url, client_class(url, **client_kwargs)) for url in urls
+        ]
+        self._policy = policy
+        self._probe_model_name = probe_model_name
+        self._probe_model_version = probe_model_version
+        self._probe_interval = probe_interval
+        self._last_probe_time = time.monotonic()
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the clients of all the endpoints.
+
+        """
+        for endpoint in self._endpoints:
+            endpoint.client.close()
+
+    def get_client(self, url):
+        """Get the client of the specified endpoint.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the endpoint.
+
+        Returns
+        -------
+        InferenceServerClient
+            The client communicating with the endpoint or None if there
+            is no endpoint with the specified URL.
+        """
+        for endpoint in self._endpoints:
+            if endpoint.url == url:
+                return endpoint.client
+        return None
+
+    def probe(self):
+        """Probe the readiness of every endpoint, evicting the endpoints
+        that are not ready and re-admitting the ones that are.
+
+        Returns
+        -------
+        list
+            The URLs of the ready endpoints.
+        """
+        with self._lock:
+            self._last_probe_time = time.monotonic()
+        for endpoint in self._endpoints:
+            try:
+                ready = endpoint.client.is_server_ready()
+                if ready and (self._probe_model_name is not None):
+                    ready = endpoint.client.is_model_ready(
+                        self._probe_model_name, self._probe_model_version)
+            except Exception:
+                ready = False
+            with self._lock:
+                endpoint.ready = ready
+        return [
+            endpoint.url for endpoint in self._endpoints if endpoint.ready
+        ]
+
+    def get_endpoint_statistics(self):
+        """Get the request and latency counters of every endpoint.
+
+        Returns
+        -------
+        dict
+            A dict mapping the URL of each endpoint to a dict holding
+            'ready', 'outstanding', 'request_count', 'failure_count',
+            'cumulative_latency_s' and 'average_latency_s'.
+        """
+        with self._lock:
+            return {
+                endpoint.url: endpoint.statistics()
+                for endpoint in self._endpoints
+            }
+
+    def infer(self, *args, **kwargs):
+        """Run synchronous inference on one of the ready endpoints. The
+        arguments are passed as they are to the infer() of the client
+        of the selected endpoint.
+
+        Returns
+        -------
+        InferResult
+            The object holding the result of the inference.
+
+        Raises
+        ------
+        InferenceServerException
+            If no endpoint is ready or if server fails to perform
+            inference.
+        """
+        self._probe_if_due()
+        endpoint = self._acquire_endpoint()
+        start_time = time.monotonic()
+        failed = True
+        try:
+            result = endpoint.client.infer(*args, **kwargs)
+            failed = False
+            return result
+        except Exception as error:
+            # Only failures to reach the endpoint say anything about its
+            # health, errors returned by the server are just passed on.
+            if _is_unavailable(error):
+                self._evict(endpoint)
+            raise
+        finally:
+            self._release_endpoint(endpoint, time.monotonic() - start_time,
+                                   failed)
+
+    def async_infer(self, model_name, inputs, callback, *args, **kwargs):
+        """Run asynchronous inference on one of the ready endpoints. The
+        arguments are passed as they are to the async_infer() of the
+        client of the selected endpoint, the callback being wrapped to
+        account the completion of the request on the endpoint.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model to run inference.
+        inputs : list
+            A list of InferInput objects, each describing data for a input
+            tensor required by the model.
+        callback : function
+            Python function that is invoked once the request is completed
+            with the 'result' and 'error' keyword arguments, see the
+            async_infer() of the client. None is only accepted by the
+            clients that return a handle to the request.
+
+        Returns
+        -------
+        object
+            The value returned by the async_infer() of the client.
+
+        Raises
+        ------
+        InferenceServerException
+            If no endpoint is ready or if server fails to issue inference.
+        """
+        self._probe_if_due()
+        endpoint = self._acquire_endpoint()
+        start_time = time.monotonic()
+
+        def wrapped_callback(result, error):
+            if (error is not None) and _is_unavailable(error):
+                self._evict(endpoint)
+            self._release_endpoint(endpoint, time.monotonic() - start_time,
+                                   error is not None)
+            if callback is not None:
+                callback(result=result, error=error)
+
+        try:
+            return endpoint.client.async_infer(model_name, inputs,
+                                               wrapped_callback, *args,
+                                               **kwargs)
+        except Exception as error:
+            if _is_unavailable(error):
+                self._evict(endpoint)
+            self._release_endpoint(endpoint, time.monotonic() - start_time,
+                                   True)
+            raise
+
+    def _probe_if_due(self):
+        """Runs the probe from the calling thread if it is due and no
+        other thread is running it.
+        """
+        if self._claim_probe():
+            try:
+                self.probe()
+            finally:
+                with self._lock:
+                    self._probing = False
+
+    def _claim_probe(self):
+        """Returns True if a probe is due and the caller must run it, in
+        which case other callers don't run it meanwhile.
+        """
+        with self._lock:
+            if self._probing:
+                return False
+            interval = self._probe_interval
+            if not any(endpoint.ready for endpoint in self._endpoints):
+                # Nothing else would re-admit the evicted endpoints.
+                if (interval is None) or (interval >
+                                          self._EVICTED_PROBE_INTERVAL):
+                    interval = self._EVICTED_PROBE_INTERVAL
+            if (interval is None) or (time.monotonic() - self._last_probe_time
+                                      < interval):
+                return False
+            self._probing = True
+            return True
+
+    def _acquire_endpoint(self):
+        """Selects the endpoint for the next request according to the
+        policy and accounts the request as outstanding on it.
+        """
+        with self._lock:
+            ready = [
+                endpoint for endpoint in self._endpoints if endpoint.ready
+            ]
+            if not ready:
+                raise_error("no ready endpoint available")
+            if (self._policy == 'power_of_two') and (len(ready) > 2):
+                ready = random.sample(ready, 2)
+            endpoint = min(
+                ready, key=lambda e: (e.outstanding, e.average_latency_s))
+            endpoint.outstanding += 1
+            return endpoint
+
+    def _release_endpoint(self, endpoint, latency_s, failed):
+        with self._lock:
+            endpoint.outstanding -= 1
+            endpoint.request_count += 1
+            if failed:
+                endpoint.failure_count += 1
+            endpoint.cumulative_latency_s += latency_s
+            endpoint.average_latency_s = (endpoint.cumulative_latency_s /
+                                          endpoint.request_count)
+
+    def _evict(self, endpoint):
+        with self._lock:
+            endpoint.ready = False
+
+
+def _is_unavailable(error):
+    """Returns whether the error indicates that the server could not be
+    reached, either an InferenceServerException with the UNAVAILABLE
+    status or a socket error raised while connecting to the server or
+    exchanging data with it.
+    """
+    if isinstance(error, InferenceServerException):
+        return error.status() == 'StatusCode.UNAVAILABLE'
+    return isinstance(error, OSError)
+
+
+def _is_retryable(error):
+    """Returns whether the request that failed with the error can be
+    sent again, which is the case when it never reached the server or
+    the connection was reset.
+    """
+    if isinstance(error, InferenceServerException):
+        return _is_unavailable(error)
+    return isinstance(error, ConnectionError)
+
+
+def _is_deadline_exceeded(error):
+    return (isinstance(error, InferenceServerException) and
+            (error.status() == 'StatusCode.DEADLINE_EXCEEDED'))
+
+
+def _get_deadline_exceeded_error():
+    return InferenceServerException(msg="Deadline Exceeded",
+                                    status='StatusCode.DEADLINE_EXCEEDED')
+
+
+class RetryPolicy:
+    """An object of RetryPolicy class describes how an inference request
+    that failed because the server could not be reached, or because the
+    connection was reset, is retried. Other errors are never retried as
+    the request may have been executed by the server.
+
+    Parameters
+    ----------
+    max_attempts : int
+        The maximum number of times the request is sent, including the
+        first attempt. Default value is 3.
+    initial_backoff : float
+        The upper bound, in seconds, of the delay before the first
+        retry. The actual delay is drawn uniformly from zero to the
+        bound so that clients failing together do not retry together.
+        Default value is 0.05.
+    max_backoff : float
+        The maximum upper bound, in seconds, of the delay before a
+        retry. Default value is 1.0.
+    backoff_multiplier : float
+        The factor applied to the upper bound of the delay after each
+        retry. Default value is 2.0.
+
+    Raises
+    ------
+    InferenceServerException
+        If the arguments are invalid.
+
+    """
+
+    def __init__(self,
+                 max_attempts=3,
+                 initial_backoff=0.05,
+                 max_backoff=1.0,
+                 backoff_multiplier=2.0):
+        if max_attempts < 1:
+            raise_error("max_attempts must be at least 1")
+        if (initial_backoff < 0) or (max_backoff < 0):
+            raise_error("backoff must not be negative")
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.backoff_multiplier = backoff_multiplier
+
+    def get_backoff(self, retry_count):
+        """Get the delay before the retry.
+
+        Parameters
+        ----------
+        retry_count : int
+            The number of retries already made for the request.
+
+        Returns
+        -------
+        float
+            The delay, in seconds.
+        """
+        bound = min(self.max_backoff, self.initial_backoff *
+                    (self.backoff_multiplier**retry_count))
+        return random.uniform(0, bound)
+
+
+class _RetryStatistics:
+    """The counters of the retries, hedges and deadlines of the
+    inference requests of a client.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {
+            'retry_count': 0,
+            'hedges_fired': 0,
+            'hedges_won': 0,
+            'deadline_exceeded_count': 0
+        }
+
+    def increment(self, key):
+        with self._lock:
+            self._counts[key] += 1
+
+    def get(self):
+        with self._lock:
+            return dict(self._counts)
+
+
+def _call_with_retries(attempt,
+                       retry_policy,
+                       client_timeout,
+                       statistics,
+                       sleep=time.sleep):
+    """Calls 'attempt' with the time, in seconds, left before the
+    deadline, or None if there is no deadline, retrying according to
+    'retry_policy' while the deadline allows it.
+    """
+    deadline = None
+    if client_timeout is not None:
+        deadline = time.monotonic() + client_timeout
+    retry_count = 0
+    while True:
+        try:
+            timeout = None
+            if deadline is not None:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    raise _get_deadline_exceeded_error()
+            return attempt(timeout)
+        except Exception as error:
+            if _is_deadline_exceeded(error):
+                statistics.increment('deadline_exceeded_count')
+            if ((retry_policy is None) or
+                (retry_count + 1 >= retry_policy.max_attempts) or
+                    not _is_retryable(error)):
+                raise
+            backoff = retry_policy.get_backoff(retry_count)
+            if (deadline is not None) and (time.monotonic() + backoff >=
+                                           deadline):
+                raise
+        retry_count += 1
+        statistics.increment('retry_count')
+        sleep(backoff)
@@ -34,6 +34,7 @@ constexpr char kInferResponseHTTPHeader[] = "NV-InferResponse";
 constexpr char kStatusHTTPHeader[] = "NV-Status";
 constexpr char kInferHeaderContentLengthHTTPHeader[] =
     "Inference-Header-Content-Length";
+constexpr char kContentEncodingHTTPHeader[] = "Content-Encoding";
 
 constexpr char kInferRESTEndpoint[] = "api/infer";
 constexpr char kStatusRESTEndpoint[] = "api/status";
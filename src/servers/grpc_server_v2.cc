@@ -2800,7 +2800,10 @@ ModelStreamInferHandler::Process(Handler::State* state, bool rpc_ok)
       TRTSERVER_ErrorDelete(err);
       response.set_error_message(status.error_message());
 
+      // Keep the request id so that the client can match the error to
+      // the request it belongs to.
       response.mutable_infer_response()->Clear();
+      response.mutable_infer_response()->set_id(state->request_.id());
 
       state->step_ = Steps::WRITEREADY;
       state->context_->WriteResponseIfReady(state);
@@ -2978,6 +2981,7 @@ ModelStreamInferHandler::StreamInferComplete(
 
   if (err != nullptr) {
     response.mutable_infer_response()->Clear();
+    response.mutable_infer_response()->set_id(state->request_.id());
   }
 
   grpc::Status status;
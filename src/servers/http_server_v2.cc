@@ -30,6 +30,7 @@
 #include <evhtp/evhtp.h>
 #include <google/protobuf/text_format.h>
 #include <re2/re2.h>
+#include <zlib.h>
 #include <algorithm>
 #include <thread>
 #include "src/core/api.pb.h"
@@ -778,6 +779,104 @@ EVBufferAddErrorJson(evbuffer* buffer, TRTSERVER_Error* err)
   evbuffer_add(buffer, message_json.c_str(), message_json.size());
 }
 
+TRTSERVER_Error*
+DecompressEVBuffer(evbuffer* buffer, const std::string& encoding)
+{
+  // 'windowBits' selects the gzip (RFC 1952) or zlib (RFC 1950) wrapper
+  // expected by inflate for the 'gzip' and 'deflate' content codings.
+  int window_bits;
+  if (encoding == "gzip") {
+    window_bits = 16 + MAX_WBITS;
+  } else if (encoding == "deflate") {
+    window_bits = MAX_WBITS;
+  } else {
+    return TRTSERVER_ErrorNew(
+        TRTSERVER_ERROR_UNSUPPORTED,
+        std::string("unsupported Content-Encoding '" + encoding + "'")
+            .c_str());
+  }
+
+  z_stream stream;
+  stream.zalloc = Z_NULL;
+  stream.zfree = Z_NULL;
+  stream.opaque = Z_NULL;
+  stream.next_in = Z_NULL;
+  stream.avail_in = 0;
+  if (inflateInit2(&stream, window_bits) != Z_OK) {
+    return TRTSERVER_ErrorNew(
+        TRTSERVER_ERROR_INTERNAL, "failed to initialize decompression");
+  }
+
+  evbuffer* decompressed_buffer = evbuffer_new();
+  if (decompressed_buffer == nullptr) {
+    inflateEnd(&stream);
+    return TRTSERVER_ErrorNew(
+        TRTSERVER_ERROR_INTERNAL,
+        "failed to create evbuffer for decompressed request");
+  }
+
+  // Inflate the compressed data chunk by chunk, straight from the
+  // request evbuffer into space reserved in the decompressed evbuffer.
+  int n = evbuffer_peek(buffer, -1, NULL, NULL, 0);
+  std::vector<struct evbuffer_iovec> v(std::max(n, 0));
+  if ((n > 0) && (evbuffer_peek(buffer, -1, NULL, &v[0], n) != n)) {
+    inflateEnd(&stream);
+    evbuffer_free(decompressed_buffer);
+    return TRTSERVER_ErrorNew(
+        TRTSERVER_ERROR_INTERNAL, "unexpected error getting request buffers");
+  }
+
+  const size_t chunk_size = 64 * 1024;
+  int ret = Z_OK;
+  for (int i = 0; (i < n) && (ret != Z_STREAM_END); ++i) {
+    stream.next_in = reinterpret_cast<Bytef*>(v[i].iov_base);
+    stream.avail_in = v[i].iov_len;
+    // Keep inflating while input is left or the last call filled the
+    // output space, in which case inflate may hold pending output.
+    do {
+      struct evbuffer_iovec output_iovec;
+      if (evbuffer_reserve_space(
+              decompressed_buffer, chunk_size, &output_iovec, 1) != 1) {
+        ret = Z_MEM_ERROR;
+        break;
+      }
+      stream.next_out = reinterpret_cast<Bytef*>(output_iovec.iov_base);
+      stream.avail_out = output_iovec.iov_len;
+      ret = inflate(&stream, Z_NO_FLUSH);
+      output_iovec.iov_len -= stream.avail_out;
+      evbuffer_commit_space(decompressed_buffer, &output_iovec, 1);
+    } while ((ret == Z_OK) &&
+             ((stream.avail_in > 0) || (stream.avail_out == 0)));
+
+    // Z_BUF_ERROR only means that no progress was possible without more
+    // input.
+    if (ret == Z_BUF_ERROR) {
+      ret = Z_OK;
+    } else if ((ret != Z_OK) && (ret != Z_STREAM_END)) {
+      break;
+    }
+  }
+  inflateEnd(&stream);
+
+  if (ret != Z_STREAM_END) {
+    evbuffer_free(decompressed_buffer);
+    return TRTSERVER_ErrorNew(
+        TRTSERVER_ERROR_INVALID_ARG,
+        std::string(
+            "failed to decompress request body with Content-Encoding '" +
+            encoding + "'")
+            .c_str());
+  }
+
+  // Replace the compressed data with the decompressed data, moving the
+  // chains of the evbuffer instead of copying them.
+  evbuffer_drain(buffer, evbuffer_get_length(buffer));
+  evbuffer_add_buffer(buffer, decompressed_buffer);
+  evbuffer_free(decompressed_buffer);
+
+  return nullptr;  // Success
+}
+
 void
 HTTPAPIServerV2::Handle(evhtp_request_t* req)
 {
@@ -1868,9 +1967,20 @@ HTTPAPIServerV2::HandleInfer(
       header_length = std::atoi(header_length_c_str);
     }
 
-    err = EVBufferToInput(
-        model_name, irequest, req->buffer_in, infer_request.get(),
-        header_length);
+    // Decompress the request body if it was sent compressed. The
+    // Inference-Header-Content-Length refers to the decompressed body.
+    const char* encoding_c_str =
+        evhtp_kv_find(req->headers_in, kContentEncodingHTTPHeader);
+    if ((encoding_c_str != NULL) &&
+        (std::string(encoding_c_str) != "identity")) {
+      err = DecompressEVBuffer(req->buffer_in, encoding_c_str);
+    }
+
+    if (err == nullptr) {
+      err = EVBufferToInput(
+          model_name, irequest, req->buffer_in, infer_request.get(),
+          header_length);
+    }
     if (err == nullptr) {
       // Provide the trace manager object to use for this request, if nullptr
       // then no tracing will be performed.
@@ -2020,6 +2130,9 @@ HTTPAPIServerV2::InferRequestClass::FinalizeResponse(
       response_meta_data_.request_json_["outputs"];
   rapidjson::Value response_outputs(rapidjson::kArrayType);
   rapidjson::Value output_metadata[request_outputs.Size()];
+  // Binary output data is written after the JSON header so keep track
+  // of it while the header is being built.
+  std::vector<std::pair<const void*, size_t>> binary_outputs;
   for (size_t i = 0; i < request_outputs.Size(); i++) {
     output_metadata[i].SetObject();
     rapidjson::Value& request_output = request_outputs[i];
@@ -2065,8 +2178,8 @@ HTTPAPIServerV2::InferRequestClass::FinalizeResponse(
     uint64_t class_size = 0;
     if (!CheckClassificationOutput(request_output, &class_size)) {
       if (CheckBinaryOutputData(request_output)) {
-        // Write outputs into binary buffer
-        evbuffer_add(req_->buffer_out, base, byte_size);
+        // Write outputs into binary buffer once the header is written
+        binary_outputs.emplace_back(base, byte_size);
         rapidjson::Value binary_size_val(byte_size);
         auto itr = output_metadata[i].FindMember("parameters");
         if (itr != output_metadata[i].MemberEnd()) {
@@ -2147,10 +2260,21 @@ HTTPAPIServerV2::InferRequestClass::FinalizeResponse(
   rapidjson::Writer<rapidjson::StringBuffer> writer(buffer);
   response_meta_data_.response_json_.Accept(writer);
   const char* response_metadata = buffer.GetString();
-  evbuffer_add(req_->buffer_out, response_metadata, strlen(response_metadata));
+  const size_t response_metadata_size = strlen(response_metadata);
+  evbuffer_add(req_->buffer_out, response_metadata, response_metadata_size);
+  for (const auto& binary_output : binary_outputs) {
+    evbuffer_add(req_->buffer_out, binary_output.first, binary_output.second);
+  }
   evhtp_headers_add_header(
       req_->headers_out,
       evhtp_header_new("Content-Type", "application/json", 1, 1));
+  if (!binary_outputs.empty()) {
+    evhtp_headers_add_header(
+        req_->headers_out,
+        evhtp_header_new(
+            kInferHeaderContentLengthHTTPHeader,
+            std::to_string(response_metadata_size).c_str(), 1, 1));
+  }
 
   return (err == nullptr) ? EVHTP_RES_OK : EVHTP_RES_BADREQ;
 }